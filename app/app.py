@@ -1,15 +1,75 @@
+import time
 from flask import Flask, Response, request
-from services.lang_service import lang_service
+from app.responses import prepare_card_response
+from metrics.metrics import registry, request_seconds
+from metrics.profiler import request_profiler
+from utils.deadline import request_deadline
 
 app = Flask(__name__)
 
+# The services, and through them the GitHub client and the chart generator, are imported by the views on first use,
+# so a cold serverless instance only pays for Flask and the request plumbing before it can answer.
+
+
 @app.route('/langs/<username>/<chart>', methods=['GET'])
 def langs(username: str, chart: str) -> Response:
+    if ',' in username:
+        from services.team_lang_service import team_lang_service, users_team_key
+        return card_response('langs', username, chart, lambda: team_lang_service(users_team_key(username), username, chart, request.args))
+
+    from services.lang_service import lang_service
+    return card_response('langs', username, chart, lambda: lang_service(username, chart, request.args))
+
+
+@app.route('/langs/org/<org>/<chart>', methods=['GET'])
+def org_langs(org: str, chart: str) -> Response:
+    from services.team_lang_service import org_team_key, team_lang_service
+    return card_response('org_langs', org, chart, lambda: team_lang_service(org_team_key(org), org, chart, request.args))
+
+
+@app.route('/profile/<username>', methods=['GET'])
+def profile(username: str) -> Response:
+    from services.profile_service import profile_service
+    return card_response('profile', username, 'profile', lambda: profile_service(username, request.args))
+
+
+def card_response(route: str, title: str, chart: str, render) -> Response:
+    started = time.perf_counter()
+    try:
+        try:
+            with request_profiler.profile(request.full_path.rstrip('?')), request_deadline():
+                svg_entry = render()
+        except Exception as e:
+            from services.degraded_service import degraded_card
+            svg_entry = degraded_card(title, chart, request.args, e)
+
+        status, headers, body = prepare_card_response(
+            route, chart, svg_entry, request.headers.get('Accept-Encoding'), request.headers.get('If-None-Match')
+        )
+        return Response(body, status=status, headers=headers)
+    finally:
+        request_seconds.observe(time.perf_counter() - started, route=route)
+
+
+@app.route('/webhooks/github', methods=['POST'])
+def github_webhook():
+    from services.webhook_service import WebhookError, webhook_constants, webhook_service
+
+    started = time.perf_counter()
     try:
-        svg_image = lang_service(username, chart, request.args)
-        return Response(svg_image, mimetype='image/svg+xml')
-    except Exception as e:
-        return f"Error: Something went wrong - {e}", 500
+        body = request.stream.read(webhook_constants['max_body_bytes'] + 1)
+        return webhook_service(
+            request.headers.get('X-GitHub-Event', ''), body, request.headers.get('X-Hub-Signature-256', '')
+        )
+    except WebhookError as e:
+        return {'error': str(e)}, e.status
+    finally:
+        request_seconds.observe(time.perf_counter() - started, route='webhook')
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics() -> Response:
+    return Response(registry.render(), mimetype='text/plain; version=0.0.4')
 
 
 @app.route('/', methods=['GET'])
@@ -17,6 +77,11 @@ def index() -> dict:
     return {
         'message': 'Give a star to the project if you liked it! In the future this will be a landing page with some information about the project and how to use it.',
         'endpoints': {
-            'get_language_stats_chart': '/langs/<username>/<chart>'
+            'get_language_stats_chart': '/langs/<username>/<chart>',
+            'get_team_language_stats_chart': '/langs/<username>,<username>/<chart>',
+            'get_org_language_stats_chart': '/langs/org/<org>/<chart>',
+            'get_profile_card': '/profile/<username>',
+            'post_github_webhook': '/webhooks/github',
+            'get_metrics': '/metrics'
         }
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import re
+import time
+from app.responses import prepare_card_response
+from github_api.async_github_client import async_github_client
+from metrics.metrics import registry, request_seconds
+from services.async_lang_service import async_lang_service
+from services.degraded_service import degraded_card
+from services.profile_service import profile_service
+from services.team_lang_service import org_team_key, team_lang_service, users_team_key
+from services.webhook_service import WebhookError, webhook_constants, webhook_service
+from utils.deadline import request_deadline
+from utils.query_params import parse_query_string
+
+LANGS_ROUTE = re.compile(r'^/langs/(?P<username>[^/]+)/(?P<chart>[^/]+)$')
+ORG_LANGS_ROUTE = re.compile(r'^/langs/org/(?P<org>[^/]+)/(?P<chart>[^/]+)$')
+PROFILE_ROUTE = re.compile(r'^/profile/(?P<username>[^/]+)$')
+
+
+async def asgi_app(scope: dict, receive, send) -> None:
+    """
+    ASGI application serving the /langs/<username>/<chart>, /langs/org/<org>/<chart> and /profile/<username>
+    endpoints without blocking on GitHub, and the /webhooks/github endpoint.
+
+    Run it with any ASGI server, e.g. `uvicorn app.asgi_app:asgi_app`.
+    """
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+
+    if scope['type'] != 'http':
+        return
+
+    if scope['path'] == '/webhooks/github' and scope['method'] == 'POST':
+        await github_webhook(scope, receive, send)
+        return
+
+    if scope['path'] == '/metrics' and scope['method'] == 'GET':
+        await send_response(send, 200, registry.render().encode('utf-8'), [(b'content-type', b'text/plain; version=0.0.4')])
+        return
+
+    profile_match = PROFILE_ROUTE.match(scope['path'])
+    org_match = ORG_LANGS_ROUTE.match(scope['path'])
+    match = LANGS_ROUTE.match(scope['path'])
+
+    if (profile_match is None and org_match is None and match is None) or scope['method'] != 'GET':
+        await send_response(send, 404, b'Not Found', [(b'content-type', b'text/plain; charset=utf-8')])
+        return
+
+    if profile_match is not None:
+        username = profile_match.group('username')
+        # The profile fetches fan out over a bounded thread pool, so they run off the event loop.
+        await langs(scope, send, 'profile', username, 'profile', lambda chart, query_params: asyncio.to_thread(
+            profile_service, username, query_params
+        ))
+    elif org_match is not None:
+        org = org_match.group('org')
+        # Team loads fan out over a bounded thread pool, so they run off the event loop.
+        await langs(scope, send, 'org_langs', org, org_match.group('chart'), lambda chart, query_params: asyncio.to_thread(
+            team_lang_service, org_team_key(org), org, chart, query_params
+        ))
+    elif ',' in match.group('username'):
+        username = match.group('username')
+        await langs(scope, send, 'langs', username, match.group('chart'), lambda chart, query_params: asyncio.to_thread(
+            team_lang_service, users_team_key(username), username, chart, query_params
+        ))
+    else:
+        username = match.group('username')
+        await langs(scope, send, 'langs', username, match.group('chart'), lambda chart, query_params: async_lang_service(
+            username, chart, query_params
+        ))
+
+
+async def langs(scope: dict, send, route: str, title: str, chart: str, render) -> None:
+    started = time.perf_counter()
+    try:
+        query_params = parse_query_string(scope['query_string'].decode('latin-1'))
+
+        try:
+            # The deadline is carried into the threads started by asyncio.to_thread.
+            with request_deadline():
+                svg_entry = await render(chart, query_params)
+        except Exception as e:
+            # Degraded cards are rendered and compressed like complete ones, so they are built off the event loop.
+            svg_entry = await asyncio.to_thread(degraded_card, title, chart, query_params, e)
+
+        request_headers = dict(scope['headers'])
+        status, headers, body = prepare_card_response(
+            route, chart, svg_entry,
+            request_headers.get(b'accept-encoding', b'').decode('latin-1'),
+            request_headers.get(b'if-none-match', b'').decode('latin-1')
+        )
+
+        await send_response(send, status, body, [
+            (name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers
+        ])
+    finally:
+        request_seconds.observe(time.perf_counter() - started, route=route)
+
+
+async def github_webhook(scope: dict, receive, send) -> None:
+    started = time.perf_counter()
+    try:
+        body = await read_body(receive, webhook_constants['max_body_bytes'] + 1)
+        request_headers = dict(scope['headers'])
+        # The update may write through to the shared cache tier, so it runs off the event loop.
+        status, summary = 200, await asyncio.to_thread(
+            webhook_service,
+            request_headers.get(b'x-github-event', b'').decode('latin-1'),
+            body,
+            request_headers.get(b'x-hub-signature-256', b'').decode('latin-1')
+        )
+    except WebhookError as e:
+        status, summary = e.status, {'error': str(e)}
+    finally:
+        request_seconds.observe(time.perf_counter() - started, route='webhook')
+
+    await send_response(send, status, json.dumps(summary).encode('utf-8'), [(b'content-type', b'application/json')])
+
+
+async def read_body(receive, limit: int) -> bytes:
+    """
+    Reads a request body, stopping once it exceeds the limit.
+    """
+    parts = []
+    size = 0
+
+    while size < limit:
+        message = await receive()
+        parts.append(message.get('body', b''))
+        size += len(parts[-1])
+
+        if not message.get('more_body', False):
+            break
+
+    return b''.join(parts)[:limit]
+
+
+async def send_response(send, status: int, body: bytes, headers: list) -> None:
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': headers + [(b'content-length', str(len(body)).encode('latin-1'))],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+
+        if message['type'] == 'lifespan.startup':
+            # Importing httpx and building the client's SSL context would otherwise block the loop on the first request.
+            await asyncio.to_thread(async_github_client.get_client)
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await async_github_client.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
@@ -0,0 +1,50 @@
+from cache.svg_cache import SvgEntry, svg_cache_constants
+from metrics.metrics import degraded_responses, svg_bytes
+
+
+def card_cache_control(svg_entry: SvgEntry) -> str:
+    """
+    Returns the Cache-Control header of a card. Degraded cards must not be kept by GitHub's image proxy, the complete
+    card follows shortly.
+    """
+    if svg_entry.degraded is not None:
+        return 'no-cache, max-age=0'
+
+    return f"public, max-age={svg_cache_constants['ttl']}"
+
+
+def prepare_card_response(route: str, chart: str, svg_entry: SvgEntry, accept_encoding: str, if_none_match: str) -> tuple:
+    """
+    Builds the response of a card, shared by the Flask and ASGI apps so both answer with the same headers.
+
+    Args:
+        route (str): The route label of the request metrics.
+        chart (str): The chart type, used as a metric label.
+        svg_entry (SvgEntry): The rendered card.
+        accept_encoding (str): The Accept-Encoding header of the request, or None.
+        if_none_match (str): The If-None-Match header of the request, or None.
+
+    Returns:
+        tuple: The status code, the headers as (name, value) pairs and the body. The status is 304 with an empty body
+               when If-None-Match matches the ETag of the negotiated variant.
+    """
+    body, encoding, etag = svg_entry.negotiate(accept_encoding)
+    svg_bytes.observe(len(body), chart=chart, encoding=encoding or 'identity')
+
+    if svg_entry.degraded is not None:
+        degraded_responses.inc(route=route, reason=svg_entry.degraded)
+
+    headers = [
+        ('ETag', etag),
+        ('Cache-Control', card_cache_control(svg_entry)),
+        ('Vary', 'Accept-Encoding'),
+    ]
+
+    if_none_match = if_none_match or ''
+    if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+        return 304, headers, b''
+
+    if encoding is not None:
+        headers.append(('Content-Encoding', encoding))
+
+    return 200, [('Content-Type', 'image/svg+xml; charset=utf-8')] + headers, body
@@ -0,0 +1,322 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from werkzeug.datastructures import MultiDict
+from benchmarks.stub_server import start_stub_server
+from benchmarks.synthetic import generate_repos, synthetic_constants
+from cache.response_cache import create_response_cache
+from cache.svg_cache import svg_cache
+from chart_generator import geometry
+from factory.chart_factory import chart_factory
+from github_api.github_api import github_constants
+from github_api.github_client import github_client
+from stats_calculator.langs_aggregate import LanguageAggregate
+from stats_calculator.langs_stats_calculator import calculate_language_stats, get_top_n_langs
+from utils.utils import extract_chart_kwargs
+
+bench_constants = {
+    'results_dir': os.path.join(os.path.dirname(__file__), 'results'),
+    'iterations': 200,
+    'route_iterations': 20,
+    'warmup': 3,
+    'render_size': 1000,
+    'charts': ('bar', 'pie', 'donut'),
+    'org_members': 20,
+    'import_entrypoints': ('main', 'app.asgi_app'),
+    'import_runs': 5,
+    'regression_threshold': 0.10,
+}
+
+
+def measure(fn, iterations: int, warmup: int = bench_constants['warmup'], setup=None) -> dict:
+    """
+    Measures the latency, throughput, allocations and output size of a callable.
+
+    Args:
+        fn (callable): The code under test, its return value is used for the output size.
+        iterations (int): The number of timed calls.
+        warmup (int): The number of untimed calls made first.
+        setup (callable): Optional untimed callable run before every call, e.g. to clear caches.
+
+    Returns:
+        dict: Latency percentiles in milliseconds, operations per second, peak allocated bytes of one call and output bytes.
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+
+    timings = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    output = fn()
+    _, peak_alloc = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    total = sum(timings)
+
+    return {
+        'iterations': iterations,
+        'mean_ms': total / iterations * 1000,
+        'p50_ms': timings[int(0.50 * (iterations - 1))] * 1000,
+        'p95_ms': timings[int(0.95 * (iterations - 1))] * 1000,
+        'p99_ms': timings[int(0.99 * (iterations - 1))] * 1000,
+        'ops_per_sec': iterations / total if total > 0 else 0,
+        'peak_alloc_bytes': peak_alloc,
+        'output_bytes': len(output) if isinstance(output, (str, bytes)) else None,
+    }
+
+
+def run_stats_benchmarks(sizes: list, skews: list, iterations: int) -> dict:
+    results = {}
+
+    for size in sizes:
+        for skew in skews:
+            repos = generate_repos(size, skew)
+            lang_stats = calculate_language_stats(repos)
+            scaled = max(3, iterations * 100 // max(size, 100))
+
+            results[f'calculate_language_stats[{size}-{skew}]'] = measure(lambda: calculate_language_stats(repos), scaled)
+            results[f'language_aggregate[{size}-{skew}]'] = measure(
+                lambda: LanguageAggregate.from_repos(repos).to_lang_stats(), scaled
+            )
+            results[f'get_top_n_langs[{size}-{skew}]'] = measure(lambda: get_top_n_langs(lang_stats, 7), iterations)
+
+    return results
+
+
+def run_render_benchmarks(skews: list, iterations: int) -> dict:
+    results = {}
+    query_params = MultiDict({'hole_radius_percentage': '55', 'border_color': '00ff00'})
+
+    for chart_type in bench_constants['charts']:
+        results[f'extract_chart_kwargs[{chart_type}]'] = measure(lambda: extract_chart_kwargs(query_params, chart_type), iterations)
+
+    fixtures = [(skew, calculate_language_stats(generate_repos(bench_constants['render_size'], skew))) for skew in skews]
+    # A single language spans the whole circle, which donut and pie charts draw as a full ring.
+    fixtures.append(('one-language', {'Python': {'count': bench_constants['render_size'], 'percentage': 100.0}}))
+
+    for fixture, lang_stats in fixtures:
+        for chart_type in bench_constants['charts']:
+            chart_kwargs = extract_chart_kwargs(query_params, chart_type)
+            results[f'chart_factory:{chart_type}[{fixture}]'] = measure(
+                lambda: chart_factory('bench', lang_stats, chart_type, chart_kwargs), iterations
+            )
+
+    return results
+
+
+def reset_service_caches() -> None:
+    from services.lang_service import user_langs_cache
+    from services.profile_service import user_profile_cache
+    from services.team_lang_service import team_langs_cache
+
+    svg_cache.clear()
+    user_langs_cache.clear()
+    team_langs_cache.clear()
+    user_profile_cache.clear()
+    github_client.response_cache = create_response_cache('memory')
+
+
+def request_card_url(client, url: str) -> bytes:
+    response = client.get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f'{url} answered {response.status_code}: {response.data[:200]}')
+    return response.data
+
+
+def run_route_benchmarks(sizes: list, skews: list, iterations: int) -> dict:
+    """
+    Measures the Flask /langs route end to end against the local stub GitHub server, cold (all caches cleared)
+    and warm (served from the caches), and the cold organization and profile cards.
+    """
+    from app.app import app
+
+    server = start_stub_server()
+    github_constants['base_url'] = f'http://127.0.0.1:{server.server_port}'
+    client = app.test_client()
+    results = {}
+
+    try:
+        for size in sizes:
+            for skew in skews:
+                for chart_type in bench_constants['charts']:
+                    url = f'/langs/bench-{size}-{skew}/{chart_type}'
+
+                    def request_card():
+                        return request_card_url(client, url)
+
+                    cold_iterations = max(3, iterations * 100 // max(size, 100))
+                    results[f'route_cold:{chart_type}[{size}-{skew}]'] = measure(
+                        request_card, cold_iterations, warmup=1, setup=reset_service_caches
+                    )
+                    results[f'route_warm:{chart_type}[{size}-{skew}]'] = measure(request_card, iterations)
+
+                org_url = f"/langs/org/bench-org-{bench_constants['org_members']}-{size}-{skew}/donut"
+                results[f'route_org_cold:donut[{size}-{skew}]'] = measure(
+                    lambda: request_card_url(client, org_url), max(3, iterations * 10 // max(size, 10)),
+                    warmup=1, setup=reset_service_caches
+                )
+
+                profile_url = f'/profile/bench-{size}-{skew}'
+                results[f'route_profile_cold[{size}-{skew}]'] = measure(
+                    lambda: request_card_url(client, profile_url), max(3, iterations * 100 // max(size, 100)),
+                    warmup=1, setup=reset_service_caches
+                )
+    finally:
+        server.shutdown()
+
+    return results
+
+
+def measure_import(module: str, runs: int) -> dict:
+    """
+    Measures the cold import of a module in fresh interpreters with `python -X importtime`.
+
+    Args:
+        module (str): The module to import.
+        runs (int): The number of fresh interpreters.
+
+    Returns:
+        dict: The latency summary of the import, with the slowest modules by cumulative import time.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    modules = {}
+
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=root, capture_output=True, text=True, check=True,
+        )
+        for line in completed.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue
+            name = fields[2].strip()
+            modules[name] = min(modules.get(name, float('inf')), int(fields[1]) / 1000)
+            if name == module:
+                timings.append(int(fields[1]) / 1_000_000)
+
+    timings.sort()
+    total = sum(timings)
+
+    return {
+        'iterations': runs,
+        'mean_ms': total / runs * 1000,
+        'p50_ms': timings[int(0.50 * (runs - 1))] * 1000,
+        'p95_ms': timings[int(0.95 * (runs - 1))] * 1000,
+        'p99_ms': timings[int(0.99 * (runs - 1))] * 1000,
+        'ops_per_sec': runs / total if total > 0 else 0,
+        'peak_alloc_bytes': 0,
+        'output_bytes': None,
+        'slowest_modules_ms': dict(sorted(modules.items(), key=lambda item: item[1], reverse=True)[1:11]),
+    }
+
+
+def run_import_benchmarks(runs: int) -> dict:
+    return {f'import:{module}': measure_import(module, runs) for module in bench_constants['import_entrypoints']}
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Compares the p50 latency of every benchmark present in both runs.
+
+    Returns:
+        list: The names of the benchmarks whose p50 grew by more than the threshold.
+    """
+    regressions = []
+
+    print(f"{'benchmark':<52} {'baseline p50':>13} {'current p50':>13} {'change':>8}")
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None or previous['p50_ms'] == 0:
+            continue
+
+        change = result['p50_ms'] / previous['p50_ms'] - 1
+        flag = '  REGRESSION' if change > threshold else ''
+        if flag:
+            regressions.append(name)
+        print(f"{name:<52} {previous['p50_ms']:>11.4f}ms {result['p50_ms']:>11.4f}ms {change * 100:>+7.1f}%{flag}")
+
+    return regressions
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark the stats, render and route hot paths.')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in synthetic_constants['sizes']),
+                        help='Comma-separated repository list sizes.')
+    parser.add_argument('--skews', default=','.join(synthetic_constants['skews']),
+                        help='Comma-separated language skews (uniform, zipf, single).')
+    parser.add_argument('--iterations', type=int, default=bench_constants['iterations'])
+    parser.add_argument('--route-iterations', type=int, default=bench_constants['route_iterations'])
+    parser.add_argument('--skip-route', action='store_true', help='Skip the end-to-end route benchmarks.')
+    parser.add_argument('--import-runs', type=int, default=bench_constants['import_runs'],
+                        help='Fresh interpreters used to measure the cold import of each entry point, 0 skips it.')
+    parser.add_argument('--output', help='Where to store the results, defaults to benchmarks/results/<timestamp>.json.')
+    parser.add_argument('--compare', help='Results file of a previous run to compare against.')
+    parser.add_argument('--threshold', type=float, default=bench_constants['regression_threshold'],
+                        help='Relative p50 increase reported as a regression.')
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    skews = args.skews.split(',')
+
+    results = {}
+    if args.import_runs > 0:
+        results.update(run_import_benchmarks(args.import_runs))
+    results.update(run_stats_benchmarks(sizes, skews, args.iterations))
+    results.update(run_render_benchmarks(skews, args.iterations))
+    if not args.skip_route:
+        results.update(run_route_benchmarks(sizes, skews, args.route_iterations))
+
+    run = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'numpy': geometry.load_numpy() is not None,
+        'results': results,
+    }
+
+    output = args.output or os.path.join(bench_constants['results_dir'], f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as results_file:
+        json.dump(run, results_file, indent=2)
+
+    print(f"{'benchmark':<52} {'p50':>10} {'p95':>10} {'p99':>10} {'ops/s':>10} {'alloc':>9} {'bytes':>7}")
+    for name, result in results.items():
+        print(
+            f"{name:<52} {result['p50_ms']:>8.4f}ms {result['p95_ms']:>8.4f}ms {result['p99_ms']:>8.4f}ms "
+            f"{result['ops_per_sec']:>10.1f} {result['peak_alloc_bytes']:>9} {result['output_bytes'] or '':>7}"
+        )
+    print(f"Results stored in {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            regressions = compare_results(json.load(baseline_file), run, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold * 100:.0f}%")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
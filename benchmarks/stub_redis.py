@@ -0,0 +1,94 @@
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from cache.shared_cache import read_reply
+
+
+class StubRedisHandler(socketserver.StreamRequestHandler):
+    """
+    Serves the subset of the Redis protocol the shared cache uses: PING, GET, SET (with EX/PX), DEL, AUTH, SELECT,
+    DBSIZE and FLUSHDB, from an in-memory LRU dictionary.
+    """
+
+    def handle(self) -> None:
+        while True:
+            try:
+                command = read_reply(self.rfile)
+            except (ConnectionError, OSError):
+                return
+
+            if not isinstance(command, list) or len(command) == 0:
+                return
+
+            self.wfile.write(self.server.execute([part.upper() if i == 0 else part for i, part in enumerate(command)]))
+
+
+class StubRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple, max_entries: int = 100000):
+        super().__init__(address, StubRedisHandler)
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def execute(self, command: list) -> bytes:
+        name, args = command[0], command[1:]
+
+        with self.lock:
+            if name in (b'PING', b'AUTH', b'SELECT'):
+                return b'+PONG\r\n' if name == b'PING' else b'+OK\r\n'
+
+            if name == b'GET':
+                entry = self.entries.get(args[0])
+                if entry is None or entry[1] <= time.time():
+                    self.entries.pop(args[0], None)
+                    return b'$-1\r\n'
+                self.entries.move_to_end(args[0])
+                return b'$%d\r\n%s\r\n' % (len(entry[0]), entry[0])
+
+            if name == b'SET':
+                expires_at = float('inf')
+                if len(args) >= 4 and args[2].upper() in (b'EX', b'PX'):
+                    expires_at = time.time() + int(args[3]) / (1 if args[2].upper() == b'EX' else 1000)
+                self.entries[args[0]] = (args[1], expires_at)
+                self.entries.move_to_end(args[0])
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+                return b'+OK\r\n'
+
+            if name == b'DEL':
+                return b':%d\r\n' % sum(self.entries.pop(key, None) is not None for key in args)
+
+            if name == b'DBSIZE':
+                return b':%d\r\n' % len(self.entries)
+
+            if name == b'FLUSHDB':
+                self.entries.clear()
+                return b'+OK\r\n'
+
+        return b'-ERR unknown command\r\n'
+
+
+def start_stub_redis(port: int = 0) -> StubRedisServer:
+    """
+    Starts the stand-in Redis server on a background thread, e.g. to run the shared cache tier locally with
+    SHARED_CACHE_URL=redis://127.0.0.1:<server.server_address[1]>.
+
+    Args:
+        port (int): The port to listen on, 0 picks a free one.
+
+    Returns:
+        StubRedisServer: The running server.
+    """
+    server = StubRedisServer(('127.0.0.1', port))
+    threading.Thread(target=server.serve_forever, name='stub-redis', daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    server = StubRedisServer(('127.0.0.1', 6379))
+    print(f"Stand-in Redis server listening on redis://127.0.0.1:{server.server_address[1]}")
+    server.serve_forever()
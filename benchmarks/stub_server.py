@@ -0,0 +1,143 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from benchmarks.synthetic import generate_raw_events, generate_raw_repos, generate_repo_languages
+
+BENCH_USER = re.compile(r'^bench-(?P<size>\d+)-(?P<skew>[a-z]+)(-m\d+)?$')
+BENCH_ORG = re.compile(r'^bench-org-(?P<members>\d+)-(?P<size>\d+)-(?P<skew>[a-z]+)$')
+
+
+class StubGithubHandler(BaseHTTPRequestHandler):
+    """
+    Serves the subset of the GitHub API the service uses, backed by synthetic data.
+
+    Users named `bench-<size>-<skew>` (optionally suffixed with `-m<n>`) own `size` synthetic repositories with the
+    given language skew. Organizations named `bench-org-<members>-<size>-<skew>` have `members` such users as public
+    members and own `size` repositories themselves.
+    Every user has synthetic events, up to GitHub's limit of 300.
+    Responses carry ETags (honouring If-None-Match), pagination Link headers and rate-limit headers.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    repos_by_user = {}
+    lock = threading.Lock()
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def get_repos(self, username: str) -> list:
+        match = BENCH_USER.match(username) or BENCH_ORG.match(username)
+        if match is None:
+            return None
+
+        with self.lock:
+            if username not in self.repos_by_user:
+                self.repos_by_user[username] = generate_raw_repos(username, int(match.group('size')), match.group('skew'))
+            return self.repos_by_user[username]
+
+    def get_events(self, username: str, repo_count: int) -> list:
+        with self.lock:
+            key = f'{username}/events'
+            if key not in self.repos_by_user:
+                self.repos_by_user[key] = generate_raw_events(username, min(repo_count * 3, 300))
+            return self.repos_by_user[key]
+
+    def paginate(self, items: list, path: str, query: dict, headers: dict) -> list:
+        per_page = int(query.get('per_page', ['30'])[0])
+        page = int(query.get('page', ['1'])[0])
+        last_page = max(1, (len(items) + per_page - 1) // per_page)
+
+        if last_page > 1:
+            base = f'http://{self.headers["Host"]}{path}?per_page={per_page}'
+            headers['Link'] = f'<{base}&page={min(page + 1, last_page)}>; rel="next", <{base}&page={last_page}>; rel="last"'
+
+        return items[(page - 1) * per_page:page * per_page]
+
+    def do_GET(self) -> None:
+        time.sleep(self.server.latency)
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = url.path.strip('/').split('/')
+        headers = {}
+
+        if len(parts) == 3 and parts[0] == 'orgs' and parts[2] == 'public_members':
+            match = BENCH_ORG.match(parts[1])
+            if match is None:
+                return self.send_json(404, {'message': 'Not Found'})
+            body = [
+                {'login': f"bench-{match.group('size')}-{match.group('skew')}-m{i}"}
+                for i in range(int(match.group('members')))
+            ]
+        elif len(parts) == 3 and parts[0] in ('users', 'orgs') and parts[2] in ('repos', 'events'):
+            repos = self.get_repos(parts[1])
+            if repos is None:
+                return self.send_json(404, {'message': 'Not Found'})
+
+            if parts[2] == 'events':
+                items = self.get_events(parts[1], len(repos))
+            elif query.get('sort') == ['pushed']:
+                items = sorted(repos, key=lambda repo: repo['pushed_at'], reverse=True)
+            else:
+                items = repos
+
+            body = self.paginate(items, url.path, query, headers)
+        elif len(parts) == 4 and parts[0] == 'repos' and parts[3] == 'languages':
+            repos = self.get_repos(parts[1]) or []
+            index = int(parts[2].rsplit('-', 1)[-1]) if parts[2].startswith('repo-') else -1
+            if not 0 <= index < len(repos):
+                return self.send_json(404, {'message': 'Not Found'})
+            body = generate_repo_languages(repos[index]['full_name'], repos[index]['language'])
+        elif len(parts) == 2 and parts[0] == 'users':
+            repos = self.get_repos(parts[1])
+            if repos is None:
+                return self.send_json(404, {'message': 'Not Found'})
+            body = {'login': parts[1], 'public_repos': len(repos), 'followers': len(repos) * 3, 'following': len(repos) % 50}
+        else:
+            return self.send_json(404, {'message': 'Not Found'})
+
+        self.send_json(200, body, headers)
+
+    def send_json(self, status: int, body, headers: dict = None) -> None:
+        payload = json.dumps(body).encode('utf-8')
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        not_modified = status == 200 and self.headers.get('If-None-Match') == etag
+
+        self.send_response(304 if not_modified else status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', etag)
+        self.send_header('X-RateLimit-Limit', '1000000')
+        self.send_header('X-RateLimit-Remaining', '1000000')
+        self.send_header('X-RateLimit-Reset', '4102444800')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        if not_modified:
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def start_stub_server(port: int = 0, latency: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Starts the stub GitHub server on a background thread.
+
+    Args:
+        port (int): The port to listen on, 0 picks a free one.
+        latency (float): Seconds every response is delayed by, e.g. to exercise the request deadline.
+
+    Returns:
+        ThreadingHTTPServer: The running server, its URL is http://127.0.0.1:<server.server_port>.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubGithubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    threading.Thread(target=server.serve_forever, name='stub-github', daemon=True).start()
+    return server
@@ -0,0 +1,134 @@
+import random
+import zlib
+from github_api.repo_record import project_repos
+
+synthetic_constants = {
+    'sizes': (10, 100, 1000, 10000),
+    'skews': ('uniform', 'zipf', 'single'),
+    'languages': (
+        'Python', 'JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C', 'C++', 'C#', 'Ruby', 'PHP', 'Shell',
+        'HTML', 'CSS', 'Swift', 'Haskell', 'Jupyter Notebook', 'Vue', 'Perl', 'Assembly',
+    ),
+    'unknown_ratio': 0.1,
+    'seed': 1234,
+}
+
+
+def pick_language(rng: random.Random, skew: str) -> str:
+    """
+    Picks the language of a synthetic repository.
+
+    Args:
+        rng (random.Random): The seeded random generator.
+        skew (str): 'uniform' spreads repositories evenly, 'zipf' makes a few languages dominate,
+                    'single' puts nearly everything in one language.
+
+    Returns:
+        str: The language, or None for a repository without a detected language.
+    """
+    languages = synthetic_constants['languages']
+
+    if rng.random() < synthetic_constants['unknown_ratio']:
+        return None
+
+    if skew == 'uniform':
+        return rng.choice(languages)
+
+    if skew == 'zipf':
+        weights = [1 / rank for rank in range(1, len(languages) + 1)]
+        return rng.choices(languages, weights=weights)[0]
+
+    return languages[0] if rng.random() < 0.95 else rng.choice(languages)
+
+
+def generate_raw_repos(owner: str, size: int, skew: str, seed: int = synthetic_constants['seed']) -> list:
+    """
+    Generates a deterministic list of raw repositories shaped like the GitHub API response.
+
+    Args:
+        owner (str): The login of the owner.
+        size (int): The number of repositories.
+        skew (str): The language distribution, see pick_language.
+        seed (int): The random seed.
+
+    Returns:
+        list: The raw repositories.
+    """
+    rng = random.Random(f'{seed}-{size}-{skew}')
+    # Repository ids are unique across owners, like GitHub's.
+    id_base = zlib.crc32(owner.encode('utf-8')) * 100000
+    repos = []
+
+    for i in range(size):
+        language = pick_language(rng, skew)
+        repos.append({
+            'id': id_base + i + 1,
+            'name': f'repo-{i}',
+            'full_name': f'{owner}/repo-{i}',
+            'owner': {'login': owner, 'id': 1, 'url': f'https://api.github.com/users/{owner}'},
+            'fork': rng.random() < 0.2,
+            'language': language,
+            'stargazers_count': int(rng.paretovariate(1.5)) - 1,
+            'forks_count': int(rng.paretovariate(2)) - 1,
+            'pushed_at': f'20{rng.randint(15, 24)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00Z',
+            'html_url': f'https://github.com/{owner}/repo-{i}',
+            'description': 'Synthetic repository generated for benchmarks.',
+        })
+
+    return repos
+
+
+def generate_repos(size: int, skew: str, seed: int = synthetic_constants['seed']) -> list:
+    """
+    Generates a deterministic list of repositories as RepoRecords.
+    """
+    return project_repos(generate_raw_repos('bench', size, skew, seed))
+
+
+def generate_repo_languages(full_name: str, language: str) -> dict:
+    """
+    Generates the deterministic languages-endpoint response of a synthetic repository.
+    """
+    rng = random.Random(full_name)
+    languages = {language: rng.randint(1000, 200000)} if language else {}
+
+    for extra in rng.sample(synthetic_constants['languages'], rng.randint(0, 3)):
+        languages[extra] = languages.get(extra, 0) + rng.randint(100, 20000)
+
+    return languages
+
+
+def generate_raw_events(owner: str, size: int, seed: int = synthetic_constants['seed']) -> list:
+    """
+    Generates a deterministic list of raw events shaped like the GitHub events API response, newest first.
+
+    Args:
+        owner (str): The login of the actor.
+        size (int): The number of events, GitHub lists at most 300.
+        seed (int): The random seed.
+
+    Returns:
+        list: The raw events.
+    """
+    rng = random.Random(f'{seed}-{owner}-events')
+    events = []
+
+    for i in range(size):
+        kind = rng.choices(('PushEvent', 'PullRequestEvent', 'IssuesEvent', 'WatchEvent'), weights=(6, 2, 1, 1))[0]
+        commits = rng.randint(1, 5)
+        payload = {
+            'PushEvent': {'size': commits, 'commits': [{'sha': f'{i:040x}', 'message': 'Synthetic commit'}] * commits},
+            'PullRequestEvent': {'action': rng.choice(('opened', 'closed')), 'pull_request': {'number': i}},
+            'IssuesEvent': {'action': rng.choice(('opened', 'closed')), 'issue': {'number': i}},
+            'WatchEvent': {'action': 'started'},
+        }[kind]
+        events.append({
+            'id': str(i + 1),
+            'type': kind,
+            'actor': {'login': owner, 'id': 1, 'url': f'https://api.github.com/users/{owner}'},
+            'repo': {'name': f'{owner}/repo-{rng.randint(0, 9)}'},
+            'payload': payload,
+            'created_at': f'2024-{12 - i // 30 % 12:02d}-{28 - i % 28:02d}T00:00:00Z',
+        })
+
+    return events
@@ -0,0 +1,83 @@
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+compression_constants = {
+    'min_bytes': int(os.getenv('SVG_COMPRESS_MIN_BYTES', 512)),
+    'gzip_level': 9,
+    'brotli_quality': 11,
+}
+
+
+def compress_variants(body: bytes) -> dict:
+    """
+    Precompresses a response body once, in every supported encoding that makes it smaller.
+
+    Bodies below the minimum size are not compressed, the encoding overhead would outweigh the savings.
+    Brotli is only used when the optional brotli package is installed.
+
+    Args:
+        body (bytes): The uncompressed body.
+
+    Returns:
+        dict: The compressed body of each content coding, e.g. {'br': ..., 'gzip': ...}.
+    """
+    if len(body) < compression_constants['min_bytes']:
+        return {}
+
+    variants = {}
+
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=compression_constants['brotli_quality'])
+
+    # mtime=0 keeps the gzip output deterministic, so identical SVGs compress to identical bytes on every instance.
+    variants['gzip'] = gzip.compress(body, compresslevel=compression_constants['gzip_level'], mtime=0)
+
+    return {encoding: compressed for encoding, compressed in variants.items() if len(compressed) < len(body)}
+
+
+def negotiate_encoding(accept_encoding: str, available) -> str:
+    """
+    Picks the content coding of a response from the Accept-Encoding request header.
+
+    Among the available codings accepted with a non-zero quality, the one with the highest quality wins; ties prefer
+    the order of `available`. A `*` entry accepts any coding not listed explicitly.
+
+    Args:
+        accept_encoding (str): The Accept-Encoding header, or None.
+        available: The available codings, in order of preference.
+
+    Returns:
+        str: The chosen coding, or None for the identity coding.
+    """
+    if not accept_encoding or not available:
+        return None
+
+    qualities = {}
+
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+
+    for coding in available:
+        quality = qualities.get(coding, qualities.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+
+    return best
@@ -0,0 +1,261 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from cache.shared_cache import SharedStore, create_shared_store
+
+response_cache_constants = {
+    'backend': os.getenv('GITHUB_RESPONSE_CACHE', 'memory'),
+    'max_entries': int(os.getenv('GITHUB_RESPONSE_CACHE_SIZE', 2048)),
+    'shared_ttl': int(os.getenv('SHARED_CACHE_RESPONSE_TTL', 7 * 86400)),
+}
+
+
+class LRUResponseBackend:
+    """
+    In-process response cache backend that evicts the least recently used entries.
+    """
+
+    def __init__(self, max_entries: int = response_cache_constants['max_entries']):
+        """
+        Args:
+            max_entries (int): The maximum number of responses kept in memory.
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str, project=None) -> dict:
+        # Entries are kept as stored, their bodies are already projected.
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: dict) -> None:
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+
+class SQLiteResponseBackend:
+    """
+    On-disk response cache backend stored in a SQLite file, so entries survive restarts.
+    """
+
+    def __init__(self, path: str, max_entries: int = response_cache_constants['max_entries']):
+        """
+        Args:
+            path (str): The path of the SQLite database file.
+            max_entries (int): The maximum number of responses kept in the database.
+        """
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, entry TEXT NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+        self.connection.commit()
+
+    def get(self, key: str, project=None) -> dict:
+        with self.lock:
+            row = self.connection.execute('SELECT entry FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self.connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self.connection.commit()
+
+        return restore_records(json.loads(row[0]), project)
+
+    def set(self, key: str, entry: dict) -> None:
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO responses (key, entry, accessed_at) VALUES (?, ?, ?)',
+                (key, json.dumps(entry), time.time())
+            )
+            self.connection.execute(
+                'DELETE FROM responses WHERE key IN ('
+                'SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            self.connection.commit()
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self.connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self.connection.commit()
+
+
+class TieredResponseBackend:
+    """
+    Response cache backend reading through a local backend to the shared cache tier.
+
+    Entries found in the shared tier are copied to the local backend, and every stored entry is written to both, so
+    a new worker revalidates with the validators another worker stored instead of downloading the bodies again.
+    """
+
+    def __init__(self, local, shared: SharedStore):
+        """
+        Args:
+            local: The local backend, e.g. LRUResponseBackend.
+            shared (SharedStore): The shared tier namespace of the responses.
+        """
+        self.local = local
+        self.shared = shared
+
+    def get(self, key: str, project=None) -> dict:
+        entry = self.local.get(key, project)
+
+        if entry is None:
+            stored = self.shared.get(key)
+            if stored is not None:
+                entry = restore_records(stored[0], project)
+                self.local.set(key, entry)
+
+        return entry
+
+    def set(self, key: str, entry: dict) -> None:
+        self.local.set(key, entry)
+        self.shared.set(key, entry)
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        self.shared.delete(key)
+
+
+def restore_records(entry: dict, project) -> dict:
+    """
+    Turns the records of a decoded entry back into record tuples, once, when the entry is read from storage.
+
+    Args:
+        entry (dict): The entry as decoded from JSON, its records serialized as field lists.
+        project (callable): The projection the body was stored with, e.g. project_repos, or None.
+
+    Returns:
+        dict: The entry, with its body projected.
+    """
+    if project is not None and entry.get('body') is not None:
+        entry['body'] = project(entry['body'])
+
+    return entry
+
+
+def encode_response_entry(entry: dict) -> bytes:
+    # RepoRecords are serialized as field lists, which project_repo turns back into records.
+    return json.dumps(entry, separators=(',', ':')).encode('utf-8')
+
+
+def decode_response_entry(data: bytes) -> dict:
+    return json.loads(data)
+
+
+class ResponseCache:
+    """
+    Cache of GitHub API response bodies together with their validators (ETag and Last-Modified).
+
+    Stored validators are sent back as conditional request headers, and a 304 answer is served from the stored body.
+    304 responses do not count against the GitHub rate limit.
+    """
+
+    def __init__(self, backend):
+        """
+        Args:
+            backend: The storage backend, e.g. LRUResponseBackend or SQLiteResponseBackend.
+        """
+        self.backend = backend
+
+    def conditional_headers(self, entry: dict) -> dict:
+        """
+        Builds the conditional request headers for a cached entry.
+
+        Args:
+            entry (dict): The cached entry, or None.
+
+        Returns:
+            dict: The If-None-Match / If-Modified-Since headers to send.
+        """
+        headers = {}
+
+        if entry is None:
+            return headers
+
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        return headers
+
+    def get(self, key: str, project=None) -> dict:
+        """
+        Returns the entry of a key, or None.
+
+        Bodies are stored projected. In-memory entries are returned as they are; entries read from SQLite or the
+        shared tier hold their records as field lists, which are turned back into records once when they are read.
+
+        Args:
+            key (str): The cache key.
+            project (callable): The projection the body was stored with, or None.
+        """
+        return self.backend.get(key, project)
+
+    def store(self, key: str, body, headers) -> None:
+        """
+        Stores a response body if the response carries a validator.
+
+        Args:
+            key (str): The cache key, the identity of the token followed by the full request URL.
+            body: The parsed JSON body, already projected.
+            headers: The response headers.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        if etag is None and last_modified is None:
+            return
+
+        self.backend.set(key, {
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'link': headers.get('Link'),
+        })
+
+
+def create_response_cache(backend: str = response_cache_constants['backend']) -> ResponseCache:
+    """
+    Creates a response cache from a backend specification.
+
+    When the shared cache tier is configured (SHARED_CACHE_URL), the backend reads and writes through it.
+
+    Args:
+        backend (str): 'memory' for the in-process LRU backend or 'sqlite:///<path>' for the on-disk backend.
+
+    Returns:
+        ResponseCache: The response cache.
+
+    Raises:
+        ValueError: If the backend specification is not supported.
+    """
+    if backend == 'memory':
+        local = LRUResponseBackend()
+    elif backend.startswith('sqlite:///'):
+        local = SQLiteResponseBackend(backend[len('sqlite:///'):])
+    else:
+        raise ValueError(f"Error: Unsupported response cache backend - {backend}")
+
+    shared = create_shared_store(
+        'responses', encode_response_entry, decode_response_entry, response_cache_constants['shared_ttl']
+    )
+
+    return ResponseCache(TieredResponseBackend(local, shared) if shared is not None else local)
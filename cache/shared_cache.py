@@ -0,0 +1,326 @@
+import os
+import socket
+import sqlite3
+import struct
+import threading
+import time
+from urllib.parse import unquote, urlparse
+from metrics.metrics import cache_requests
+
+shared_cache_constants = {
+    'url': os.getenv('SHARED_CACHE_URL', ''),
+    'max_entries': int(os.getenv('SHARED_CACHE_MAX_ENTRIES', 100000)),
+    'mmap_bytes': int(os.getenv('SHARED_CACHE_MMAP_BYTES', 256 * 1024 * 1024)),
+    'timeout': float(os.getenv('SHARED_CACHE_TIMEOUT', 0.5)),
+    'key_prefix': 'github-stats:',
+    'retry_after': 5,
+    'evict_interval': 64,
+}
+
+
+class SQLiteSharedBackend:
+    """
+    Shared cache backend stored in a memory-mapped SQLite file.
+
+    Every worker process on the host opens the same file, so a value stored by one worker or before a restart is read
+    by the others. Expired entries are never returned and the least recently written entries are evicted once the
+    entry limit is exceeded.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_entries: int = shared_cache_constants['max_entries'],
+            mmap_bytes: int = shared_cache_constants['mmap_bytes']
+            ):
+        """
+        Args:
+            path (str): The path of the SQLite database file.
+            max_entries (int): The maximum number of entries kept in the database.
+            mmap_bytes (int): How much of the database file is memory-mapped for reads.
+        """
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.writes = 0
+        self.connection = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        # WAL lets the workers read while one of them writes.
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(f'PRAGMA mmap_size={int(mmap_bytes)}')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS shared_cache '
+            '(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, written_at REAL NOT NULL)'
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS shared_cache_written_at ON shared_cache (written_at)')
+        self.connection.commit()
+
+    def get(self, key: str) -> bytes:
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT value FROM shared_cache WHERE key = ? AND expires_at > ?', (key, time.time())
+            ).fetchone()
+            return bytes(row[0]) if row is not None else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO shared_cache (key, value, expires_at, written_at) VALUES (?, ?, ?, ?)',
+                (key, value, now + ttl, now)
+            )
+
+            self.writes += 1
+            if self.writes % shared_cache_constants['evict_interval'] == 0:
+                self.connection.execute('DELETE FROM shared_cache WHERE expires_at <= ?', (now,))
+                self.connection.execute(
+                    'DELETE FROM shared_cache WHERE key IN ('
+                    'SELECT key FROM shared_cache ORDER BY written_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+
+            self.connection.commit()
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self.connection.execute('DELETE FROM shared_cache WHERE key = ?', (key,))
+            self.connection.commit()
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisSharedBackend:
+    """
+    Shared cache backend speaking the Redis protocol (RESP), for workers spread across hosts.
+
+    Entries are written with a millisecond TTL; bounding the total size is left to the server's maxmemory policy
+    (e.g. `maxmemory-policy allkeys-lru`). Each thread keeps its own connection and reconnects after an error.
+    """
+
+    def __init__(self, url: str, timeout: float = shared_cache_constants['timeout']):
+        """
+        Args:
+            url (str): The server URL, redis://[:password@]host[:port][/db].
+            timeout (float): Seconds to wait for the server before a call fails.
+        """
+        parsed = urlparse(url)
+        self.address = (parsed.hostname or '127.0.0.1', parsed.port or 6379)
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.strip('/') or 0)
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def get(self, key: str) -> bytes:
+        return self.command(b'GET', key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.command(b'SET', key, value, b'PX', max(1, int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        self.command(b'DEL', key)
+
+    def command(self, *args):
+        """
+        Sends one command and returns its decoded reply.
+
+        Raises:
+            RedisError: If the server answers with an error.
+            OSError: If the connection fails, the connection is dropped and reopened by the next call.
+        """
+        connection = self.connect()
+
+        try:
+            connection.sendall(encode_command(args))
+            return read_reply(self.local.reader)
+        except OSError:
+            self.close()
+            raise
+
+    def connect(self) -> socket.socket:
+        connection = getattr(self.local, 'connection', None)
+
+        if connection is None:
+            connection = socket.create_connection(self.address, timeout=self.timeout)
+            self.local.connection = connection
+            self.local.reader = connection.makefile('rb')
+
+            if self.password is not None:
+                self.command(b'AUTH', self.password)
+            if self.db:
+                self.command(b'SELECT', self.db)
+
+        return connection
+
+    def close(self) -> None:
+        connection = getattr(self.local, 'connection', None)
+        self.local.connection = None
+
+        if connection is not None:
+            connection.close()
+
+
+def encode_command(args: tuple) -> bytes:
+    """
+    Encodes a command as a RESP array of bulk strings.
+    """
+    parts = [b'*%d\r\n' % len(args)]
+
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode('utf-8')
+        parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+
+    return b''.join(parts)
+
+
+def read_reply(reader):
+    """
+    Reads one RESP reply.
+
+    Raises:
+        RedisError: If the reply is an error.
+    """
+    line = reader.readline()
+
+    if not line.endswith(b'\r\n'):
+        raise ConnectionError("Connection closed by the shared cache server")
+
+    kind, payload = line[:1], line[1:-2]
+
+    if kind == b'+':
+        return payload
+    if kind == b'-':
+        raise RedisError(payload.decode('utf-8', 'replace'))
+    if kind == b':':
+        return int(payload)
+    if kind == b'$':
+        length = int(payload)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("Connection closed by the shared cache server")
+        return data[:-2]
+    if kind == b'*':
+        length = int(payload)
+        return None if length < 0 else [read_reply(reader) for _ in range(length)]
+
+    raise RedisError(f"Unexpected reply from the shared cache server - {line!r}")
+
+
+class SharedStore:
+    """
+    A namespace of the shared cache holding one kind of value, with its own serialization and TTL.
+
+    Values are stored with the time they were stored at, so readers can tell their age. The shared tier is an
+    optimization: a failing backend is counted in the metrics and treated as a miss, never as a request error, and it
+    is skipped for a few seconds so an unreachable server does not add its timeout to every request.
+    """
+
+    def __init__(self, backend, namespace: str, encode, decode, ttl: float):
+        """
+        Args:
+            backend: The shared backend, e.g. SQLiteSharedBackend or RedisSharedBackend.
+            namespace (str): The key namespace, also used as the `cache` metrics label.
+            encode (callable): Serializes a value to bytes.
+            decode (callable): Deserializes the bytes produced by encode.
+            ttl (float): Seconds an entry is kept.
+        """
+        self.backend = backend
+        self.namespace = namespace
+        self.encode = encode
+        self.decode = decode
+        self.ttl = ttl
+        self.skip_until = 0.0
+
+    def key(self, key: str) -> str:
+        return f"{shared_cache_constants['key_prefix']}{self.namespace}:{key}"
+
+    def get(self, key: str) -> tuple:
+        """
+        Returns the value stored under a key and the time it was stored at, or None.
+        """
+        if time.time() < self.skip_until:
+            return None
+
+        try:
+            data = self.backend.get(self.key(key))
+            if data is None:
+                cache_requests.inc(cache=f'shared_{self.namespace}', result='miss')
+                return None
+
+            stored_at, = struct.unpack_from('!d', data)
+            value = self.decode(data[8:])
+        except Exception as e:
+            self.record_error(e)
+            return None
+
+        cache_requests.inc(cache=f'shared_{self.namespace}', result='hit')
+        return value, stored_at
+
+    def set(self, key: str, value, stored_at: float = None) -> None:
+        if time.time() < self.skip_until:
+            return
+
+        try:
+            data = struct.pack('!d', stored_at if stored_at is not None else time.time()) + self.encode(value)
+            self.backend.set(self.key(key), data, self.ttl)
+        except Exception as e:
+            self.record_error(e)
+
+    def delete(self, key: str) -> None:
+        try:
+            self.backend.delete(self.key(key))
+        except Exception as e:
+            self.record_error(e)
+
+    def record_error(self, error: Exception) -> None:
+        cache_requests.inc(cache=f'shared_{self.namespace}', result='error')
+
+        # Only connection failures pause the tier, a value that fails to decode is just a miss.
+        if isinstance(error, (OSError, sqlite3.OperationalError)):
+            self.skip_until = time.time() + shared_cache_constants['retry_after']
+
+
+def create_shared_backend(url: str = shared_cache_constants['url']):
+    """
+    Creates the shared cache backend from a URL.
+
+    Args:
+        url (str): '' to disable the shared tier, 'sqlite:///<path>' for a file shared by the workers of one host,
+                   or 'redis://[:password@]host[:port][/db]' for a Redis-protocol server.
+
+    Returns:
+        The backend, or None when the shared tier is disabled.
+
+    Raises:
+        ValueError: If the URL scheme is not supported.
+    """
+    if not url:
+        return None
+
+    if url.startswith('sqlite:///'):
+        return SQLiteSharedBackend(url[len('sqlite:///'):])
+
+    if url.startswith('redis://'):
+        return RedisSharedBackend(url)
+
+    raise ValueError(f"Error: Unsupported shared cache backend - {url}")
+
+
+shared_backend = create_shared_backend()
+
+
+def create_shared_store(namespace: str, encode, decode, ttl: float) -> SharedStore:
+    """
+    Creates a namespace of the configured shared cache.
+
+    Returns:
+        SharedStore: The store, or None when the shared tier is disabled.
+    """
+    if shared_backend is None:
+        return None
+
+    return SharedStore(shared_backend, namespace, encode, decode, ttl)
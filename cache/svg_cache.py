@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+from cache.compression import compress_variants, negotiate_encoding
+from cache.shared_cache import SharedStore, create_shared_store
+from metrics.metrics import cache_requests, registry
+
+svg_cache_constants = {
+    'ttl': int(os.getenv('SVG_CACHE_TTL', 1800)),
+    'max_bytes': int(os.getenv('SVG_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+}
+
+
+class SvgEntry(NamedTuple):
+    """
+    A rendered SVG with its HTTP validator and its precompressed variants.
+
+    Degraded entries, rendered from partial data or as a placeholder, carry the reason and are never cached.
+    """
+    body: bytes
+    etag: str
+    created_at: float
+    variants: dict = None
+    degraded: str = None
+
+    def size(self) -> int:
+        return len(self.body) + sum(len(variant) for variant in (self.variants or {}).values())
+
+    def negotiate(self, accept_encoding: str) -> tuple:
+        """
+        Picks the representation to send for an Accept-Encoding request header.
+
+        Each content coding gets its own ETag, as the compressed bytes are a different representation of the card.
+
+        Args:
+            accept_encoding (str): The Accept-Encoding header, or None.
+
+        Returns:
+            tuple: The body, the content coding (None for identity) and the ETag.
+        """
+        encoding = negotiate_encoding(accept_encoding, self.variants)
+
+        if encoding is None:
+            return self.body, None, self.etag
+
+        return self.variants[encoding], encoding, f'{self.etag[:-1]}-{encoding}"'
+
+
+class SvgCache:
+    """
+    TTL + LRU cache of rendered SVG bytes, bounded by the total size of the stored bodies.
+
+    Compressed variants are built once when an entry is stored, so requests only pick the stored bytes.
+    With a shared store, entries are written through to the shared cache tier and local misses are read from it.
+    """
+
+    def __init__(
+            self,
+            ttl: int = svg_cache_constants['ttl'],
+            max_bytes: int = svg_cache_constants['max_bytes'],
+            shared: SharedStore = None
+            ):
+        """
+        Args:
+            ttl (int): Seconds an entry stays valid after it was rendered.
+            max_bytes (int): The byte budget for all stored SVG bodies and their compressed variants.
+            shared (SharedStore): Optional shared cache tier namespace the entries are written through to.
+        """
+        self.ttl = ttl
+        self.shared = shared
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> SvgEntry:
+        """
+        Returns the entry stored under the key, or None if it is missing or expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and time.time() - entry.created_at > self.ttl:
+                self._remove(key)
+                entry = None
+
+            if entry is not None:
+                self.entries.move_to_end(key)
+                cache_requests.inc(cache='svg', result='hit')
+                return entry
+
+        cache_requests.inc(cache='svg', result='miss')
+
+        stored = self.shared.get(key) if self.shared is not None else None
+        if stored is None or time.time() - stored[0].created_at > self.ttl:
+            return None
+
+        with self.lock:
+            self._insert(key, stored[0])
+
+        return stored[0]
+
+    def set(self, key: str, svg: str) -> SvgEntry:
+        """
+        Stores a rendered SVG with its compressed variants, evicting the least recently used entries until the byte
+        budget is met.
+
+        Args:
+            key (str): The cache key built with svg_cache_key.
+            svg (str): The rendered SVG.
+
+        Returns:
+            SvgEntry: The stored entry.
+        """
+        entry = build_svg_entry(svg)
+
+        with self.lock:
+            self._insert(key, entry)
+
+        if self.shared is not None:
+            self.shared.set(key, entry, entry.created_at)
+
+        return entry
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def invalidate_title(self, title: str) -> int:
+        """
+        Removes the local entries of every card titled with a username or organization, whatever its case.
+
+        Entries of the shared tier are not listed; they are keyed by the fingerprint of the stats they were rendered
+        from, so they are never served once the stats change and expire with their TTL.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        prefix = f"{title.lower()}:"
+
+        with self.lock:
+            keys = [key for key in self.entries if key.lower().startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+
+        return len(keys)
+
+    def _insert(self, key: str, entry: SvgEntry) -> None:
+        self._remove(key)
+        self.entries[key] = entry
+        self.total_bytes += entry.size()
+
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            self._remove(next(iter(self.entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size()
+
+
+def build_svg_entry(svg: str, degraded: str = None) -> SvgEntry:
+    """
+    Encodes a rendered SVG into an entry with its ETag and compressed variants.
+
+    Args:
+        svg (str): The rendered SVG.
+        degraded (str): Why the card is degraded, e.g. 'partial', or None for a complete card.
+
+    Returns:
+        SvgEntry: The entry.
+    """
+    body = svg.encode('utf-8')
+    return SvgEntry(body, f'"{hashlib.sha1(body).hexdigest()}"', time.time(), compress_variants(body), degraded)
+
+
+def svg_cache_key(username: str, chart_type: str, chart_kwargs: dict, fingerprint: str) -> str:
+    """
+    Builds the cache key of a rendered card.
+
+    Args:
+        username (str): The username shown on the card.
+        chart_type (str): The type of chart.
+        chart_kwargs (dict): The normalized chart keyword arguments.
+        fingerprint (str): The fingerprint of the upstream data.
+
+    Returns:
+        str: The cache key.
+    """
+    kwargs_hash = hashlib.sha1(json.dumps(chart_kwargs, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+    return f"{username}:{chart_type}:{kwargs_hash}:{fingerprint}"
+
+
+def encode_svg_entry(entry: SvgEntry) -> bytes:
+    """
+    Serializes an entry as a JSON header line followed by the body and its compressed variants.
+    """
+    parts = [('identity', entry.body)] + list((entry.variants or {}).items())
+    header = {
+        'etag': entry.etag,
+        'created_at': entry.created_at,
+        'parts': [[encoding, len(part)] for encoding, part in parts],
+    }
+    return json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n' + b''.join(part for _, part in parts)
+
+
+def decode_svg_entry(data: bytes) -> SvgEntry:
+    header_end = data.index(b'\n')
+    header = json.loads(data[:header_end])
+
+    offset = header_end + 1
+    parts = {}
+    for encoding, length in header['parts']:
+        parts[encoding] = data[offset:offset + length]
+        offset += length
+
+    body = parts.pop('identity')
+    return SvgEntry(body, header['etag'], header['created_at'], parts)
+
+
+svg_cache = SvgCache(shared=create_shared_store('svg', encode_svg_entry, decode_svg_entry, svg_cache_constants['ttl']))
+
+svg_cache_entries = registry.gauge('github_stats_svg_cache_entries', 'Rendered SVGs held in the cache.')
+svg_cache_bytes = registry.gauge('github_stats_svg_cache_bytes', 'Total size of the rendered SVGs held in the cache.')
+
+
+def collect_svg_cache_metrics() -> None:
+    with svg_cache.lock:
+        svg_cache_entries.set(len(svg_cache.entries))
+        svg_cache_bytes.set(svg_cache.total_bytes)
+
+
+registry.register_collector(collect_svg_cache_metrics)
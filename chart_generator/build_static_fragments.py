@@ -0,0 +1,119 @@
+import argparse
+import os
+import re
+import sys
+from chart_generator.chart_generator import (
+    bar_constants, build_donut_frame, build_stacked_bar_frame, donut_constants, generate_language_donut_charts,
+    get_frame_style
+)
+from utils.query_params import QueryParams
+from utils.utils import extract_chart_kwargs
+
+build_constants = {
+    'output': os.path.join(os.path.dirname(__file__), 'static_fragments.py'),
+    # Language stats the donut and pie geometry is checked with, including a single language spanning the whole circle.
+    'arc_fixtures': (
+        {'Python': {'count': 1, 'percentage': 100.0}},
+        {'Python': {'count': 3, 'percentage': 75.0}, 'Go': {'count': 1, 'percentage': 25.0}},
+    ),
+}
+
+
+def build_static_frames() -> dict:
+    """
+    Compiles the frames of the cards requested without styling options, for every possible number of legend entries.
+
+    Returns:
+        dict: The frames as plain tuples, keyed like the lookups of compile_stacked_bar_frame and compile_donut_frame.
+    """
+    frames = {}
+
+    bar_kwargs = extract_chart_kwargs(QueryParams(), 'bar')
+    bar_style = get_frame_style(bar_kwargs)
+    # The top languages plus the 'Others' entry.
+    for lang_count in range(1, bar_constants['top_n'] + 2):
+        frame = build_stacked_bar_frame(bar_style, bar_kwargs['bar_height'], lang_count)
+        frames[('bar', bar_style, bar_kwargs['bar_height'], lang_count)] = tuple(frame)
+
+    for chart_type in ('donut', 'pie'):
+        donut_style = get_frame_style(extract_chart_kwargs(QueryParams(), chart_type))
+        for lang_count in range(1, donut_constants['top_n'] + 2):
+            frames[('donut', donut_style, lang_count)] = tuple(build_donut_frame(donut_style, lang_count))
+
+    return frames
+
+
+def find_degenerate_arcs(svg: str) -> list:
+    """
+    Returns the arcs of the paths of an SVG that end where they start. SVG renderers skip such arcs, so a segment
+    drawn with one, e.g. a single language spanning the whole circle, would vanish from the card.
+    """
+    degenerate = []
+
+    for path in re.findall(r' d="([^"]*)"', svg):
+        current = None
+        for command, arguments in re.findall(r'([MLAZ])([^MLAZ]*)', path):
+            numbers = arguments.split()
+            if command == 'A' and numbers[-2:] == current and float(numbers[0]) > 0:
+                degenerate.append(f'A{arguments}')
+            if command in 'MLA':
+                current = numbers[-2:]
+
+    return degenerate
+
+
+def check_arc_geometry() -> list:
+    """
+    Renders the donut and pie arc fixtures and returns the degenerate arcs found in them.
+    """
+    charts = [
+        ('check', lang_stats, extract_chart_kwargs(QueryParams(), chart_type))
+        for lang_stats in build_constants['arc_fixtures'] for chart_type in ('donut', 'pie')
+    ]
+    return [arc for svg in generate_language_donut_charts(charts) for arc in find_degenerate_arcs(svg)]
+
+
+def render_module(frames: dict) -> str:
+    """
+    Renders the source of the static_fragments module holding the frames.
+    """
+    lines = [
+        '# Generated by `python -m chart_generator.build_static_fragments`, do not edit.',
+        'frames = {',
+    ]
+    lines.extend(f'    {key!r}: {frame!r},' for key, frame in frames.items())
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Prebuild the frames of the cards requested without styling options.')
+    parser.add_argument('--check', action='store_true',
+                        help='Only check that the prebuilt frames are current and the arc geometry renders, exiting with '
+                             'status 1 when they do not.')
+    args = parser.parse_args()
+
+    frames = build_static_frames()
+    source = render_module(frames)
+
+    if args.check:
+        degenerate_arcs = check_arc_geometry()
+        if degenerate_arcs:
+            print(f"Donut and pie segments with degenerate arcs: {', '.join(degenerate_arcs)}")
+            sys.exit(1)
+
+        with open(build_constants['output'], encoding='utf-8') as current:
+            if current.read() != source:
+                print(f"{build_constants['output']} is stale, run `python -m chart_generator.build_static_fragments`")
+                sys.exit(1)
+        print(f"{build_constants['output']} is current")
+        return
+
+    with open(build_constants['output'], 'w', encoding='utf-8') as output:
+        output.write(source)
+
+    print(f"Wrote {len(frames)} frames to {build_constants['output']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,90 +1,208 @@
-import math
+from functools import lru_cache
+from chart_generator import static_fragments
 from chart_generator.palettes import programming_languages_palette
-from chart_generator.chart_utils import calculate_donut_points
+from chart_generator.geometry import ArcBoundaries, calculate_batch_arc_boundaries, geometry_constants
+from chart_generator.svg_template import SvgFrame, compile_frame, format_number, render_frame
+from metrics.metrics import timed
 from stats_calculator.langs_stats_calculator import get_top_n_langs
 
-# TODO: REFAC: Refactor the following functions
-# TODO: DOC: Add documentation to the following functions
-# TODO: REFAC: Code here is so bad... I need to refactor it... I'm sorry for this mess but it works for now
+chart_constants = {
+    'svg_width': 400,
+    'default_color': '#cccccc',
+    'title_suffix': "'s Language Usage",
+    'frame_cache_size': 256,
+}
+
+bar_constants = {
+    'top_n': 7,
+    'svg_padding': 15,
+    'bar_padding_horizontal': 30,
+    'space_above_bar': 40,
+    'space_below_bar': 25,
+    'legend_entry_height': 18,
+    'legend_columns': 2,
+}
+
+donut_constants = {
+    'top_n': 6,
+    'svg_height': 200,
+    'legend_entry_height': 20,
+}
+
+
+def get_frame_style(chart_kwargs: dict) -> tuple:
+    """
+    Extracts the styling options a compiled frame depends on, in the order compile_frame expects them.
+    """
+    return (
+        chart_kwargs.get('background_color', "#ffffff"),
+        chart_kwargs.get('border_color', "#cccccc"),
+        chart_kwargs.get('border_width', 1),
+        chart_kwargs.get('border_radius', 10),
+        chart_kwargs.get('title_color', "#000000"),
+        chart_kwargs.get('text_color', "#000000"),
+    )
+
+
+def get_static_frame(key: tuple) -> SvgFrame:
+    """
+    Returns a frame prebuilt by build_static_fragments, or None.
+
+    Whether the prebuilt frames are current is checked when they are built (`--check`), not at runtime, so the
+    lookup costs a dictionary access on a cold start.
+    """
+    frame = static_fragments.frames.get(key)
+    return SvgFrame(*frame) if frame is not None else None
+
+
+@lru_cache(maxsize=chart_constants['frame_cache_size'])
+def compile_stacked_bar_frame(frame_style: tuple, bar_height: int, lang_count: int) -> SvgFrame:
+    """
+    Returns the static skeleton of a stacked bar chart, prebuilt for the default style or compiled on first use.
+    """
+    frame = get_static_frame(('bar', frame_style, bar_height, lang_count))
+    return frame if frame is not None else build_stacked_bar_frame(frame_style, bar_height, lang_count)
+
+
+def build_stacked_bar_frame(frame_style: tuple, bar_height: int, lang_count: int) -> SvgFrame:
+    """
+    Compiles the static skeleton of a stacked bar chart: frame, style, title and legend slots.
+
+    Args:
+        frame_style (tuple): The styling options returned by get_frame_style.
+        bar_height (int): The height of the bar.
+        lang_count (int): The number of legend entries.
+
+    Returns:
+        SvgFrame: The compiled frame.
+    """
+    svg_width = chart_constants['svg_width']
+    legend_columns = bar_constants['legend_columns']
+    legend_entry_height = bar_constants['legend_entry_height']
+
+    rows_per_column = (lang_count + legend_columns - 1) // legend_columns
+    legend_height = rows_per_column * legend_entry_height
+    svg_height = (
+        bar_constants['space_above_bar'] + bar_height + bar_constants['space_below_bar']
+        + legend_height + bar_constants['svg_padding'] * 2
+    )
+
+    total_bar_width = svg_width - bar_constants['bar_padding_horizontal'] * 2
+    column_width = total_bar_width / legend_columns
+    start_x_offset = (svg_width - total_bar_width) / 2
+    legend_start_y = bar_constants['space_above_bar'] + bar_height + bar_constants['space_below_bar']
+
+    legend_slots = []
+    for i in range(lang_count):
+        x_pos = start_x_offset + (i % legend_columns) * column_width
+        y_pos = legend_start_y + (i // legend_columns) * legend_entry_height
+        legend_slots.append((
+            f'<circle cx="{format_number(x_pos + 10)}" cy="{format_number(y_pos + 10)}" r="5" fill="',
+            f'"/><text x="{format_number(x_pos + 25)}" y="{format_number(y_pos + 15)}" class="lang-label">',
+            '</text>',
+        ))
+
+    return compile_frame(
+        svg_width, svg_height, frame_style, chart_constants['title_suffix'], tuple(legend_slots), ' fill="none"'
+    )
+
+
+@lru_cache(maxsize=chart_constants['frame_cache_size'])
+def compile_donut_frame(frame_style: tuple, lang_count: int) -> SvgFrame:
+    """
+    Returns the static skeleton of a donut or pie chart, prebuilt for the default style or compiled on first use.
+    """
+    frame = get_static_frame(('donut', frame_style, lang_count))
+    return frame if frame is not None else build_donut_frame(frame_style, lang_count)
+
+
+def build_donut_frame(frame_style: tuple, lang_count: int) -> SvgFrame:
+    """
+    Compiles the static skeleton of a donut or pie chart: frame, style, title and legend slots.
+
+    Args:
+        frame_style (tuple): The styling options returned by get_frame_style.
+        lang_count (int): The number of legend entries.
+
+    Returns:
+        SvgFrame: The compiled frame.
+    """
+    svg_width = chart_constants['svg_width']
+    svg_height = donut_constants['svg_height']
+    legend_entry_height = donut_constants['legend_entry_height']
+
+    legend_x_start = 2 * svg_width / 3 - 40
+    legend_y_start = (svg_height - (lang_count * legend_entry_height)) / 2 + 10
 
+    legend_slots = []
+    for i in range(lang_count):
+        y_pos = legend_y_start + (i * legend_entry_height) + 5
+        legend_slots.append((
+            f'<rect x="{format_number(legend_x_start)}" y="{format_number(y_pos)}" width="10" height="10" fill="',
+            f'"/><text x="{format_number(legend_x_start + 15)}" y="{format_number(y_pos + 10)}" class="lang-label">',
+            '</text>',
+        ))
+
+    return compile_frame(svg_width, svg_height, frame_style, chart_constants['title_suffix'], tuple(legend_slots))
+
+
+def get_legend_entries(top_langs: dict) -> list:
+    """
+    Resolves the color and label of each language once.
+
+    Returns:
+        list: The (color, label) pair of each language.
+    """
+    return [
+        (programming_languages_palette.get(lang, chart_constants['default_color']), f"{lang} ({stats['percentage']}%)")
+        for lang, stats in top_langs.items()
+    ]
+
+
+@timed('generate_language_stacked_bar')
 def generate_language_stacked_bar(
         username: str,
         lang_stats: dict,
         chart_kwargs: dict
         ) -> str:
-    
-    try:
-        # Unpack chart_kwargs
-        border_color = chart_kwargs.get('border_color', "#cccccc")
-        background_color = chart_kwargs.get('background_color', "#ffffff")
-        title_color = chart_kwargs.get('title_color', "#000000")
-        text_color = chart_kwargs.get('text_color', "#000000")
-        border_radius = chart_kwargs.get('border_radius', 10)
-        border_width = chart_kwargs.get('border_width', 1)
-        bar_height = chart_kwargs.get('bar_height')
-
-        # Adjusted parameters
-        svg_padding = 15
-        svg_width = 400
+    """
+    Generate a stacked bar chart SVG based on language statistics.
 
-        bar_padding_horizontal = 30
+    Args:
+        username (str): The username associated with the language statistics.
+        lang_stats (dict): A dictionary containing language statistics.
+        chart_kwargs (dict): Optional keyword arguments for customizing the chart.
 
-        space_above_bar = 40
-        space_below_bar = 25
+    Returns:
+        str: The SVG representation of the stacked bar chart.
 
-        legend_entry_height = 18
-        legend_columns = 2
+    Raises:
+        ValueError: If an error occurs during the chart generation process.
+    """
+    try:
+        bar_height = chart_kwargs.get('bar_height')
 
         # Process top 7 languages and 'Others'
-        top_langs = get_top_n_langs(lang_stats, 7)
-
-        # Calculate legend height and total SVG height
-        rows_per_column = (len(top_langs) + legend_columns - 1) // legend_columns
-        legend_height = rows_per_column * legend_entry_height
-        svg_height = space_above_bar + bar_height + space_below_bar + legend_height + svg_padding * 2
-
-        # SVG template initialization with a border rectangle
-        svg_template = f'''
-        <svg width="{svg_width}" height="{svg_height}" viewBox="0 0 {svg_width} {svg_height}" fill="none" xmlns="http://www.w3.org/2000/svg">
-            <rect width="{svg_width}" height="{svg_height}" fill="{background_color}" rx="{border_radius}"/>
-            <rect x="{border_width / 2}" y="{border_width / 2}" width="{svg_width - border_width}" height="{svg_height - border_width}" fill="none" stroke="{border_color}" stroke-width="{border_width}" rx="{border_radius - border_width / 2}"/>
-            <style>
-                .lang-label {{ font: 400 12px "Segoe UI", Ubuntu, Sans-Serif; fill: {text_color}; }}
-                .title {{ font: bold 14px "Segoe UI", Ubuntu, Sans-Serif; fill: {title_color}; text-anchor: middle; }}
-            </style>
-            <text x="{svg_width / 2}" y="30" class="title">{username}'s Language Usage</text>
-        '''
+        top_langs = get_top_n_langs(lang_stats, bar_constants['top_n'])
+        legend_entries = get_legend_entries(top_langs)
+
+        frame = compile_stacked_bar_frame(get_frame_style(chart_kwargs), bar_height, len(top_langs))
 
         # Generate the bar segments
-        total_bar_width = svg_width - bar_padding_horizontal * 2
-        current_x = bar_padding_horizontal
-        for lang, stats in top_langs.items():
-            color = programming_languages_palette.get(lang, "#cccccc")
+        total_bar_width = chart_constants['svg_width'] - bar_constants['bar_padding_horizontal'] * 2
+        current_x = bar_constants['bar_padding_horizontal']
+        bar_y = format_number(bar_constants['space_above_bar'] + 10)
+        height = format_number(bar_height)
+
+        segments = []
+        for (color, _), stats in zip(legend_entries, top_langs.values()):
             width = (stats['percentage'] / 100) * total_bar_width
-            svg_template += f'<rect x="{current_x}" y="{space_above_bar + 10}" width="{width}" height="{bar_height}" fill="{color}"/>'
+            segments.append(
+                f'<rect x="{format_number(current_x)}" y="{bar_y}" width="{format_number(width)}" height="{height}" fill="{color}"/>'
+            )
             current_x += width
 
-        # Generate the legend
-        column_width = total_bar_width / legend_columns
-        start_x_offset = (svg_width - total_bar_width) / 2
-        legend_start_y = space_above_bar + bar_height + space_below_bar
-
-        for i, (lang, stats) in enumerate(top_langs.items()):
-            color = programming_languages_palette.get(lang, "#cccccc")
-
-            column_index = i % legend_columns
-            row_index = i // legend_columns
-            
-            x_pos = start_x_offset + column_index * column_width
-            y_pos = legend_start_y + row_index * legend_entry_height
-
-            svg_template += f'''
-                <circle cx="{x_pos + 10}" cy="{y_pos + 10}" r="5" fill="{color}"/>
-                <text x="{x_pos + 25}" y="{y_pos + 15}" class="lang-label">{lang} ({stats['percentage']}%)</text>
-            '''
-        
-        svg_template += '</svg>'
-        return svg_template
+        return render_frame(frame, username, segments, legend_entries)
     except Exception as e:
         raise ValueError(f"Error: Something went wrong with generate_language_stacked_bar - {e}")
 
@@ -108,75 +226,106 @@ def generate_language_donut_chart(
     Raises:
         ValueError: If an error occurs during the chart generation process.
     """
-    
     try:
-        # Unpack chart_kwargs
-        border_color = chart_kwargs.get('border_color', "#cccccc")
-        background_color = chart_kwargs.get('background_color', "#ffffff")
-        title_color = chart_kwargs.get('title_color', "#000000")
-        text_color = chart_kwargs.get('text_color', "#000000")
-        hole_radius_percentage = chart_kwargs.get('hole_radius_percentage', 40)
-        border_radius = chart_kwargs.get('border_radius', 10)
-        border_width = chart_kwargs.get('border_width', 1)
-        outer_radius = chart_kwargs.get('outer_radius', 60)
+        return generate_language_donut_charts([(username, lang_stats, chart_kwargs)])[0]
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with generate_language_donut_chart - {e}")
+
+
+@timed('generate_language_donut_charts')
+def generate_language_donut_charts(charts: list) -> list:
+    """
+    Generate many donut chart SVGs at once, computing the arc geometry of all of them in a single batch.
 
+    Args:
+        charts (list): The (username, lang_stats, chart_kwargs) tuple of each chart.
+
+    Returns:
+        list: The SVG representation of each donut chart, in the same order.
+
+    Raises:
+        ValueError: If an error occurs during the chart generation process.
+    """
+    try:
         # Process top 6 languages and others
-        top_langs = get_top_n_langs(lang_stats, 6).items()
-
-        # Constants for the SVG
-        svg_width = 400
-        svg_height = 200
-
-        inner_radius = (hole_radius_percentage / 100) * outer_radius
-
-        chart_center_x = svg_width / 3 
-        chart_center_y = svg_height / 2 + 10
-        
-        legend_x_start = 2 * svg_width / 3 - 40
-        legend_y_start = (svg_height - (len(top_langs) * 20)) / 2 + 10
-
-        # Initialize SVG template with rounded corners
-        svg_template = f'''
-        <svg width="{svg_width}" height="{svg_height}" viewBox="0 0 {svg_width} {svg_height}" xmlns="http://www.w3.org/2000/svg">
-            <rect width="{svg_width}" height="{svg_height}" fill="{background_color}" rx="{border_radius}"/>
-            <rect x="{border_width / 2}" y="{border_width / 2}" width="{svg_width - border_width}" height="{svg_height - border_width}" fill="none" stroke="{border_color}" stroke-width="{border_width}" rx="{border_radius - border_width / 2}"/>
-            <style>
-                .title {{ font: bold 14px "Segoe UI", Ubuntu, Sans-Serif; fill: {title_color}; text-anchor: middle; }}
-                .lang-label {{ font: 400 12px "Segoe UI", Ubuntu, Sans-Serif; fill: {text_color}; }}
-            </style>
-            <text x="{svg_width / 2}" y="30" class="title">{username}'s Language Usage</text>
-        '''
-
-        # Generate the donut chart
-        start_angle = 0
-        for lang, stats in top_langs:
-            color = programming_languages_palette.get(lang, "#cccccc")
-            percentage = stats['percentage']
-
-            sweep_angle = (percentage / 100) * 360
-            end_angle = start_angle + sweep_angle
-
-            start_point_outer, end_point_outer, start_point_inner, end_point_inner = calculate_donut_points(
-                start_angle, end_angle, chart_center_x, chart_center_y, outer_radius, inner_radius)
-
-            large_arc_flag = '1' if sweep_angle > 180 else '0'
-
-            path_d = f"M {start_point_outer[0]} {start_point_outer[1]} A {outer_radius} {outer_radius} 0 {large_arc_flag} 1 {end_point_outer[0]} {end_point_outer[1]} L {end_point_inner[0]} {end_point_inner[1]} A {inner_radius} {inner_radius} 0 {large_arc_flag} 0 {start_point_inner[0]} {start_point_inner[1]} Z"
-            
-            svg_template += f'<path d="{path_d}" fill="{color}"/>'
-            start_angle += sweep_angle
-
-        # Add legend
-        for i, (lang, stats) in enumerate(top_langs):
-            color = programming_languages_palette.get(lang, "#cccccc")
-            y_pos = legend_y_start + (i * 20) + 5
-
-            svg_template += f'''
-                <rect x="{legend_x_start}" y="{y_pos}" width="10" height="10" fill="{color}"/>
-                <text x="{legend_x_start + 15}" y="{y_pos + 10}" class="lang-label">{lang} ({stats['percentage']}%)</text>
-            '''
-
-        svg_template += '</svg>'
-        return svg_template
+        top_langs_batch = [get_top_n_langs(lang_stats, donut_constants['top_n']) for _, lang_stats, _ in charts]
+        boundaries_batch = calculate_batch_arc_boundaries([
+            [stats['percentage'] for stats in top_langs.values()] for top_langs in top_langs_batch
+        ])
+
+        return [
+            render_donut_chart(username, top_langs, chart_kwargs, boundaries)
+            for (username, _, chart_kwargs), top_langs, boundaries in zip(charts, top_langs_batch, boundaries_batch)
+        ]
     except Exception as e:
-        raise ValueError(f"Error: Something went wrong with generate_language_donut_chart - {e}")
+        raise ValueError(f"Error: Something went wrong with generate_language_donut_charts - {e}")
+
+
+def render_donut_chart(username: str, top_langs: dict, chart_kwargs: dict, boundaries: ArcBoundaries) -> str:
+    """
+    Render one donut chart from its top languages and precomputed arc boundaries.
+    """
+    hole_radius_percentage = chart_kwargs.get('hole_radius_percentage', 40)
+    outer_radius = chart_kwargs.get('outer_radius', 60)
+    inner_radius = (hole_radius_percentage / 100) * outer_radius
+
+    legend_entries = get_legend_entries(top_langs)
+    frame = compile_donut_frame(get_frame_style(chart_kwargs), len(top_langs))
+
+    chart_center_x = chart_constants['svg_width'] / 3
+    chart_center_y = donut_constants['svg_height'] / 2 + 10
+
+    outer_arc = f"{format_number(outer_radius)} {format_number(outer_radius)}"
+    inner_arc = f"{format_number(inner_radius)} {format_number(inner_radius)}"
+
+    outer_points = [
+        (format_number(chart_center_x + outer_radius * cos), format_number(chart_center_y + outer_radius * sin))
+        for cos, sin in zip(boundaries.cos, boundaries.sin)
+    ]
+    inner_points = [
+        (format_number(chart_center_x + inner_radius * cos), format_number(chart_center_y + inner_radius * sin))
+        for cos, sin in zip(boundaries.cos, boundaries.sin)
+    ]
+
+    # Generate the donut chart, segment i spans from boundary i to boundary i + 1
+    segments = []
+    for i, ((color, _), sweep) in enumerate(zip(legend_entries, boundaries.sweeps)):
+        if sweep >= geometry_constants['steps']:
+            segments.append(render_full_ring(
+                (chart_center_x, chart_center_y), outer_radius, inner_radius, boundaries.cos[i], boundaries.sin[i], color
+            ))
+            continue
+
+        large_arc_flag = '1' if sweep > geometry_constants['steps'] / 2 else '0'
+
+        segments.append(
+            f'<path d="M{outer_points[i][0]} {outer_points[i][1]}'
+            f'A{outer_arc} 0 {large_arc_flag} 1 {outer_points[i + 1][0]} {outer_points[i + 1][1]}'
+            f'L{inner_points[i + 1][0]} {inner_points[i + 1][1]}'
+            f'A{inner_arc} 0 {large_arc_flag} 0 {inner_points[i][0]} {inner_points[i][1]}Z" '
+            f'fill="{color}"/>'
+        )
+
+    return render_frame(frame, username, segments, legend_entries)
+
+
+def render_full_ring(center: tuple, outer_radius: float, inner_radius: float, cos: float, sin: float, color: str) -> str:
+    """
+    Render a segment spanning the whole circle, e.g. the only language of a card.
+
+    An arc whose start and end points are the same is not drawn at all, so the ring is drawn as two half-arcs per
+    radius, the inner ones cutting out the hole with the even-odd fill rule. Pies have no hole.
+    """
+    center_x, center_y = center
+    rings = []
+
+    for radius, sweep_flag in ((outer_radius, '1'), (inner_radius, '0')):
+        if radius <= 0:
+            continue
+
+        start = f"{format_number(center_x + radius * cos)} {format_number(center_y + radius * sin)}"
+        middle = f"{format_number(center_x - radius * cos)} {format_number(center_y - radius * sin)}"
+        arc = f"{format_number(radius)} {format_number(radius)} 0 0 {sweep_flag}"
+        rings.append(f'M{start}A{arc} {middle}A{arc} {start}Z')
+
+    return f'<path d="{"".join(rings)}" fill-rule="evenodd" fill="{color}"/>'
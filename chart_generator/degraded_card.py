@@ -0,0 +1,71 @@
+from functools import lru_cache
+from chart_generator.chart_generator import chart_constants, get_frame_style
+from chart_generator.svg_template import SvgFrame, compile_frame, escape_text, format_number, render_frame
+from metrics.metrics import timed
+
+degraded_constants = {
+    'svg_height': 110,
+    'message_y': 70,
+    'marker_x_offset': 10,
+    'marker_y': 16,
+    'marker_style': 'font-size:10px;opacity:.7',
+    'frame_cache_size': 32,
+}
+
+
+@lru_cache(maxsize=degraded_constants['frame_cache_size'])
+def compile_placeholder_frame(frame_style: tuple, title_suffix: str) -> SvgFrame:
+    """
+    Compiles the static skeleton of a placeholder card: frame, style and title.
+    """
+    return compile_frame(chart_constants['svg_width'], degraded_constants['svg_height'], frame_style, title_suffix, ())
+
+
+def degraded_marker(marker: str) -> str:
+    """
+    Formats the small marker shown in the top right corner of a degraded card.
+    """
+    return (
+        f'<text x="{format_number(chart_constants["svg_width"] - degraded_constants["marker_x_offset"])}" '
+        f'y="{format_number(degraded_constants["marker_y"])}" text-anchor="end" class="lang-label" '
+        f'style="{degraded_constants["marker_style"]}">{escape_text(marker)}</text>'
+    )
+
+
+def add_degraded_marker(svg: str, marker: str) -> str:
+    """
+    Marks a rendered card as degraded, e.g. rendered from partial data.
+
+    Args:
+        svg (str): The rendered SVG.
+        marker (str): The text of the marker.
+
+    Returns:
+        str: The SVG with the marker drawn over its top right corner.
+    """
+    return f'{svg[:-len("</svg>")]}{degraded_marker(marker)}</svg>'
+
+
+@timed('generate_placeholder_card')
+def generate_placeholder_card(title: str, title_suffix: str, message: str, marker: str, chart_kwargs: dict) -> str:
+    """
+    Generate a lightweight placeholder card, served when no data of the card is available in time or at all.
+
+    Args:
+        title (str): The dynamic part of the title, e.g. the username.
+        title_suffix (str): The static text following it, e.g. "'s Language Usage".
+        message (str): The message shown in the card.
+        marker (str): The degraded marker shown in the top right corner.
+        chart_kwargs (dict): Optional keyword arguments for customizing the card.
+
+    Returns:
+        str: The SVG representation of the placeholder card.
+    """
+    frame = compile_placeholder_frame(get_frame_style(chart_kwargs), title_suffix)
+    segments = [
+        f'<text x="{format_number(chart_constants["svg_width"] / 2)}" y="{format_number(degraded_constants["message_y"])}" '
+        f'text-anchor="middle" class="lang-label">{escape_text(message)}</text>',
+        degraded_marker(marker),
+    ]
+
+    return render_frame(frame, title, segments, [])
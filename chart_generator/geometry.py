@@ -0,0 +1,153 @@
+import math
+import os
+from functools import lru_cache
+from itertools import chain
+from typing import NamedTuple
+
+geometry_constants = {
+    # Percentages are rounded to 2 decimals, so every arc boundary falls on one of 100 * 100 steps of a full turn.
+    'steps': 10000,
+    # NumPy only pays off for large batches, smaller ones use the pure Python path and never import it.
+    'numpy_min_batch': int(os.getenv('GEOMETRY_NUMPY_MIN_BATCH', 16)),
+}
+
+_unit_circle = {}
+_numpy = {}
+
+
+class ArcBoundaries(NamedTuple):
+    """
+    Unit-circle points of the boundaries between the segments of one donut or pie chart.
+
+    cos and sin hold len(sweeps) + 1 values: the start of the first segment followed by the end of each segment.
+    sweeps holds the quantized sweep of each segment in steps (see geometry_constants['steps']).
+    """
+    cos: list
+    sin: list
+    sweeps: list
+
+
+def load_numpy():
+    """
+    Imports NumPy on first use, so processes that never render a large batch do not pay for the import.
+
+    Returns:
+        The numpy module, or None when it is not installed.
+    """
+    if 'module' not in _numpy:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy['module'] = numpy
+
+    return _numpy['module']
+
+
+def get_unit_circle() -> tuple:
+    """
+    Returns the memoized cosine and sine of every quantized angle as NumPy arrays, computed on first use.
+
+    Returns:
+        tuple: The (cos, sin) tables.
+    """
+    if 'table' not in _unit_circle:
+        numpy = load_numpy()
+        steps = geometry_constants['steps']
+        angles = numpy.arange(steps + 1) * (2 * math.pi / steps)
+        _unit_circle['table'] = (numpy.cos(angles), numpy.sin(angles))
+
+    return _unit_circle['table']
+
+
+@lru_cache(maxsize=geometry_constants['steps'])
+def unit_circle_point(step: int) -> tuple:
+    """
+    Returns the memoized cosine and sine of a quantized angle, with the same arithmetic as the NumPy table.
+
+    The pure Python lookup is filled one step at a time as charts use them, so small batches never pay for building
+    the whole table.
+
+    Args:
+        step (int): The quantized angle, between 0 and geometry_constants['steps'] - 1.
+    """
+    angle = step * (2 * math.pi / geometry_constants['steps'])
+    return math.cos(angle), math.sin(angle)
+
+
+def quantize_percentage(percentage: float) -> int:
+    return int(round(percentage * geometry_constants['steps'] / 100))
+
+
+def calculate_arc_boundaries(percentages: list) -> ArcBoundaries:
+    """
+    Computes the boundary points of all segments of one chart in a single pass over the cumulative angles.
+
+    Args:
+        percentages (list): The percentage of each segment, in drawing order.
+
+    Returns:
+        ArcBoundaries: The unit-circle boundary points and quantized sweeps.
+    """
+    return calculate_batch_arc_boundaries([percentages])[0]
+
+
+def calculate_batch_arc_boundaries(percentages_batch: list) -> list:
+    """
+    Computes the boundary points of many charts at once.
+
+    Large batches compute the cumulative angles of all charts in one vectorized NumPy pass over a memoized
+    unit-circle table. Small batches, and every batch when NumPy is not installed, use a pure Python loop over a
+    memoized lookup of the same angles.
+
+    Args:
+        percentages_batch (list): The list of segment percentages of each chart.
+
+    Returns:
+        list: The ArcBoundaries of each chart, in the same order.
+    """
+    try:
+        if len(percentages_batch) == 0:
+            return []
+
+        steps = geometry_constants['steps']
+        numpy = load_numpy() if len(percentages_batch) >= geometry_constants['numpy_min_batch'] else None
+
+        if numpy is None:
+            batch = []
+            for percentages in percentages_batch:
+                sweeps = [quantize_percentage(percentage) for percentage in percentages]
+                boundaries = [0]
+                for sweep in sweeps:
+                    boundaries.append(boundaries[-1] + sweep)
+                points = [unit_circle_point(boundary % steps) for boundary in boundaries]
+                batch.append(ArcBoundaries([point[0] for point in points], [point[1] for point in points], sweeps))
+            return batch
+
+        cos_table, sin_table = get_unit_circle()
+
+        lengths = numpy.array([len(percentages) for percentages in percentages_batch], dtype=numpy.int64)
+        flat = numpy.fromiter(chain.from_iterable(percentages_batch), dtype=numpy.float64, count=int(lengths.sum()))
+        sweeps = numpy.rint(flat * (steps / 100)).astype(numpy.int64)
+
+        # Each chart contributes a leading zero boundary followed by the running sum of its own sweeps.
+        chart_ends = numpy.cumsum(lengths)
+        running = numpy.cumsum(sweeps)
+        chart_bases = numpy.repeat(numpy.concatenate(([0], running[chart_ends - 1]))[:-1], lengths)
+        ends = (running - chart_bases) % steps
+
+        end_cos, end_sin = cos_table[ends].tolist(), sin_table[ends].tolist()
+        sweeps = sweeps.tolist()
+
+        batch = []
+        start = 0
+        for end in chart_ends.tolist():
+            batch.append(ArcBoundaries(
+                [1.0] + end_cos[start:end],
+                [0.0] + end_sin[start:end],
+                sweeps[start:end],
+            ))
+            start = end
+        return batch
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with calculate_batch_arc_boundaries - {e}")
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from chart_generator.chart_generator import chart_constants, get_frame_style
+from chart_generator.svg_template import SvgFrame, compile_frame, escape_text, format_number, render_frame
+from metrics.metrics import timed
+
+profile_constants = {
+    'title_suffix': "'s GitHub Stats",
+    'rows': (
+        ('total_stars', 'Total stars', '#e3b341'),
+        ('total_forks', 'Total forks', '#8b949e'),
+        ('total_followers', 'Followers', '#3fb950'),
+        ('total_following', 'Following', '#2ea043'),
+        ('total_commits', 'Recent commits', '#1f6feb'),
+        ('total_pull_requests', 'Recent pull requests', '#a371f7'),
+        ('total_issues', 'Recent issues', '#f85149'),
+        ('total_repos', 'Public repositories', '#db61a2'),
+    ),
+    'space_above_rows': 45,
+    'row_height': 22,
+    'padding_horizontal': 30,
+    'svg_padding': 15,
+}
+
+
+@lru_cache(maxsize=chart_constants['frame_cache_size'])
+def compile_profile_frame(frame_style: tuple) -> SvgFrame:
+    """
+    Compiles the static skeleton of a profile card: frame, style, title and one slot per statistic.
+
+    The label of every row is static, so it is compiled into the slot and only the value is filled in per request.
+
+    Args:
+        frame_style (tuple): The styling options returned by get_frame_style.
+
+    Returns:
+        SvgFrame: The compiled frame.
+    """
+    svg_width = chart_constants['svg_width']
+    rows = profile_constants['rows']
+    row_height = profile_constants['row_height']
+    padding = profile_constants['padding_horizontal']
+    svg_height = profile_constants['space_above_rows'] + len(rows) * row_height + profile_constants['svg_padding']
+
+    row_slots = []
+    for i, (_, label, _) in enumerate(rows):
+        y_pos = profile_constants['space_above_rows'] + i * row_height
+        row_slots.append((
+            f'<circle cx="{format_number(padding + 5)}" cy="{format_number(y_pos + 10)}" r="5" fill="',
+            f'"/><text x="{format_number(padding + 20)}" y="{format_number(y_pos + 15)}" class="lang-label">'
+            f'{escape_text(label)}</text>'
+            f'<text x="{format_number(svg_width - padding)}" y="{format_number(y_pos + 15)}" '
+            f'text-anchor="end" class="lang-label">',
+            '</text>',
+        ))
+
+    return compile_frame(svg_width, svg_height, frame_style, profile_constants['title_suffix'], tuple(row_slots))
+
+
+@timed('generate_profile_card')
+def generate_profile_card(username: str, profile_stats: dict, chart_kwargs: dict) -> str:
+    """
+    Generate a profile card SVG listing the social and activity statistics of a user.
+
+    Args:
+        username (str): The username associated with the statistics.
+        profile_stats (dict): The statistics returned by ProfileStats.to_profile_stats.
+        chart_kwargs (dict): Optional keyword arguments for customizing the card.
+
+    Returns:
+        str: The SVG representation of the profile card.
+
+    Raises:
+        ValueError: If an error occurs during the card generation process.
+    """
+    try:
+        frame = compile_profile_frame(get_frame_style(chart_kwargs))
+        rows = [(color, f"{profile_stats.get(key, 0):,}") for key, _, color in profile_constants['rows']]
+
+        return render_frame(frame, username, [], rows)
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with generate_profile_card - {e}")
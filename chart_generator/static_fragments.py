@@ -0,0 +1,18 @@
+# Generated by `python -m chart_generator.build_static_fragments`, do not edit.
+frames = {
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 1): ('<svg width="400" height="133" viewBox="0 0 400 133" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="133" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="132" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'),), '</svg>'),
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 2): ('<svg width="400" height="133" viewBox="0 0 400 133" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="133" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="132" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'), ('<circle cx="210" cy="95" r="5" fill="', '"/><text x="225" y="100" class="lang-label">', '</text>')), '</svg>'),
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 3): ('<svg width="400" height="151" viewBox="0 0 400 151" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="151" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="150" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'), ('<circle cx="210" cy="95" r="5" fill="', '"/><text x="225" y="100" class="lang-label">', '</text>'), ('<circle cx="40" cy="113" r="5" fill="', '"/><text x="55" y="118" class="lang-label">', '</text>')), '</svg>'),
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 4): ('<svg width="400" height="151" viewBox="0 0 400 151" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="151" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="150" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'), ('<circle cx="210" cy="95" r="5" fill="', '"/><text x="225" y="100" class="lang-label">', '</text>'), ('<circle cx="40" cy="113" r="5" fill="', '"/><text x="55" y="118" class="lang-label">', '</text>'), ('<circle cx="210" cy="113" r="5" fill="', '"/><text x="225" y="118" class="lang-label">', '</text>')), '</svg>'),
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 5): ('<svg width="400" height="169" viewBox="0 0 400 169" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="169" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="168" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'), ('<circle cx="210" cy="95" r="5" fill="', '"/><text x="225" y="100" class="lang-label">', '</text>'), ('<circle cx="40" cy="113" r="5" fill="', '"/><text x="55" y="118" class="lang-label">', '</text>'), ('<circle cx="210" cy="113" r="5" fill="', '"/><text x="225" y="118" class="lang-label">', '</text>'), ('<circle cx="40" cy="131" r="5" fill="', '"/><text x="55" y="136" class="lang-label">', '</text>')), '</svg>'),
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 6): ('<svg width="400" height="169" viewBox="0 0 400 169" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="169" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="168" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'), ('<circle cx="210" cy="95" r="5" fill="', '"/><text x="225" y="100" class="lang-label">', '</text>'), ('<circle cx="40" cy="113" r="5" fill="', '"/><text x="55" y="118" class="lang-label">', '</text>'), ('<circle cx="210" cy="113" r="5" fill="', '"/><text x="225" y="118" class="lang-label">', '</text>'), ('<circle cx="40" cy="131" r="5" fill="', '"/><text x="55" y="136" class="lang-label">', '</text>'), ('<circle cx="210" cy="131" r="5" fill="', '"/><text x="225" y="136" class="lang-label">', '</text>')), '</svg>'),
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 7): ('<svg width="400" height="187" viewBox="0 0 400 187" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="187" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="186" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'), ('<circle cx="210" cy="95" r="5" fill="', '"/><text x="225" y="100" class="lang-label">', '</text>'), ('<circle cx="40" cy="113" r="5" fill="', '"/><text x="55" y="118" class="lang-label">', '</text>'), ('<circle cx="210" cy="113" r="5" fill="', '"/><text x="225" y="118" class="lang-label">', '</text>'), ('<circle cx="40" cy="131" r="5" fill="', '"/><text x="55" y="136" class="lang-label">', '</text>'), ('<circle cx="210" cy="131" r="5" fill="', '"/><text x="225" y="136" class="lang-label">', '</text>'), ('<circle cx="40" cy="149" r="5" fill="', '"/><text x="55" y="154" class="lang-label">', '</text>')), '</svg>'),
+    ('bar', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 20, 8): ('<svg width="400" height="187" viewBox="0 0 400 187" fill="none" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="187" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="186" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<circle cx="40" cy="95" r="5" fill="', '"/><text x="55" y="100" class="lang-label">', '</text>'), ('<circle cx="210" cy="95" r="5" fill="', '"/><text x="225" y="100" class="lang-label">', '</text>'), ('<circle cx="40" cy="113" r="5" fill="', '"/><text x="55" y="118" class="lang-label">', '</text>'), ('<circle cx="210" cy="113" r="5" fill="', '"/><text x="225" y="118" class="lang-label">', '</text>'), ('<circle cx="40" cy="131" r="5" fill="', '"/><text x="55" y="136" class="lang-label">', '</text>'), ('<circle cx="210" cy="131" r="5" fill="', '"/><text x="225" y="136" class="lang-label">', '</text>'), ('<circle cx="40" cy="149" r="5" fill="', '"/><text x="55" y="154" class="lang-label">', '</text>'), ('<circle cx="210" cy="149" r="5" fill="', '"/><text x="225" y="154" class="lang-label">', '</text>')), '</svg>'),
+    ('donut', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 1): ('<svg width="400" height="200" viewBox="0 0 400 200" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="200" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="199" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<rect x="226.67" y="105" width="10" height="10" fill="', '"/><text x="241.67" y="115" class="lang-label">', '</text>'),), '</svg>'),
+    ('donut', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 2): ('<svg width="400" height="200" viewBox="0 0 400 200" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="200" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="199" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<rect x="226.67" y="95" width="10" height="10" fill="', '"/><text x="241.67" y="105" class="lang-label">', '</text>'), ('<rect x="226.67" y="115" width="10" height="10" fill="', '"/><text x="241.67" y="125" class="lang-label">', '</text>')), '</svg>'),
+    ('donut', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 3): ('<svg width="400" height="200" viewBox="0 0 400 200" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="200" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="199" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<rect x="226.67" y="85" width="10" height="10" fill="', '"/><text x="241.67" y="95" class="lang-label">', '</text>'), ('<rect x="226.67" y="105" width="10" height="10" fill="', '"/><text x="241.67" y="115" class="lang-label">', '</text>'), ('<rect x="226.67" y="125" width="10" height="10" fill="', '"/><text x="241.67" y="135" class="lang-label">', '</text>')), '</svg>'),
+    ('donut', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 4): ('<svg width="400" height="200" viewBox="0 0 400 200" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="200" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="199" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<rect x="226.67" y="75" width="10" height="10" fill="', '"/><text x="241.67" y="85" class="lang-label">', '</text>'), ('<rect x="226.67" y="95" width="10" height="10" fill="', '"/><text x="241.67" y="105" class="lang-label">', '</text>'), ('<rect x="226.67" y="115" width="10" height="10" fill="', '"/><text x="241.67" y="125" class="lang-label">', '</text>'), ('<rect x="226.67" y="135" width="10" height="10" fill="', '"/><text x="241.67" y="145" class="lang-label">', '</text>')), '</svg>'),
+    ('donut', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 5): ('<svg width="400" height="200" viewBox="0 0 400 200" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="200" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="199" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<rect x="226.67" y="65" width="10" height="10" fill="', '"/><text x="241.67" y="75" class="lang-label">', '</text>'), ('<rect x="226.67" y="85" width="10" height="10" fill="', '"/><text x="241.67" y="95" class="lang-label">', '</text>'), ('<rect x="226.67" y="105" width="10" height="10" fill="', '"/><text x="241.67" y="115" class="lang-label">', '</text>'), ('<rect x="226.67" y="125" width="10" height="10" fill="', '"/><text x="241.67" y="135" class="lang-label">', '</text>'), ('<rect x="226.67" y="145" width="10" height="10" fill="', '"/><text x="241.67" y="155" class="lang-label">', '</text>')), '</svg>'),
+    ('donut', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 6): ('<svg width="400" height="200" viewBox="0 0 400 200" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="200" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="199" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<rect x="226.67" y="55" width="10" height="10" fill="', '"/><text x="241.67" y="65" class="lang-label">', '</text>'), ('<rect x="226.67" y="75" width="10" height="10" fill="', '"/><text x="241.67" y="85" class="lang-label">', '</text>'), ('<rect x="226.67" y="95" width="10" height="10" fill="', '"/><text x="241.67" y="105" class="lang-label">', '</text>'), ('<rect x="226.67" y="115" width="10" height="10" fill="', '"/><text x="241.67" y="125" class="lang-label">', '</text>'), ('<rect x="226.67" y="135" width="10" height="10" fill="', '"/><text x="241.67" y="145" class="lang-label">', '</text>'), ('<rect x="226.67" y="155" width="10" height="10" fill="', '"/><text x="241.67" y="165" class="lang-label">', '</text>')), '</svg>'),
+    ('donut', ('#fff', '#E4E2E2', 1, 10, '#000', '#000'), 7): ('<svg width="400" height="200" viewBox="0 0 400 200" xmlns="http://www.w3.org/2000/svg"><rect width="400" height="200" fill="#fff" rx="10"/><rect x="0.5" y="0.5" width="399" height="199" fill="none" stroke="#E4E2E2" stroke-width="1" rx="9.5"/><style>.title{font:bold 14px "Segoe UI",Ubuntu,Sans-Serif;fill:#000;text-anchor:middle}.lang-label{font:400 12px "Segoe UI",Ubuntu,Sans-Serif;fill:#000}</style><text x="200" y="30" class="title">', "'s Language Usage</text>", (('<rect x="226.67" y="45" width="10" height="10" fill="', '"/><text x="241.67" y="55" class="lang-label">', '</text>'), ('<rect x="226.67" y="65" width="10" height="10" fill="', '"/><text x="241.67" y="75" class="lang-label">', '</text>'), ('<rect x="226.67" y="85" width="10" height="10" fill="', '"/><text x="241.67" y="95" class="lang-label">', '</text>'), ('<rect x="226.67" y="105" width="10" height="10" fill="', '"/><text x="241.67" y="115" class="lang-label">', '</text>'), ('<rect x="226.67" y="125" width="10" height="10" fill="', '"/><text x="241.67" y="135" class="lang-label">', '</text>'), ('<rect x="226.67" y="145" width="10" height="10" fill="', '"/><text x="241.67" y="155" class="lang-label">', '</text>'), ('<rect x="226.67" y="165" width="10" height="10" fill="', '"/><text x="241.67" y="175" class="lang-label">', '</text>')), '</svg>'),
+}
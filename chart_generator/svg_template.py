@@ -0,0 +1,110 @@
+from typing import NamedTuple
+
+svg_template_constants = {
+    'precision': 2,
+    'font_family': '"Segoe UI",Ubuntu,Sans-Serif',
+}
+
+
+class SvgFrame(NamedTuple):
+    """
+    The precompiled static parts of a chart.
+
+    A chart is rendered as head + title text + title_suffix + dynamic segments + legend slots + tail,
+    where each legend slot is a (prefix, middle, suffix) triple that surrounds the entry color and label.
+    """
+    head: str
+    title_suffix: str
+    legend_slots: tuple
+    tail: str
+
+
+def format_number(value: float) -> str:
+    """
+    Formats a coordinate with a fixed precision and without trailing zeros.
+
+    Args:
+        value (float): The number to format.
+
+    Returns:
+        str: The formatted number, e.g. '12.5' for 12.5000001 and '40' for 40.0.
+    """
+    formatted = f"{value:.{svg_template_constants['precision']}f}".rstrip('0').rstrip('.')
+    return '0' if formatted == '-0' else formatted
+
+
+def escape_text(text: str) -> str:
+    """
+    Escapes a dynamic text segment so it can be placed inside an SVG element or attribute.
+    """
+    # Same output as xml.sax.saxutils.escape with the quote entity, without importing it (it pulls in urllib.request).
+    return str(text).replace('&', '&amp;').replace('>', '&gt;').replace('<', '&lt;').replace('"', '&quot;')
+
+
+def compile_frame(
+        width: int,
+        height: float,
+        chart_kwargs: tuple,
+        title_suffix: str,
+        legend_slots: tuple,
+        svg_attributes: str = ''
+        ) -> SvgFrame:
+    """
+    Compiles the minified frame shared by every chart: the svg element, background, border, style and title.
+
+    Args:
+        width (int): The width of the SVG.
+        height (float): The height of the SVG.
+        chart_kwargs (tuple): The (background_color, border_color, border_width, border_radius, title_color, text_color) styling options.
+        title_suffix (str): The static text following the username in the title.
+        legend_slots (tuple): The precompiled legend slots of the chart.
+        svg_attributes (str): Extra attributes of the svg element.
+
+    Returns:
+        SvgFrame: The compiled frame.
+    """
+    background_color, border_color, border_width, border_radius, title_color, text_color = (
+        escape_text(value) for value in chart_kwargs
+    )
+    border_width = float(border_width)
+    border_radius = float(border_radius)
+    font_family = svg_template_constants['font_family']
+
+    head = (
+        f'<svg width="{format_number(width)}" height="{format_number(height)}" '
+        f'viewBox="0 0 {format_number(width)} {format_number(height)}"{svg_attributes} xmlns="http://www.w3.org/2000/svg">'
+        f'<rect width="{format_number(width)}" height="{format_number(height)}" fill="{background_color}" rx="{format_number(border_radius)}"/>'
+        f'<rect x="{format_number(border_width / 2)}" y="{format_number(border_width / 2)}" '
+        f'width="{format_number(width - border_width)}" height="{format_number(height - border_width)}" fill="none" '
+        f'stroke="{border_color}" stroke-width="{format_number(border_width)}" rx="{format_number(border_radius - border_width / 2)}"/>'
+        f'<style>'
+        f'.title{{font:bold 14px {font_family};fill:{title_color};text-anchor:middle}}'
+        f'.lang-label{{font:400 12px {font_family};fill:{text_color}}}'
+        f'</style>'
+        f'<text x="{format_number(width / 2)}" y="30" class="title">'
+    )
+
+    return SvgFrame(head, f'{escape_text(title_suffix)}</text>', legend_slots, '</svg>')
+
+
+def render_frame(frame: SvgFrame, title: str, segments: list, legend_entries: list) -> str:
+    """
+    Fills a compiled frame with the dynamic parts of a chart and joins the result once.
+
+    Args:
+        frame (SvgFrame): The compiled frame.
+        title (str): The dynamic part of the title, escaped here.
+        segments (list): The already formatted chart segments.
+        legend_entries (list): The (color, label) pair of each legend slot, labels are escaped here.
+
+    Returns:
+        str: The rendered SVG.
+    """
+    parts = [frame.head, escape_text(title), frame.title_suffix]
+    parts.extend(segments)
+
+    for (prefix, middle, suffix), (color, label) in zip(frame.legend_slots, legend_entries):
+        parts.extend((prefix, color, middle, escape_text(label), suffix))
+
+    parts.append(frame.tail)
+    return ''.join(parts)
@@ -1,6 +1,8 @@
-from chart_generator.chart_generator import generate_language_donut_chart, generate_language_stacked_bar
+from chart_generator.chart_generator import generate_language_donut_chart, generate_language_donut_charts, generate_language_stacked_bar
+from metrics.metrics import timed
 
 
+@timed('chart_factory')
 def chart_factory(username : str, lang_stats: dict, chart_type: str, chart_kwargs: dict):
     """
     Factory function to generate different types of charts based on the given chart type.
@@ -34,3 +36,45 @@ def chart_factory(username : str, lang_stats: dict, chart_type: str, chart_kwarg
         
     except Exception as e:
         raise ValueError(f"Error: Something went wrong with chart_factory - {e}")
+
+
+@timed('charts_factory')
+def charts_factory(username: str, lang_stats: dict, variants: list) -> list:
+    """
+    Generate several charts of one user from a single language statistics result.
+
+    Donut and pie variants are rendered together so their arc geometry is computed in one batch.
+
+    Args:
+        username (str): The username for which the charts are generated.
+        lang_stats (dict): The language statistics for the user.
+        variants (list): The (chart_type, chart_kwargs) pair of each chart.
+
+    Returns:
+        list: The generated charts, in the same order as the variants.
+
+    Raises:
+        ValueError: If an invalid chart type is provided.
+    """
+    try:
+
+        if lang_stats is None or len(lang_stats) == 0:
+            raise ValueError("No language statistics provided.")
+
+        charts = [None] * len(variants)
+        donut_indexes = [i for i, (chart_type, _) in enumerate(variants) if chart_type in ('pie', 'donut')]
+
+        donut_charts = generate_language_donut_charts([
+            (username, lang_stats, variants[i][1]) for i in donut_indexes
+        ])
+        for i, chart in zip(donut_indexes, donut_charts):
+            charts[i] = chart
+
+        for i, (chart_type, chart_kwargs) in enumerate(variants):
+            if charts[i] is None:
+                charts[i] = chart_factory(username, lang_stats, chart_type, chart_kwargs)
+
+        return charts
+
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with charts_factory - {e}")
@@ -0,0 +1,118 @@
+import asyncio
+from github_api.async_github_client import async_github_client
+from github_api.github_api import check_response, get_last_page, github_constants
+from github_api.repo_record import project_repos
+from github_api.token_pool import PRIORITY_HIGH
+
+
+async def async_get_repos_page(url: str, page: int, semaphore: asyncio.Semaphore, priority: str = PRIORITY_HIGH) -> list:
+    """
+    Retrieves a single page of repositories without blocking the event loop.
+
+    Args:
+        url (str): The repositories endpoint URL.
+        page (int): The page number to fetch.
+        semaphore (asyncio.Semaphore): Bounds the number of pages fetched at once.
+        priority (str): The scheduling priority of the request.
+
+    Returns:
+        list: The repositories on the page.
+
+    Raises:
+        Exception: If the page could not be fetched.
+    """
+    async with semaphore:
+        response = await async_github_client.get_json(
+            url, params={'per_page': github_constants['per_page'], 'page': page}, priority=priority, project=project_repos
+        )
+
+    check_response(response, f"Could not fetch repositories page {page}")
+
+    return response.body
+
+
+async def async_get_user_repos(username: str, priority: str = PRIORITY_HIGH) -> list:
+    """
+    Asynchronous counterpart of get_user_repos.
+
+    Args:
+        username (str): The GitHub username.
+        priority (str): The scheduling priority of the requests, PRIORITY_LOW for background work.
+
+    Returns:
+        list: A list of repositories, as RepoRecords.
+
+    Raises:
+        ValueError: If the user is not found or has no repositories.
+    """
+    try:
+        url = github_constants['base_url'] + github_constants['user_repos'].format(username=username)
+        response = await async_github_client.get_json(
+            url, params={'per_page': github_constants['per_page'], 'page': 1}, priority=priority, project=project_repos
+        )
+
+        check_response(response, "User not found")
+
+        repos = list(response.body)
+
+        if len(repos) == 0:
+            raise Exception("User has no repositories")
+
+        last_page = get_last_page(response.headers.get('Link'))
+
+        if last_page > 1:
+            semaphore = asyncio.Semaphore(github_constants['max_page_workers'])
+            pages = await asyncio.gather(*(
+                async_get_repos_page(url, page, semaphore, priority) for page in range(2, last_page + 1)
+            ))
+            for page_repos in pages:
+                if len(page_repos) == 0:
+                    break
+                repos.extend(page_repos)
+
+        return repos
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with async_get_user_repos - {e}")
+
+
+async def async_get_user_repos_pushed_since(username: str, pushed_since: str, priority: str = PRIORITY_HIGH) -> list:
+    """
+    Asynchronous counterpart of get_user_repos_pushed_since.
+
+    Args:
+        username (str): The GitHub username.
+        pushed_since (str): The ISO 8601 pushed_at timestamp of the last sync.
+        priority (str): The scheduling priority of the requests.
+
+    Returns:
+        list: The repositories pushed to after pushed_since.
+
+    Raises:
+        ValueError: If the user is not found.
+    """
+    try:
+        url = github_constants['base_url'] + github_constants['user_repos'].format(username=username)
+        changed_repos = []
+        page = 1
+
+        while True:
+            response = await async_github_client.get_json(url, params={
+                'sort': 'pushed',
+                'direction': 'desc',
+                'per_page': github_constants['per_page'],
+                'page': page,
+            }, priority=priority, project=project_repos)
+
+            check_response(response, "User not found")
+
+            for repo in response.body:
+                if (repo.pushed_at or '') <= pushed_since:
+                    return changed_repos
+                changed_repos.append(repo)
+
+            if page >= get_last_page(response.headers.get('Link')):
+                return changed_repos
+
+            page += 1
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with async_get_user_repos_pushed_since - {e}")
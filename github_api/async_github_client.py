@@ -0,0 +1,151 @@
+import asyncio
+from cache.response_cache import ResponseCache
+from github_api.github_client import GithubResponse, client_constants, github_client
+from github_api.token_pool import PRIORITY_HIGH, RateLimitError, TokenPool, token_pool
+from metrics.metrics import cache_requests, upstream_responses
+
+
+class AsyncGithubClient:
+    """
+    Asynchronous counterpart of GithubClient for the ASGI serving path.
+
+    Uses a pooled httpx.AsyncClient with the same pool size, timeouts, 5xx retry policy and response cache as the
+    synchronous client, so one event loop can keep hundreds of GitHub calls in flight. httpx is only imported by the
+    first call.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = client_constants['pool_size'],
+            connect_timeout: float = client_constants['connect_timeout'],
+            read_timeout: float = client_constants['read_timeout'],
+            max_retries: int = client_constants['max_retries'],
+            backoff_factor: float = client_constants['backoff_factor'],
+            response_cache: ResponseCache = None,
+            token_pool: TokenPool = token_pool
+            ):
+        """
+        Args:
+            pool_size (int): The maximum number of pooled connections.
+            connect_timeout (float): Seconds to wait for a connection to be established.
+            read_timeout (float): Seconds to wait for the server to send data.
+            max_retries (int): The number of retries for failed connections and 5xx responses.
+            backoff_factor (float): The exponential backoff factor between retries.
+            response_cache (ResponseCache): Optional cache used to send conditional requests.
+            token_pool (TokenPool): The pool of tokens requests are authenticated with.
+        """
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.response_cache = response_cache
+        self.token_pool = token_pool
+        self.client = None
+
+    def get_client(self) -> 'httpx.AsyncClient':
+        if self.client is None:
+            import httpx
+
+            self.client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                headers={
+                    'Accept': 'application/vnd.github+json',
+                    'User-Agent': client_constants['user_agent'],
+                },
+            )
+        return self.client
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def get(self, url: str, params: dict = None, headers: dict = None) -> 'httpx.Response':
+        """
+        Sends a GET request, retrying connection errors and 5xx responses with exponential backoff.
+
+        Args:
+            url (str): The absolute URL to request.
+            params (dict): Optional query string parameters.
+            headers (dict): Optional request headers.
+
+        Returns:
+            httpx.Response: The response of the request.
+        """
+        import httpx
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.get_client().get(url, params=params, headers=headers)
+                if response.status_code not in client_constants['retry_statuses'] or attempt == self.max_retries:
+                    return response
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+            await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+    async def get_json(self, url: str, params: dict = None, priority: str = PRIORITY_HIGH, project=None) -> GithubResponse:
+        """
+        Sends an authenticated GET request and parses the JSON body once, revalidating through the response cache if configured.
+
+        Args:
+            url (str): The absolute URL to request.
+            params (dict): Optional query string parameters.
+            priority (str): PRIORITY_HIGH for user-facing requests, PRIORITY_LOW for work that may be deferred.
+            project (callable): Optional projection applied to the body before it is returned or cached, so only
+                                the projected body is kept in the response cache and a 304 answer returns it as is.
+
+        Returns:
+            GithubResponse: The status code, parsed body and headers of the response.
+
+        Raises:
+            RateLimitError: If every token is out of budget.
+        """
+        import httpx
+        from requests.structures import CaseInsensitiveDict
+
+        request_url = str(httpx.URL(url, params=params))
+
+        for _ in self.token_pool.states:
+            # The token pool is guarded by a threading lock and low priority requests wait for budget on it.
+            state = await asyncio.to_thread(self.token_pool.acquire, priority)
+
+            key = f'{state.identity}:{request_url}'
+            # The response cache may be backed by SQLite or the shared tier, so it is read and written off the event loop.
+            cached = await asyncio.to_thread(self.response_cache.get, key, project) if self.response_cache is not None else None
+            conditional_headers = self.response_cache.conditional_headers(cached) if self.response_cache is not None else {}
+
+            response = await self.get(request_url, headers={**state.authorization(), **conditional_headers})
+            headers = CaseInsensitiveDict(response.headers)
+            upstream_responses.inc(status=response.status_code)
+            self.token_pool.update(state, headers)
+
+            if not self.token_pool.is_rate_limited(response.status_code, headers):
+                break
+
+            self.token_pool.mark_exhausted(state, headers)
+        else:
+            raise RateLimitError(min(candidate.reset_at for candidate in self.token_pool.states))
+
+        if self.response_cache is not None:
+            cache_requests.inc(cache='github_response', result='hit' if response.status_code == 304 else 'miss')
+
+        if response.status_code == 304 and cached is not None:
+            if cached.get('link') is not None:
+                headers['Link'] = cached['link']
+            return GithubResponse(200, cached['body'], headers, from_cache=True)
+
+        body = response.json() if response.status_code == 200 else None
+
+        if body is not None and project is not None:
+            body = project(body)
+
+        if response.status_code == 200 and self.response_cache is not None:
+            await asyncio.to_thread(self.response_cache.store, key, body, headers)
+
+        return GithubResponse(response.status_code, body, headers)
+
+
+async_github_client = AsyncGithubClient(response_cache=github_client.response_cache)
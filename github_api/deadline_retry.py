@@ -0,0 +1,19 @@
+from urllib3.util.retry import Retry
+from utils.deadline import DeadlineExceeded, current_deadline
+
+
+class DeadlineRetry(Retry):
+    """
+    Retry policy that gives up once the deadline of the running request has passed.
+
+    urllib3 retries in the calling thread, so a timed out or failed attempt is not retried, and no backoff is slept,
+    past the deadline of the request that sent it. Background work has no deadline and retries as configured.
+    """
+
+    def increment(self, *args, **kwargs) -> Retry:
+        deadline = current_deadline()
+
+        if deadline is not None and deadline.expired():
+            raise DeadlineExceeded()
+
+        return super().increment(*args, **kwargs)
@@ -0,0 +1,53 @@
+import sys
+from typing import NamedTuple
+
+
+class EventRecord(NamedTuple):
+    """
+    Compact projection of a GitHub event, keeping only the fields the profile card uses.
+
+    The raw API object embeds the actor, the repository and the full payload, e.g. every commit of a push;
+    an EventRecord is a plain tuple with interned type and action names.
+    """
+    type: str
+    action: str
+    commits: int
+    created_at: str
+
+
+def project_event(event) -> EventRecord:
+    """
+    Projects an event into an EventRecord.
+
+    Args:
+        event: A raw event object from the GitHub API, an existing EventRecord, or its serialized field list.
+
+    Returns:
+        EventRecord: The compact record.
+    """
+    if isinstance(event, EventRecord):
+        return event
+
+    if isinstance(event, (list, tuple)):
+        return EventRecord._make(event)
+
+    payload = event.get('payload') or {}
+    action = payload.get('action')
+    commits = payload.get('size')
+
+    if commits is None:
+        commits = len(payload.get('commits') or ())
+
+    return EventRecord(
+        sys.intern(event['type']),
+        sys.intern(action) if action else None,
+        commits,
+        event.get('created_at'),
+    )
+
+
+def project_events(events: list) -> list:
+    """
+    Projects a list of events into EventRecords.
+    """
+    return [project_event(event) for event in events]
@@ -1,45 +1,307 @@
-import requests
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from github_api.event_record import project_events
+from github_api.github_client import GithubResponse, github_client
+from github_api.repo_record import project_repos
+from github_api.token_pool import PRIORITY_HIGH
+from metrics.metrics import timed
+from utils.deadline import DeadlineExceeded, submit, wait_result
 
 github_constants = {
-    'base_url': 'https://api.github.com',
+    'base_url': os.getenv('GITHUB_API_URL', 'https://api.github.com'),
     'user_repos': '/users/{username}/repos',
     'user_info': '/users/{username}',
     'user_events': '/users/{username}/events',
+    'org_repos': '/orgs/{org}/repos',
+    'org_members': '/orgs/{org}/public_members',
+    'repo_languages': '/repos/{full_name}/languages',
+    'per_page': 100,
+    'max_page_workers': 8,
 }
 
-def get_user_repos(username: str) -> list:
+LAST_PAGE_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def get_last_page(link_header: str) -> int:
+    """
+    Extracts the last page number from a GitHub pagination Link header.
+
+    Args:
+        link_header (str): The value of the Link response header.
+
+    Returns:
+        int: The number of the last page, or 1 if the header has no "last" relation.
+    """
+    match = LAST_PAGE_PATTERN.search(link_header or '')
+    return int(match.group(1)) if match else 1
+
+
+def check_response(response: GithubResponse, not_found_message: str) -> None:
+    """
+    Raises a descriptive error for a non-200 GitHub API response.
+
+    Args:
+        response (GithubResponse): The response to check.
+        not_found_message (str): The error message for a 404 response.
+
+    Raises:
+        Exception: If the response status is not 200.
+    """
+    if response.status_code == 404:
+        raise Exception(not_found_message)
+
+    if response.status_code != 200:
+        raise Exception(f"GitHub API responded with status {response.status_code}")
+
+
+def get_page(url: str, page: int, priority: str = PRIORITY_HIGH, project=project_repos) -> list:
+    """
+    Retrieves a single page of a paginated endpoint.
+
+    Args:
+        url (str): The endpoint URL.
+        page (int): The page number to fetch.
+        priority (str): The scheduling priority of the request.
+        project (callable): The projection applied to the page, project_repos by default.
+
+    Returns:
+        list: The projected items on the page.
+
+    Raises:
+        Exception: If the page could not be fetched.
+    """
+    response = github_client.get_json(url, params={'per_page': github_constants['per_page'], 'page': page}, priority=priority, project=project)
+
+    check_response(response, f"Could not fetch page {page}")
+
+    return response.body
+
+
+def get_all_pages(url: str, not_found_message: str, priority: str = PRIORITY_HIGH, project=project_repos) -> list:
+    """
+    Retrieves every page of a paginated endpoint.
+
+    The first page is fetched on its own to learn the page count from the Link header,
+    the remaining pages are then fetched concurrently and appended in page order.
+    When the request deadline passes, the pages not fetched yet are cancelled and the items of the pages fetched so
+    far, in order, are attached to the DeadlineExceeded error.
+
+    Args:
+        url (str): The endpoint URL.
+        not_found_message (str): The error message when the owner does not exist.
+        priority (str): The scheduling priority of the requests.
+        project (callable): The projection applied to every page, project_repos by default.
+
+    Returns:
+        list: The projected items of all pages.
+
+    Raises:
+        Exception: If the owner is not found or a page could not be fetched.
+        DeadlineExceeded: If the request deadline passes before every page is fetched.
+    """
+    response = github_client.get_json(url, params={'per_page': github_constants['per_page'], 'page': 1}, priority=priority, project=project)
+
+    check_response(response, not_found_message)
+
+    items = list(response.body)
+
+    if len(items) == 0:
+        return items
+
+    last_page = get_last_page(response.headers.get('Link'))
+
+    if last_page > 1:
+        max_workers = min(github_constants['max_page_workers'], last_page - 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [submit(executor, get_page, url, page, priority, project) for page in range(2, last_page + 1)]
+            try:
+                for future in futures:
+                    page_items = wait_result(future)
+                    if len(page_items) == 0:
+                        break
+                    items.extend(page_items)
+            except DeadlineExceeded:
+                raise DeadlineExceeded(partial=items)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    return items
+
+
+@timed('get_user_repos')
+def get_user_repos(username: str, priority: str = PRIORITY_HIGH, allow_empty: bool = False) -> list:
     """
     Retrieves a list of repositories for a given GitHub user.
 
     Args:
         username (str): The GitHub username.
+        priority (str): The scheduling priority of the requests, PRIORITY_LOW for background work.
+        allow_empty (bool): Whether a user without repositories is returned an empty list instead of an error.
 
     Returns:
-        list: A list of repositories.
+        list: A list of repositories, as RepoRecords.
 
     Raises:
         Exception: If the user is not found.
     """
     try:
-        response = requests.get(github_constants['base_url'] + github_constants['user_repos'].format(username=username))
-        
-        if response.status_code != 200:
-            raise Exception("User not found")
-        
-        if len(response.json()) == 0:
+        url = github_constants['base_url'] + github_constants['user_repos'].format(username=username)
+        repos = get_all_pages(url, "User not found", priority)
+
+        if len(repos) == 0 and not allow_empty:
             raise Exception("User has no repositories")
 
-        return response.json()
+        return repos
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         raise ValueError(f"Error: Something went wrong with get_user_repos - {e}")
 
 
-def get_user_info(username: str) -> dict:
+@timed('get_org_repos')
+def get_org_repos(org: str, priority: str = PRIORITY_HIGH) -> list:
+    """
+    Retrieves the repositories owned by a GitHub organization.
+
+    Args:
+        org (str): The organization login.
+        priority (str): The scheduling priority of the requests.
+
+    Returns:
+        list: The repositories of the organization, as RepoRecords.
+
+    Raises:
+        Exception: If the organization is not found.
+    """
+    try:
+        url = github_constants['base_url'] + github_constants['org_repos'].format(org=org)
+        return get_all_pages(url, "Organization not found", priority)
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with get_org_repos - {e}")
+
+
+@timed('get_org_members')
+def get_org_members(org: str, priority: str = PRIORITY_HIGH) -> list:
+    """
+    Retrieves the logins of the public members of a GitHub organization.
+
+    Args:
+        org (str): The organization login.
+        priority (str): The scheduling priority of the requests.
+
+    Returns:
+        list: The member logins, in the order GitHub lists them.
+
+    Raises:
+        Exception: If the organization is not found.
+    """
+    try:
+        url = github_constants['base_url'] + github_constants['org_members'].format(org=org)
+        members = []
+        page = 1
+
+        while True:
+            response = github_client.get_json(url, params={'per_page': github_constants['per_page'], 'page': page}, priority=priority)
+
+            check_response(response, "Organization not found")
+
+            members.extend(member['login'] for member in response.body)
+
+            if len(response.body) == 0 or page >= get_last_page(response.headers.get('Link')):
+                return members
+
+            page += 1
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with get_org_members - {e}")
+
+
+@timed('get_user_repos_pushed_since')
+def get_user_repos_pushed_since(username: str, pushed_since: str, priority: str = PRIORITY_HIGH) -> list:
+    """
+    Retrieves the repositories of a GitHub user that were pushed to after a given time.
+
+    Pages are requested newest push first and the walk stops at the first repository that is not newer,
+    so an unchanged user costs a single (usually 304) request.
+
+    Args:
+        username (str): The GitHub username.
+        pushed_since (str): The ISO 8601 pushed_at timestamp of the last sync.
+        priority (str): The scheduling priority of the requests.
+
+    Returns:
+        list: The repositories pushed to after pushed_since, as RepoRecords.
+
+    Raises:
+        Exception: If the user is not found.
+    """
+    try:
+        url = github_constants['base_url'] + github_constants['user_repos'].format(username=username)
+        changed_repos = []
+        page = 1
+
+        while True:
+            response = github_client.get_json(url, params={
+                'sort': 'pushed',
+                'direction': 'desc',
+                'per_page': github_constants['per_page'],
+                'page': page,
+            }, priority=priority, project=project_repos)
+
+            check_response(response, "User not found")
+
+            for repo in response.body:
+                if (repo.pushed_at or '') <= pushed_since:
+                    return changed_repos
+                changed_repos.append(repo)
+
+            if page >= get_last_page(response.headers.get('Link')):
+                return changed_repos
+
+            page += 1
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with get_user_repos_pushed_since - {e}")
+
+
+@timed('get_repo_languages')
+def get_repo_languages(full_name: str, priority: str = PRIORITY_HIGH) -> dict:
+    """
+    Retrieves the number of bytes of code written in each language of a repository.
+
+    Args:
+        full_name (str): The full name of the repository, e.g. 'owner/repo'.
+        priority (str): The scheduling priority of the request.
+
+    Returns:
+        dict: The number of bytes of each language.
+
+    Raises:
+        Exception: If the repository is not found.
+    """
+    response = github_client.get_json(
+        github_constants['base_url'] + github_constants['repo_languages'].format(full_name=full_name), priority=priority
+    )
+
+    check_response(response, "Repository not found")
+
+    return response.body
+
+
+@timed('get_user_info')
+def get_user_info(username: str, priority: str = PRIORITY_HIGH) -> dict:
     """
     Retrieves information about a given GitHub user.
 
     Args:
         username (str): The GitHub username.
+        priority (str): The scheduling priority of the request.
 
     Returns:
         dict: Information about the user.
@@ -47,30 +309,36 @@ def get_user_info(username: str) -> dict:
     Raises:
         Exception: If the user is not found.
     """
-    response = requests.get(f'https://api.github.com/users/{username}')
-    
-    if response.status_code != 200:
-        raise Exception("User not found")
+    response = github_client.get_json(
+        github_constants['base_url'] + github_constants['user_info'].format(username=username), priority=priority
+    )
+
+    check_response(response, "User not found")
 
-    return response.json()
+    return response.body
 
 
-def get_user_events(username: str) -> list:
+@timed('get_user_events')
+def get_user_events(username: str, priority: str = PRIORITY_HIGH) -> list:
     """
-    Retrieves a list of events for a given GitHub user.
+    Retrieves the recent public events of a given GitHub user, every page fetched concurrently.
+
+    GitHub only lists the events of the last 90 days, up to 300 of them.
 
     Args:
         username (str): The GitHub username.
+        priority (str): The scheduling priority of the requests.
 
     Returns:
-        list: A list of events.
+        list: The events, as EventRecords.
 
     Raises:
         Exception: If the user is not found.
     """
-    response = requests.get(f'https://api.github.com/users/{username}/events')
-    
-    if response.status_code != 200:
-        raise Exception("User not found")
-
-    return response.json()
\ No newline at end of file
+    try:
+        url = github_constants['base_url'] + github_constants['user_events'].format(username=username)
+        return get_all_pages(url, "User not found", priority, project=project_events)
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with get_user_events - {e}")
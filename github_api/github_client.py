@@ -0,0 +1,200 @@
+import os
+import threading
+from typing import Mapping, NamedTuple
+from cache.response_cache import ResponseCache, create_response_cache
+from github_api.token_pool import PRIORITY_HIGH, RateLimitError, TokenPool, token_pool
+from metrics.metrics import cache_requests, upstream_responses
+from utils.deadline import DeadlineExceeded, current_deadline
+
+client_constants = {
+    'pool_size': int(os.getenv('GITHUB_POOL_SIZE', 20)),
+    'connect_timeout': float(os.getenv('GITHUB_CONNECT_TIMEOUT', 3.05)),
+    'read_timeout': float(os.getenv('GITHUB_READ_TIMEOUT', 10)),
+    'max_retries': int(os.getenv('GITHUB_MAX_RETRIES', 3)),
+    'backoff_factor': float(os.getenv('GITHUB_BACKOFF_FACTOR', 0.3)),
+    'retry_statuses': (500, 502, 503, 504),
+    'user_agent': 'Github-Stats-wy',
+}
+
+
+class GithubResponse(NamedTuple):
+    """
+    A GitHub API response with its body parsed once.
+
+    The body may be shared with the response cache, so callers must not mutate it.
+    """
+    status_code: int
+    body: object
+    headers: Mapping
+    from_cache: bool = False
+
+
+class GithubClient:
+    """
+    Shared HTTP client for the GitHub API.
+
+    Keeps a pooled, keep-alive session so consecutive calls reuse the same TCP+TLS connections,
+    applies a connect/read timeout to every request and retries 5xx responses with exponential backoff.
+
+    requests is only imported, and the session only created, by the first call: a cold process that serves its
+    cards from the caches never pays for it.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = client_constants['pool_size'],
+            connect_timeout: float = client_constants['connect_timeout'],
+            read_timeout: float = client_constants['read_timeout'],
+            max_retries: int = client_constants['max_retries'],
+            backoff_factor: float = client_constants['backoff_factor'],
+            response_cache: ResponseCache = None,
+            token_pool: TokenPool = token_pool
+            ):
+        """
+        Args:
+            pool_size (int): The maximum number of pooled connections kept per host.
+            connect_timeout (float): Seconds to wait for a connection to be established.
+            read_timeout (float): Seconds to wait for the server to send data.
+            max_retries (int): The number of retries for failed connections and 5xx responses.
+            backoff_factor (float): The exponential backoff factor between retries.
+            response_cache (ResponseCache): Optional cache used to send conditional requests.
+            token_pool (TokenPool): The pool of tokens requests are authenticated with.
+        """
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.response_cache = response_cache
+        self.token_pool = token_pool
+        self.session = None
+        self.session_lock = threading.Lock()
+
+    def get_session(self):
+        """
+        Returns the pooled session, creating it on first use.
+        """
+        if self.session is not None:
+            return self.session
+
+        with self.session_lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from github_api.deadline_retry import DeadlineRetry
+
+                retry = DeadlineRetry(
+                    total=self.max_retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=client_constants['retry_statuses'],
+                    allowed_methods=frozenset(['GET']),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retry)
+
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({
+                    'Accept': 'application/vnd.github+json',
+                    'User-Agent': client_constants['user_agent'],
+                })
+                self.session = session
+
+        return self.session
+
+    def get(self, url: str, params: dict = None, headers: dict = None, timeout: tuple = None) -> 'requests.Response':
+        """
+        Sends a GET request through the pooled session.
+
+        Args:
+            url (str): The absolute URL to request.
+            params (dict): Optional query string parameters.
+            headers (dict): Optional request headers.
+            timeout (tuple): Optional (connect, read) timeout, defaults to the client timeout.
+
+        Returns:
+            requests.Response: The response of the request.
+        """
+        return self.get_session().get(url, params=params, headers=headers, timeout=timeout or self.timeout)
+
+    def get_json(self, url: str, params: dict = None, priority: str = PRIORITY_HIGH, project=None) -> GithubResponse:
+        """
+        Sends an authenticated GET request and parses the JSON body once.
+
+        The request is sent with the token of the pool that has the most budget left, and retried with another token
+        when it is rejected by the rate limit. When a response cache is configured, the stored ETag/Last-Modified
+        validators stored for the URL and the token are sent along and a 304 answer is served from the stored body.
+        Within a request deadline, the timeouts are capped to the time left and no request is sent once it has passed.
+
+        Args:
+            url (str): The absolute URL to request.
+            params (dict): Optional query string parameters.
+            priority (str): PRIORITY_HIGH for user-facing requests, PRIORITY_LOW for work that may be deferred.
+            project (callable): Optional projection applied to the body before it is returned or cached, so only
+                                the projected body is kept in the response cache and a 304 answer returns it as is.
+
+        Returns:
+            GithubResponse: The status code, parsed body and headers of the response.
+
+        Raises:
+            RateLimitError: If every token is out of budget.
+            DeadlineExceeded: If the request deadline passes before the response arrives.
+        """
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        request_url = requests.Request('GET', url, params=params).prepare().url
+        deadline = current_deadline()
+
+        for _ in self.token_pool.states:
+            if deadline is not None:
+                deadline.check()
+
+            state = self.token_pool.acquire(priority)
+
+            key = f'{state.identity}:{request_url}'
+            cached = self.response_cache.get(key, project) if self.response_cache is not None else None
+            conditional_headers = self.response_cache.conditional_headers(cached) if self.response_cache is not None else {}
+
+            try:
+                response = self.get(
+                    request_url, headers={**state.authorization(), **conditional_headers},
+                    timeout=deadline.timeout(self.timeout) if deadline is not None else None
+                )
+            except requests.RequestException:
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceeded()
+                raise
+
+            upstream_responses.inc(status=response.status_code)
+            self.token_pool.update(state, response.headers)
+
+            if not self.token_pool.is_rate_limited(response.status_code, response.headers):
+                break
+
+            self.token_pool.mark_exhausted(state, response.headers)
+        else:
+            raise RateLimitError(min(candidate.reset_at for candidate in self.token_pool.states))
+
+        if self.response_cache is not None:
+            cache_requests.inc(cache='github_response', result='hit' if response.status_code == 304 else 'miss')
+
+        if response.status_code == 304 and cached is not None:
+            headers = CaseInsensitiveDict(response.headers)
+            if cached.get('link') is not None:
+                headers['Link'] = cached['link']
+            return GithubResponse(200, cached['body'], headers, from_cache=True)
+
+        body = response.json() if response.status_code == 200 else None
+
+        if body is not None and project is not None:
+            body = project(body)
+
+        if response.status_code == 200 and self.response_cache is not None:
+            self.response_cache.store(key, body, response.headers)
+
+        return GithubResponse(response.status_code, body, response.headers)
+
+
+github_client = GithubClient(response_cache=create_response_cache())
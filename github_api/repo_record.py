@@ -0,0 +1,63 @@
+import sys
+import time
+from typing import NamedTuple
+
+
+class RepoRecord(NamedTuple):
+    """
+    Compact projection of a GitHub repository, keeping only the fields the cards use.
+
+    The raw API object carries about a hundred fields, nested owner objects and dozens of URLs; a RepoRecord is a
+    plain tuple with interned language names.
+    """
+    id: int
+    full_name: str
+    language: str
+    fork: bool
+    stargazers_count: int
+    forks_count: int
+    pushed_at: str
+    private: bool = False
+
+
+def project_repo(repo) -> RepoRecord:
+    """
+    Projects a repository into a RepoRecord.
+
+    Args:
+        repo: A raw repository object from the GitHub API or a webhook payload, an existing RepoRecord, or its
+              serialized field list. Field lists stored before the private flag was added count as public.
+
+    Returns:
+        RepoRecord: The compact record.
+    """
+    if isinstance(repo, RepoRecord):
+        return repo
+
+    if isinstance(repo, (list, tuple)):
+        return RepoRecord(*repo)
+
+    language = repo.get('language')
+    pushed_at = repo.get('pushed_at')
+
+    # Push webhook payloads carry timestamps as Unix seconds instead of ISO 8601 strings.
+    if isinstance(pushed_at, (int, float)):
+        pushed_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(pushed_at))
+
+    return RepoRecord(
+        repo['id'],
+        repo['full_name'],
+        sys.intern(language) if language else None,
+        bool(repo.get('fork')),
+        repo.get('stargazers_count', 0),
+        repo.get('forks_count', 0),
+        pushed_at,
+        bool(repo.get('private')),
+    )
+
+
+def project_repos(repos: list) -> list:
+    """
+    Projects a list of repositories into RepoRecords.
+    """
+    return [project_repo(repo) for repo in repos]
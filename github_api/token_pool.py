@@ -0,0 +1,204 @@
+import hashlib
+import os
+import threading
+import time
+from metrics.metrics import registry
+
+token_pool_constants = {
+    'tokens': [token.strip() for token in os.getenv('GITHUB_TOKENS', '').split(',') if token.strip()],
+    'low_priority_reserve': float(os.getenv('GITHUB_LOW_PRIORITY_RESERVE', 0.1)),
+    'max_defer': float(os.getenv('GITHUB_MAX_DEFER', 300)),
+    'authenticated_limit': 5000,
+    'unauthenticated_limit': 60,
+}
+
+PRIORITY_HIGH = 'high'
+PRIORITY_LOW = 'low'
+
+
+class RateLimitError(Exception):
+    """
+    Raised when no token has rate-limit budget left for a request.
+    """
+
+    def __init__(self, reset_at: float):
+        self.reset_at = reset_at
+        super().__init__(f"GitHub API rate limit exceeded, resets in {max(0, int(reset_at - time.time()))}s")
+
+
+class TokenState:
+    """
+    The rate-limit budget of one token, as last reported by the GitHub API.
+    """
+
+    def __init__(self, name: str, token: str, limit: int):
+        self.name = name
+        self.token = token
+        self.limit = limit
+        self.remaining = limit
+        self.reset_at = 0.0
+        # ETags vary with the Authorization header, so cached responses are keyed by the token that fetched them.
+        # A digest identifies the token without exposing it, e.g. in a shared cache.
+        self.identity = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16] if token else 'anonymous'
+
+    def authorization(self) -> dict:
+        return {'Authorization': f'Bearer {self.token}'} if self.token else {}
+
+
+class TokenPool:
+    """
+    Rotates requests across a pool of GitHub tokens, tracking each token's budget from the X-RateLimit-* headers.
+
+    High priority requests (user-facing renders) use any remaining budget. Low priority requests (background
+    refreshes, batch warming) keep a reserve untouched and are deferred until a token resets when only the reserve is left.
+    Without tokens the pool holds one anonymous entry with the unauthenticated budget.
+    """
+
+    def __init__(
+            self,
+            tokens: list = token_pool_constants['tokens'],
+            low_priority_reserve: float = token_pool_constants['low_priority_reserve'],
+            max_defer: float = token_pool_constants['max_defer']
+            ):
+        """
+        Args:
+            tokens (list): The GitHub tokens to rotate across.
+            low_priority_reserve (float): The fraction of each token's limit kept for high priority requests.
+            max_defer (float): The maximum number of seconds a low priority request waits for budget.
+        """
+        if tokens:
+            self.states = [
+                TokenState(f'token-{i}', token, token_pool_constants['authenticated_limit']) for i, token in enumerate(tokens)
+            ]
+        else:
+            self.states = [TokenState('anonymous', None, token_pool_constants['unauthenticated_limit'])]
+
+        self.low_priority_reserve = low_priority_reserve
+        self.max_defer = max_defer
+        self.condition = threading.Condition()
+        self.deferred = 0
+        self.rejected = 0
+
+    def acquire(self, priority: str = PRIORITY_HIGH) -> TokenState:
+        """
+        Picks the token with the most remaining budget and reserves one request on it.
+
+        Args:
+            priority (str): PRIORITY_HIGH or PRIORITY_LOW.
+
+        Returns:
+            TokenState: The token to send the request with.
+
+        Raises:
+            RateLimitError: If no budget is available, after waiting up to max_defer seconds for low priority requests.
+        """
+        deadline = time.time() + self.max_defer
+        counted_deferral = False
+
+        with self.condition:
+            while True:
+                now = time.time()
+
+                for state in self.states:
+                    if state.reset_at and state.reset_at <= now:
+                        state.remaining = state.limit
+                        state.reset_at = 0.0
+
+                state = max(self.states, key=lambda candidate: candidate.remaining)
+                reserve = state.limit * self.low_priority_reserve if priority == PRIORITY_LOW else 0
+
+                if state.remaining > reserve:
+                    state.remaining -= 1
+                    return state
+
+                reset_at = min((candidate.reset_at for candidate in self.states if candidate.reset_at), default=now)
+
+                if priority != PRIORITY_LOW or reset_at > deadline:
+                    self.rejected += 1
+                    raise RateLimitError(reset_at)
+
+                if not counted_deferral:
+                    self.deferred += 1
+                    counted_deferral = True
+
+                self.condition.wait(timeout=max(reset_at - now, 0.05))
+
+    def update(self, state: TokenState, headers) -> None:
+        """
+        Records the budget reported by the X-RateLimit-* headers of a response sent with the token.
+
+        Args:
+            state (TokenState): The token the request was sent with.
+            headers: The response headers.
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+
+        if remaining is None:
+            return
+
+        with self.condition:
+            state.limit = int(headers.get('X-RateLimit-Limit', state.limit))
+            state.remaining = int(remaining)
+            state.reset_at = float(headers.get('X-RateLimit-Reset', state.reset_at))
+            self.condition.notify_all()
+
+    def mark_exhausted(self, state: TokenState, headers) -> None:
+        """
+        Marks a token as out of budget after a rate-limit rejection, honouring Retry-After when present.
+        """
+        with self.condition:
+            state.remaining = 0
+            retry_after = headers.get('Retry-After')
+            if retry_after is not None:
+                state.reset_at = max(state.reset_at, time.time() + float(retry_after))
+            elif not state.reset_at:
+                state.reset_at = time.time() + 60
+
+    def is_rate_limited(self, status_code: int, headers) -> bool:
+        """
+        Tells a rate-limit rejection apart from other 403/429 responses.
+        """
+        return status_code in (403, 429) and (
+            headers.get('X-RateLimit-Remaining') == '0' or headers.get('Retry-After') is not None
+        )
+
+    def metrics(self) -> dict:
+        """
+        Returns:
+            dict: The budget of each token and the number of deferred and rejected requests.
+        """
+        now = time.time()
+
+        with self.condition:
+            return {
+                'tokens': {
+                    state.name: {
+                        'limit': state.limit,
+                        'remaining': state.remaining,
+                        'reset_in': max(0.0, state.reset_at - now) if state.reset_at else 0.0,
+                    }
+                    for state in self.states
+                },
+                'deferred': self.deferred,
+                'rejected': self.rejected,
+            }
+
+
+token_pool = TokenPool()
+
+rate_limit_remaining = registry.gauge('github_stats_rate_limit_remaining', 'Remaining GitHub API budget of each token.')
+rate_limit_reset = registry.gauge('github_stats_rate_limit_reset_seconds', 'Seconds until the budget of each token resets.')
+rate_limit_deferred = registry.gauge('github_stats_rate_limit_deferred', 'Low priority requests deferred for lack of budget.')
+rate_limit_rejected = registry.gauge('github_stats_rate_limit_rejected', 'Requests rejected for lack of budget.')
+
+
+def collect_token_pool_metrics() -> None:
+    pool_metrics = token_pool.metrics()
+    for name, state in pool_metrics['tokens'].items():
+        rate_limit_remaining.set(state['remaining'], token=name)
+        rate_limit_reset.set(state['reset_in'], token=name)
+    rate_limit_deferred.set(pool_metrics['deferred'])
+    rate_limit_rejected.set(pool_metrics['rejected'])
+
+
+registry.register_collector(collect_token_pool_metrics)
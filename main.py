@@ -1,5 +1,12 @@
 import os
+import time
+
+started = time.perf_counter()
+
 from app.app import app
+from metrics.metrics import import_seconds
+
+import_seconds.set(time.perf_counter() - started, entrypoint='main')
 
 if __name__ == '__main__':
     try:
@@ -0,0 +1,187 @@
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+metrics_constants = {
+    'latency_buckets': (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    'size_buckets': (512, 1024, 2048, 4096, 8192, 16384, 32768, 65536),
+}
+
+
+def format_labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{str(value)}"' for name, value in labels) + '}'
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """
+    Monotonic counter, optionally split by labels.
+    """
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> list:
+        with self.lock:
+            return [f'{self.name}{format_labels(key)} {format_value(value)}' for key, value in self.values.items()]
+
+
+class Gauge(Counter):
+    """
+    Value that can go up and down, optionally split by labels.
+    """
+
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = value
+
+
+class Histogram:
+    """
+    Distribution of observed values over fixed buckets, optionally split by labels.
+    """
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, help_text: str, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect_left(self.buckets, value)
+
+        with self.lock:
+            series = self.values.get(key)
+            if series is None:
+                series = self.values[key] = {'buckets': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            series['buckets'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self) -> list:
+        lines = []
+
+        with self.lock:
+            for key, series in self.values.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), series['buckets']):
+                    cumulative += count
+                    lines.append(f'{self.name}_bucket{format_labels(key + (("le", bound),))} {cumulative}')
+                lines.append(f'{self.name}_sum{format_labels(key)} {format_value(series["sum"])}')
+                lines.append(f'{self.name}_count{format_labels(key)} {series["count"]}')
+
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registry of the service metrics, rendered in the Prometheus text exposition format.
+
+    Collectors are callables run right before rendering, used to copy point-in-time state (cache sizes,
+    rate-limit budgets) into gauges.
+    """
+
+    def __init__(self):
+        self.metrics = {}
+        self.collectors = []
+        self.lock = threading.Lock()
+
+    def register(self, metric):
+        with self.lock:
+            return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self.register(Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self.register(Gauge(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: tuple) -> Histogram:
+        return self.register(Histogram(name, help_text, buckets))
+
+    def register_collector(self, collector) -> None:
+        with self.lock:
+            self.collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Returns:
+            str: All metrics in the Prometheus text exposition format.
+        """
+        with self.lock:
+            collectors = list(self.collectors)
+            metrics = list(self.metrics.values())
+
+        for collector in collectors:
+            collector()
+
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.type_name}')
+            lines.extend(metric.render())
+
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+stage_seconds = registry.histogram(
+    'github_stats_stage_seconds', 'Time spent in each stage of the card pipeline.', metrics_constants['latency_buckets']
+)
+stage_errors = registry.counter('github_stats_stage_errors_total', 'Failures raised by each stage of the card pipeline.')
+request_seconds = registry.histogram(
+    'github_stats_request_seconds', 'Latency of the HTTP routes.', metrics_constants['latency_buckets']
+)
+svg_bytes = registry.histogram('github_stats_svg_bytes', 'Size of the served SVG bodies.', metrics_constants['size_buckets'])
+cache_requests = registry.counter('github_stats_cache_requests_total', 'Cache lookups by cache and result.')
+upstream_responses = registry.counter('github_stats_upstream_responses_total', 'GitHub API responses by status code.')
+import_seconds = registry.gauge('github_stats_import_seconds', 'Time spent importing the application at startup, by entry point.')
+degraded_responses = registry.counter(
+    'github_stats_degraded_responses_total', 'Cards served from partial data or as a placeholder, by route and reason.'
+)
+
+
+def timed(stage: str):
+    """
+    Decorator recording the duration and failures of a pipeline stage.
+
+    Args:
+        stage (str): The name of the stage, used as the `stage` label.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            except Exception:
+                stage_errors.inc(stage=stage)
+                raise
+            finally:
+                stage_seconds.observe(time.perf_counter() - started, stage=stage)
+        return wrapper
+    return decorator
@@ -0,0 +1,102 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter as StackCounter
+from contextlib import contextmanager
+
+profiler_constants = {
+    'slow_request_seconds': float(os.getenv('SLOW_REQUEST_PROFILE_MS', 0)) / 1000,
+    'interval': float(os.getenv('SLOW_REQUEST_PROFILE_INTERVAL_MS', 5)) / 1000,
+    'top_stacks': 10,
+    'stack_depth': 12,
+}
+
+logger = logging.getLogger(__name__)
+
+
+class SlowRequestProfiler:
+    """
+    Opt-in sampling profiler for slow requests.
+
+    While enabled, a single background thread samples the stack of every thread currently inside profile() at a fixed
+    interval. When a request turns out slower than the threshold, its most frequent stacks are logged; faster
+    requests just drop their samples. Disabled (threshold 0) it costs nothing.
+    """
+
+    def __init__(
+            self,
+            slow_request_seconds: float = profiler_constants['slow_request_seconds'],
+            interval: float = profiler_constants['interval']
+            ):
+        """
+        Args:
+            slow_request_seconds (float): Requests slower than this are reported, 0 disables the profiler.
+            interval (float): Seconds between two samples.
+        """
+        self.slow_request_seconds = slow_request_seconds
+        self.interval = interval
+        self.active = {}
+        self.lock = threading.Lock()
+        self.sampler = None
+
+    @contextmanager
+    def profile(self, name: str):
+        """
+        Samples the calling thread while the block runs and logs its hottest stacks if the block is slow.
+
+        Args:
+            name (str): The name of the profiled request, used in the report.
+        """
+        if self.slow_request_seconds <= 0:
+            yield
+            return
+
+        thread_id = threading.get_ident()
+        samples = StackCounter()
+
+        with self.lock:
+            self.active[thread_id] = samples
+            if self.sampler is None:
+                self.sampler = threading.Thread(target=self._sample, name='slow-request-profiler', daemon=True)
+                self.sampler.start()
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self.active.pop(thread_id, None)
+
+            if elapsed >= self.slow_request_seconds:
+                self.report(name, elapsed, samples)
+
+    def _sample(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+
+            with self.lock:
+                for thread_id, samples in self.active.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        samples[self.format_stack(frame)] += 1
+
+    def format_stack(self, frame) -> str:
+        stack = []
+        while frame is not None and len(stack) < profiler_constants['stack_depth']:
+            stack.append(f'{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})')
+            frame = frame.f_back
+        return ' <- '.join(stack)
+
+    def report(self, name: str, elapsed: float, samples: StackCounter) -> None:
+        total = sum(samples.values())
+        lines = [f'Slow request {name} took {elapsed * 1000:.1f}ms ({total} samples)']
+        for stack, count in samples.most_common(profiler_constants['top_stacks']):
+            lines.append(f'  {count / total * 100:5.1f}% {stack}')
+        logger.warning('\n'.join(lines))
+
+
+request_profiler = SlowRequestProfiler()
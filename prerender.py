@@ -0,0 +1,229 @@
+import argparse
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import parse_qsl
+from werkzeug.datastructures import MultiDict
+from cache.shared_cache import shared_backend
+from cache.svg_cache import svg_cache, svg_cache_key
+from factory.chart_factory import charts_factory
+from github_api.github_api import get_user_repos
+from github_api.token_pool import PRIORITY_LOW
+from services.lang_service import user_langs_cache
+from stats_calculator.langs_aggregate import LanguageAggregate
+from utils.utils import extract_chart_kwargs
+
+prerender_constants = {
+    'default_variants': ['bar', 'pie', 'donut'],
+    'workers': 8,
+    'users_per_second': 5.0,
+    'stages': ('fetch', 'stats', 'render', 'write'),
+}
+
+
+class RateBudget:
+    """
+    Token bucket that spaces out upstream fetches so a batch run stays within a rate-limit budget.
+    """
+
+    def __init__(self, per_second: float):
+        """
+        Args:
+            per_second (float): The number of fetches allowed per second, 0 disables the limit.
+        """
+        self.interval = 1 / per_second if per_second > 0 else 0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class StageTimings:
+    """
+    Thread-safe accumulator of the time spent in each stage of a batch run.
+    """
+
+    def __init__(self, stages: tuple):
+        self.totals = {stage: 0.0 for stage in stages}
+        self.counts = {stage: 0 for stage in stages}
+        self.lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float, count: int = 1) -> None:
+        with self.lock:
+            self.totals[stage] += seconds
+            self.counts[stage] += count
+
+    def report(self) -> list:
+        """
+        Returns:
+            list: One formatted line per stage with its total and mean time.
+        """
+        lines = []
+        for stage, total in self.totals.items():
+            count = self.counts[stage]
+            mean = total / count * 1000 if count else 0
+            lines.append(f"  {stage:<7} total {total:8.3f}s  mean {mean:8.3f}ms  ({count} ops)")
+        return lines
+
+
+def parse_users_file(path: str, default_variants: list) -> list:
+    """
+    Reads the users file. Each non-empty line holds a username optionally followed by chart variants,
+    e.g. `octocat bar donut?hole_radius_percentage=60`. Lines starting with '#' are ignored.
+
+    Args:
+        path (str): The path of the users file.
+        default_variants (list): The variants used for lines without variants.
+
+    Returns:
+        list: The (username, variants) pair of each line.
+    """
+    jobs = []
+
+    with open(path, encoding='utf-8') as users_file:
+        for line in users_file:
+            fields = line.split('#', 1)[0].split()
+            if fields:
+                jobs.append((fields[0], fields[1:] or default_variants))
+
+    return jobs
+
+
+def parse_variant(variant: str) -> tuple:
+    """
+    Splits a variant such as `donut?hole_radius_percentage=60` into its chart type and query parameters.
+
+    Returns:
+        tuple: The chart type, the query string and the query parameters as a MultiDict.
+    """
+    chart_type, _, query = variant.partition('?')
+    return chart_type, query, MultiDict(parse_qsl(query))
+
+
+def get_variant_path(out_dir: str, username: str, chart_type: str, query: str) -> str:
+    suffix = f"-{re.sub(r'[^A-Za-z0-9_.=-]', '_', query)}" if query else ''
+    return os.path.join(out_dir, username, f"{chart_type}{suffix}.svg")
+
+
+def prerender_user(username: str, variants: list, args, budget: RateBudget, timings: StageTimings) -> tuple:
+    """
+    Fetches the repositories of one user, calculates the stats once and renders every requested variant.
+
+    Returns:
+        tuple: The number of SVGs and bytes written.
+    """
+    budget.acquire()
+
+    started = time.perf_counter()
+    repos = get_user_repos(username, priority=PRIORITY_LOW)
+    timings.add('fetch', time.perf_counter() - started)
+
+    started = time.perf_counter()
+    aggregate = LanguageAggregate.from_repos(repos)
+    lang_stats = aggregate.to_lang_stats()
+    timings.add('stats', time.perf_counter() - started)
+
+    parsed_variants = [parse_variant(variant) for variant in variants]
+    chart_variants = [
+        (chart_type, extract_chart_kwargs(query_params, chart_type)) for chart_type, _, query_params in parsed_variants
+    ]
+
+    started = time.perf_counter()
+    svgs = charts_factory(username, lang_stats, chart_variants)
+    timings.add('render', time.perf_counter() - started, len(svgs))
+
+    started = time.perf_counter()
+    written_bytes = 0
+
+    if args.cache:
+        user_langs_cache.store(username.lower(), aggregate)
+        fingerprint = aggregate.fingerprint()
+
+    for (chart_type, query, _), (_, chart_kwargs), svg in zip(parsed_variants, chart_variants, svgs):
+        if args.cache:
+            written_bytes += len(svg_cache.set(svg_cache_key(username, chart_type, chart_kwargs, fingerprint), svg).body)
+
+        if args.out_dir:
+            path = get_variant_path(args.out_dir, username, chart_type, query)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as svg_file:
+                written_bytes += svg_file.write(svg)
+
+    timings.add('write', time.perf_counter() - started, len(svgs))
+
+    return len(svgs), written_bytes
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Pre-render language cards for a list of GitHub users.')
+    parser.add_argument('users_file', help='File with one username per line, optionally followed by chart variants.')
+    parser.add_argument('--variant', action='append', dest='variants',
+                        help='Default chart variant, e.g. bar or donut?hole_radius_percentage=60. Repeatable.')
+    parser.add_argument('--out-dir', help='Directory the SVGs are written to, as <out-dir>/<username>/<variant>.svg.')
+    parser.add_argument('--cache', action='store_true',
+                        help='Store the language stats and SVGs in the shared cache read by the server, '
+                             'requires SHARED_CACHE_URL.')
+    parser.add_argument('--workers', type=int, default=prerender_constants['workers'],
+                        help='Number of users processed concurrently.')
+    parser.add_argument('--users-per-second', type=float, default=prerender_constants['users_per_second'],
+                        help='Upper bound of user fetches started per second, 0 for no limit.')
+
+    args = parser.parse_args(argv)
+
+    if not args.out_dir and not args.cache:
+        parser.error('at least one of --out-dir or --cache is required')
+
+    # The in-memory caches of this process are gone once it exits, only the shared tier outlives the run.
+    if args.cache and shared_backend is None:
+        parser.error('--cache requires a shared cache, set SHARED_CACHE_URL to the one the server uses')
+
+    return args
+
+
+def main(argv: list = None) -> int:
+    args = parse_args(argv)
+    jobs = parse_users_file(args.users_file, args.variants or prerender_constants['default_variants'])
+
+    budget = RateBudget(args.users_per_second)
+    timings = StageTimings(prerender_constants['stages'])
+    rendered, written_bytes, failed = 0, 0, 0
+
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(prerender_user, username, variants, args, budget, timings): username
+            for username, variants in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                user_rendered, user_bytes = future.result()
+                rendered += user_rendered
+                written_bytes += user_bytes
+            except Exception as e:
+                failed += 1
+                print(f"{futures[future]}: {e}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+
+    print(f"Users: {len(jobs) - failed} rendered, {failed} failed")
+    print(f"SVGs: {rendered} ({written_bytes} bytes) in {elapsed:.2f}s")
+    print(f"Throughput: {len(jobs) / elapsed:.2f} users/s, {rendered / elapsed:.2f} SVGs/s")
+    print("Stage timings:")
+    print('\n'.join(timings.report()))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
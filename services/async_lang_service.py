@@ -0,0 +1,122 @@
+import asyncio
+import time
+from cache.svg_cache import SvgEntry
+from github_api.async_github_api import async_get_user_repos, async_get_user_repos_pushed_since
+from github_api.token_pool import PRIORITY_HIGH, PRIORITY_LOW
+from services.lang_service import get_stats_cache, lang_service_constants, render_lang_card, user_langs_cache
+from stats_calculator.langs_aggregate import LanguageAggregate
+from utils.deadline import DeadlineExceeded, await_result
+
+async_aggregate_flights = {}
+
+
+async def async_lang_service(username: str, chart_type: str, query_params: dict) -> SvgEntry:
+    """
+    Asynchronous counterpart of lang_service for the ASGI serving path.
+
+    It shares the language aggregate cache and the rendered-SVG cache with lang_service and renders through the same
+    render_lang_card, so both paths produce byte-identical SVGs.
+
+    Args:
+        username (str): The username of the GitHub user.
+        chart_type (str): The type of chart to generate (e.g., 'bar', 'pie', 'donut').
+        query_params (dict): Additional query parameters for customizing the chart.
+
+    Returns:
+        SvgEntry: The generated chart and its ETag.
+
+    Raises:
+        ValueError: If an error occurs during the execution of the async_lang_service function.
+        DeadlineExceeded: If the statistics are not available before the request deadline, see degraded_card.
+    """
+    try:
+        mode = query_params.get('mode', default=lang_service_constants['default_mode'], type=str)
+
+        if mode == 'repos':
+            stats = await async_get_cached_aggregate(username.lower())
+        else:
+            # Byte-weighted stats fan out over a bounded thread pool, so they are read off the event loop.
+            stats = await asyncio.to_thread(get_stats_cache(mode).get, username.lower())
+
+        # Rendering goes through the rendered-SVG cache, which may read the shared tier and compresses new cards.
+        return await asyncio.to_thread(render_lang_card, username, chart_type, query_params, stats)
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with async_lang_service - {e}")
+
+
+async def async_get_cached_aggregate(key: str) -> LanguageAggregate:
+    """
+    Reads the language aggregate of a user from the shared stale-while-revalidate cache without blocking the event loop.
+
+    Fresh values are returned directly, values past the soft TTL are returned while a refresh task runs, and missing
+    or hard-expired values are awaited until the request deadline. A failed or late load falls back to the last good
+    value; a late load keeps running and stores its result for the next request.
+
+    Args:
+        key (str): The lowercased username.
+
+    Returns:
+        LanguageAggregate: The language aggregate of the user.
+    """
+    snapshot = await user_langs_cache.async_peek(key)
+
+    if snapshot is not None:
+        age = time.time() - snapshot.fetched_at
+
+        if age < user_langs_cache.soft_ttl:
+            return snapshot.value
+
+        if age < user_langs_cache.hard_ttl:
+            get_aggregate_flight(key, PRIORITY_LOW)
+            return snapshot.value
+
+    try:
+        return await await_result(asyncio.shield(get_aggregate_flight(key, PRIORITY_HIGH)))
+    except Exception:
+        if snapshot is None:
+            raise
+        return snapshot.value
+
+
+def get_aggregate_flight(key: str, priority: str) -> asyncio.Task:
+    """
+    Returns the in-flight load of a user's language aggregate, starting one if none is running.
+
+    The task stores its result in the shared language aggregate cache, so concurrent misses share one upstream fetch.
+    Background refreshes run at low priority and are kept apart, so a user-facing load never waits on a deferred refresh.
+    """
+    flight_key = (key, priority)
+    task = async_aggregate_flights.get(flight_key)
+
+    if task is None:
+        task = asyncio.ensure_future(async_load_language_aggregate(key, priority))
+        async_aggregate_flights[flight_key] = task
+        task.add_done_callback(lambda finished: finish_aggregate_flight(flight_key, finished))
+
+    return task
+
+
+def finish_aggregate_flight(flight_key: tuple, task: asyncio.Task) -> None:
+    async_aggregate_flights.pop(flight_key, None)
+
+    # Background refreshes have no awaiter, retrieve their error so it is not reported as unhandled.
+    if not task.cancelled():
+        task.exception()
+
+
+async def async_load_language_aggregate(key: str, priority: str) -> LanguageAggregate:
+    """
+    Asynchronous counterpart of load_language_aggregate, storing the result in the shared cache.
+    """
+    snapshot = await user_langs_cache.async_peek(key)
+    aggregate = snapshot.value if snapshot is not None else None
+
+    if aggregate is None or time.time() - aggregate.full_synced_at > lang_service_constants['full_sync_interval']:
+        aggregate = LanguageAggregate.from_repos(await async_get_user_repos(key, priority))
+    else:
+        aggregate.apply(await async_get_user_repos_pushed_since(key, aggregate.last_pushed_at, priority))
+
+    await user_langs_cache.async_store(key, aggregate)
+    return aggregate
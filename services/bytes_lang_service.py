@@ -0,0 +1,95 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from cache.response_cache import LRUResponseBackend
+from cache.shared_cache import create_shared_store
+from github_api.github_api import get_repo_languages, get_user_repos
+from github_api.repo_record import RepoRecord
+from github_api.token_pool import PRIORITY_HIGH, PRIORITY_LOW
+from metrics.metrics import timed
+from services.refresh_worker import StaleWhileRevalidateCache, refresh_constants
+from stats_calculator.bytes_stats_calculator import LanguageBytesStats, calculate_language_bytes_stats
+from utils.deadline import DeadlineExceeded, submit, wait_result
+
+bytes_lang_constants = {
+    'workers': int(os.getenv('REPO_LANGUAGES_WORKERS', 8)),
+    'cache_size': int(os.getenv('REPO_LANGUAGES_CACHE_SIZE', 50000)),
+}
+
+# Languages of a repository only change when it is pushed to, so they are cached by full name and pushed_at.
+repo_languages_cache = LRUResponseBackend(max_entries=bytes_lang_constants['cache_size'])
+repo_languages_executor = ThreadPoolExecutor(
+    max_workers=bytes_lang_constants['workers'], thread_name_prefix='repo-languages'
+)
+
+
+def get_cached_repo_languages(repo: RepoRecord, priority: str = PRIORITY_HIGH) -> dict:
+    """
+    Returns the languages of a repository, fetching them only if the repository was pushed to since the last fetch.
+
+    Args:
+        repo (RepoRecord): The repository.
+        priority (str): The scheduling priority of the request.
+
+    Returns:
+        dict: The number of bytes of each language.
+    """
+    key = f"{repo.full_name}@{repo.pushed_at}"
+    languages = repo_languages_cache.get(key)
+
+    if languages is None:
+        languages = get_repo_languages(repo.full_name, priority)
+        repo_languages_cache.set(key, languages)
+
+    return languages
+
+
+@timed('load_language_bytes')
+def load_language_bytes(key: str, priority: str = PRIORITY_HIGH) -> LanguageBytesStats:
+    """
+    Loads the byte-weighted language statistics of a user.
+
+    The languages of all repositories are fetched in parallel through a bounded worker pool shared by all requests.
+    When the request deadline passes, the fetches not started yet are cancelled and the statistics of the repositories
+    fetched so far are attached to the DeadlineExceeded error.
+
+    Args:
+        key (str): The lowercased username.
+        priority (str): The scheduling priority of the GitHub requests.
+
+    Returns:
+        LanguageBytesStats: The byte-weighted statistics.
+
+    Raises:
+        DeadlineExceeded: If the request deadline passes before the languages of every repository are fetched.
+    """
+    try:
+        repos = get_user_repos(key, priority)
+    except DeadlineExceeded:
+        # Repositories without their languages say nothing about the bytes.
+        raise DeadlineExceeded()
+
+    futures = [submit(repo_languages_executor, get_cached_repo_languages, repo, priority) for repo in repos]
+    repos_languages = []
+
+    try:
+        for future in futures:
+            repos_languages.append(wait_result(future))
+    except DeadlineExceeded:
+        raise DeadlineExceeded(
+            partial=LanguageBytesStats(calculate_language_bytes_stats(repos_languages)) if repos_languages else None
+        )
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return LanguageBytesStats(calculate_language_bytes_stats(repos_languages))
+
+
+user_bytes_cache = StaleWhileRevalidateCache(
+    'user_bytes',
+    load_language_bytes, background_loader=partial(load_language_bytes, priority=PRIORITY_LOW),
+    shared=create_shared_store(
+        'user_bytes', LanguageBytesStats.serialize, LanguageBytesStats.deserialize, refresh_constants['hard_ttl']
+    )
+)
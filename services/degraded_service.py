@@ -0,0 +1,66 @@
+from cache.svg_cache import SvgEntry, build_svg_entry
+from chart_generator.chart_generator import chart_constants
+from chart_generator.degraded_card import add_degraded_marker, generate_placeholder_card
+from chart_generator.profile_card import profile_constants
+from factory.chart_factory import chart_factory
+from metrics.metrics import timed
+from utils.deadline import DeadlineExceeded
+from utils.utils import extract_chart_kwargs
+
+degraded_service_constants = {
+    'timeout_message': "GitHub is slow to answer, refresh in a few seconds.",
+    'max_message_length': 60,
+}
+
+
+def error_message(error: Exception) -> str:
+    """
+    Returns the innermost message of a pipeline error, without the "Something went wrong with ..." prefixes.
+    """
+    message = str(error).rsplit(' - ', 1)[-1]
+    max_length = degraded_service_constants['max_message_length']
+    return message if len(message) <= max_length else f"{message[:max_length - 3]}..."
+
+
+@timed('degraded_card')
+def degraded_card(title: str, chart_type: str, query_params: dict, error: Exception) -> SvgEntry:
+    """
+    Renders the best card available for a request whose card could not be served complete, instead of an error page.
+
+    - The deadline passed with partial statistics, e.g. the first pages of repositories: the card rendered from them,
+      marked 'partial'.
+    - The deadline passed with nothing usable: a placeholder asking to refresh, marked 'loading'. The stats cache keeps
+      loading in the background, so a refresh a few seconds later gets the complete card.
+    - Any other error: a placeholder showing the error, marked 'error'.
+
+    Degraded cards are not cached. Stale statistics are served by the stats caches themselves and never reach here.
+
+    Args:
+        title (str): The name shown in the card title.
+        chart_type (str): The type of chart requested, or 'profile'.
+        query_params (dict): The query parameters customizing the card.
+        error (Exception): The error raised by the service.
+
+    Returns:
+        SvgEntry: The degraded card, with the reason in its `degraded` field.
+    """
+    try:
+        chart_kwargs = extract_chart_kwargs(query_params, chart_type)
+    except ValueError:
+        chart_kwargs = {}
+
+    if isinstance(error, DeadlineExceeded) and error.partial is not None:
+        try:
+            svg = chart_factory(title, error.partial.to_lang_stats(), chart_type, chart_kwargs)
+            return build_svg_entry(add_degraded_marker(svg, 'partial'), 'partial')
+        except ValueError:
+            pass
+
+    if isinstance(error, DeadlineExceeded):
+        reason, message = 'loading', degraded_service_constants['timeout_message']
+    else:
+        reason, message = 'error', error_message(error)
+
+    title_suffix = profile_constants['title_suffix'] if chart_type == 'profile' else chart_constants['title_suffix']
+
+    return build_svg_entry(generate_placeholder_card(title, title_suffix, message, reason, chart_kwargs), reason)
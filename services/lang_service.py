@@ -1,33 +1,145 @@
+import os
+import time
+from functools import partial
+from cache.shared_cache import create_shared_store
+from cache.svg_cache import SvgEntry, svg_cache, svg_cache_key
 from factory.chart_factory import chart_factory
-from github_api.github_api import get_user_repos
-from stats_calculator.langs_stats_calculator import calculate_language_stats
+from github_api.github_api import get_user_repos, get_user_repos_pushed_since
+from github_api.token_pool import PRIORITY_HIGH, PRIORITY_LOW
+from metrics.metrics import timed
+from services.bytes_lang_service import user_bytes_cache
+from services.refresh_worker import StaleWhileRevalidateCache, refresh_constants
+from stats_calculator.langs_aggregate import LanguageAggregate
+from utils.deadline import DeadlineExceeded
 from utils.utils import extract_chart_kwargs
 
+lang_service_constants = {
+    'full_sync_interval': int(os.getenv('REPOS_FULL_SYNC_INTERVAL', 6 * 3600)),
+    'default_mode': 'repos',
+}
 
-def lang_service(username: str, chart_type: str, query_params: dict) -> str:
+
+@timed('load_language_aggregate')
+def load_language_aggregate(key: str, priority: str = PRIORITY_HIGH) -> LanguageAggregate:
+    """
+    Loads the language aggregate of a user, incrementally when a previous aggregate is cached.
+
+    A previous aggregate is updated with the repositories pushed to since its last sync. A full fetch is done for new
+    users and once the last full sync is older than the full sync interval, which also drops deleted repositories.
+    A full fetch cut short by the request deadline raises DeadlineExceeded with the aggregate of the pages fetched.
+
+    Args:
+        key (str): The lowercased username.
+        priority (str): The scheduling priority of the GitHub requests.
+
+    Returns:
+        LanguageAggregate: The up to date aggregate.
+    """
+    snapshot = user_langs_cache.peek(key)
+    aggregate = snapshot.value if snapshot is not None else None
+
+    if aggregate is None or time.time() - aggregate.full_synced_at > lang_service_constants['full_sync_interval']:
+        try:
+            return LanguageAggregate.from_repos(get_user_repos(key, priority))
+        except DeadlineExceeded as e:
+            raise DeadlineExceeded(partial=LanguageAggregate.from_repos(e.partial) if e.partial else None)
+
+    aggregate.apply(get_user_repos_pushed_since(key, aggregate.last_pushed_at, priority))
+    return aggregate
+
+
+user_langs_cache = StaleWhileRevalidateCache(
+    'user_langs',
+    load_language_aggregate, background_loader=partial(load_language_aggregate, priority=PRIORITY_LOW),
+    shared=create_shared_store(
+        'user_langs', LanguageAggregate.serialize, LanguageAggregate.deserialize, refresh_constants['hard_ttl']
+    )
+)
+
+
+@timed('lang_service')
+def lang_service(username: str, chart_type: str, query_params: dict) -> SvgEntry:
     """
     Retrieves the language statistics for a given user's repositories and generates a chart based on the specified chart type.
 
+    The `mode` query parameter selects the statistics: 'repos' (default) counts the repositories per primary language,
+    'bytes' weights every language by the bytes of code reported by the per-repository languages endpoint.
+    The language statistics are served stale-while-revalidate: a cached aggregate is returned immediately and
+    refreshed in the background at low priority once it is older than the soft TTL, and it keeps being served while
+    GitHub fails. Concurrent requests for the same user share one upstream fetch.
+
     Args:
         username (str): The username of the GitHub user.
         chart_type (str): The type of chart to generate (e.g., 'bar', 'pie', 'donut').
         query_params (dict): Additional query parameters for customizing the chart.
 
     Returns:
-        str: The generated chart as a string.
+        SvgEntry: The generated chart and its ETag.
 
     Raises:
         ValueError: If an error occurs during the execution of the lang_service function.
+        DeadlineExceeded: If the statistics are not available before the request deadline, see degraded_card.
     """
     try:
-        repos = get_user_repos(username)
-        lang_stats = calculate_language_stats(repos)
+        mode = query_params.get('mode', default=lang_service_constants['default_mode'], type=str)
+        return render_lang_card(username, chart_type, query_params, get_stats_cache(mode).get(username.lower()))
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with lang_service - {e}")
+
 
-        if 'error_message' in lang_stats:
-            raise Exception(lang_stats['error_message'])
+def get_stats_cache(mode: str) -> StaleWhileRevalidateCache:
+    """
+    Returns the statistics cache of a stats mode.
+
+    Args:
+        mode (str): 'repos' or 'bytes'.
+
+    Returns:
+        StaleWhileRevalidateCache: The cache holding the statistics of each user in that mode.
 
+    Raises:
+        ValueError: If an invalid mode is provided.
+    """
+    if mode == 'repos':
+        return user_langs_cache
+    if mode == 'bytes':
+        return user_bytes_cache
+    raise ValueError("Invalid stats mode provided.")
+
+
+@timed('render_lang_card')
+def render_lang_card(username: str, chart_type: str, query_params: dict, stats) -> SvgEntry:
+    """
+    Renders the language card of a user from their language statistics, going through the rendered-SVG cache.
+
+    Rendered charts are cached by username, chart type, normalized chart options and the fingerprint of the statistics,
+    so repeated requests for an unchanged card skip the renderer.
+
+    Args:
+        username (str): The username of the GitHub user.
+        chart_type (str): The type of chart to generate (e.g., 'bar', 'pie', 'donut').
+        query_params (dict): Additional query parameters for customizing the chart.
+        stats (LanguageAggregate | LanguageBytesStats): The language statistics of the user.
+
+    Returns:
+        SvgEntry: The generated chart and its ETag.
+
+    Raises:
+        ValueError: If an error occurs while rendering the card.
+    """
+    try:
         chart_kwargs = extract_chart_kwargs(query_params, chart_type)
-        
-        return chart_factory(username, lang_stats, chart_type, chart_kwargs)
+
+        cache_key = svg_cache_key(username, chart_type, chart_kwargs, stats.fingerprint())
+        cached_entry = svg_cache.get(cache_key)
+
+        if cached_entry is not None:
+            return cached_entry
+
+        lang_stats = stats.to_lang_stats()
+
+        return svg_cache.set(cache_key, chart_factory(username, lang_stats, chart_type, chart_kwargs))
     except Exception as e:
-        raise ValueError(f"Error: Something went wrong with lang_service - {e}")
\ No newline at end of file
+        raise ValueError(f"Error: Something went wrong with render_lang_card - {e}")
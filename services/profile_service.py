@@ -0,0 +1,102 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from cache.shared_cache import create_shared_store
+from cache.svg_cache import SvgEntry, svg_cache, svg_cache_key
+from chart_generator.profile_card import generate_profile_card
+from github_api.github_api import get_user_events, get_user_info, get_user_repos
+from github_api.token_pool import PRIORITY_HIGH, PRIORITY_LOW
+from metrics.metrics import timed
+from services.refresh_worker import StaleWhileRevalidateCache, refresh_constants
+from stats_calculator.profile_stats_calculator import ProfileStats
+from utils.deadline import DeadlineExceeded, submit, wait_result
+from utils.utils import extract_chart_kwargs
+
+profile_service_constants = {
+    'fetch_workers': int(os.getenv('PROFILE_FETCH_WORKERS', 12)),
+}
+
+profile_fetch_executor = ThreadPoolExecutor(
+    max_workers=profile_service_constants['fetch_workers'], thread_name_prefix='profile-fetch'
+)
+
+
+@timed('load_profile_stats')
+def load_profile_stats(key: str, priority: str = PRIORITY_HIGH) -> ProfileStats:
+    """
+    Loads the profile statistics of a user.
+
+    The user info, the repositories and the events are fetched concurrently, each of them paginated concurrently,
+    so a cold profile costs the slowest of the three fetches instead of their sum.
+
+    Args:
+        key (str): The lowercased username.
+        priority (str): The scheduling priority of the GitHub requests.
+
+    Returns:
+        ProfileStats: The statistics of the user.
+
+    Raises:
+        DeadlineExceeded: If the request deadline passes first. Totals over part of the sources would be misleading,
+                          so no partial statistics are attached.
+    """
+    futures = [
+        submit(profile_fetch_executor, get_user_info, key, priority),
+        submit(profile_fetch_executor, get_user_repos, key, priority, allow_empty=True),
+        submit(profile_fetch_executor, get_user_events, key, priority),
+    ]
+
+    try:
+        user_info, repos, events = (wait_result(future) for future in futures)
+    except DeadlineExceeded:
+        raise DeadlineExceeded()
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return ProfileStats.from_sources(user_info, repos, events)
+
+
+user_profile_cache = StaleWhileRevalidateCache(
+    'user_profile',
+    load_profile_stats, background_loader=partial(load_profile_stats, priority=PRIORITY_LOW),
+    shared=create_shared_store(
+        'user_profile', ProfileStats.serialize, ProfileStats.deserialize, refresh_constants['hard_ttl']
+    )
+)
+
+
+@timed('profile_service')
+def profile_service(username: str, query_params: dict) -> SvgEntry:
+    """
+    Generates the profile card of a user: stars, forks, followers and their recent commits, pull requests and issues.
+
+    The statistics are served stale-while-revalidate like the language statistics, and the rendered card goes through
+    the same rendered-SVG cache, keyed by the fingerprint of the statistics.
+
+    Args:
+        username (str): The username of the GitHub user.
+        query_params (dict): Additional query parameters for customizing the card.
+
+    Returns:
+        SvgEntry: The generated card and its ETag.
+
+    Raises:
+        ValueError: If an error occurs during the execution of the profile_service function.
+        DeadlineExceeded: If the statistics are not available before the request deadline, see degraded_card.
+    """
+    try:
+        stats = user_profile_cache.get(username.lower())
+        chart_kwargs = extract_chart_kwargs(query_params, 'profile')
+
+        cache_key = svg_cache_key(username, 'profile', chart_kwargs, stats.fingerprint())
+        cached_entry = svg_cache.get(cache_key)
+
+        if cached_entry is not None:
+            return cached_entry
+
+        return svg_cache.set(cache_key, generate_profile_card(username, stats.to_profile_stats(), chart_kwargs))
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with profile_service - {e}")
@@ -0,0 +1,284 @@
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from cache.shared_cache import SharedStore
+from metrics.metrics import cache_requests, registry
+from services.single_flight import SingleFlight
+from utils.deadline import DeadlineExceeded
+
+refresh_constants = {
+    'soft_ttl': int(os.getenv('REPOS_SOFT_TTL', 300)),
+    'hard_ttl': int(os.getenv('REPOS_HARD_TTL', 86400)),
+    'max_workers': int(os.getenv('REFRESH_WORKERS', 4)),
+    'max_pending': int(os.getenv('REFRESH_MAX_PENDING', 256)),
+    'max_entries': int(os.getenv('REPOS_CACHE_SIZE', 10000)),
+}
+
+swr_cache_state = registry.gauge(
+    'github_stats_swr_cache_state', 'Entries, refreshes, stale serves and coalesced loads of each stats cache.'
+)
+
+
+class Snapshot(NamedTuple):
+    value: object
+    fetched_at: float
+
+
+class StaleWhileRevalidateCache:
+    """
+    Cache that serves the last good value immediately and refreshes it in the background.
+
+    - Younger than the soft TTL: the value is served as is.
+    - Between the soft and the hard TTL: the value is served and a refresh is queued on a bounded thread pool.
+    - Missing or older than the hard TTL: the caller blocks on the load.
+
+    When a load fails, the last good value is served instead of the error, whatever its age. When a load is cut short
+    by the request deadline, a background refresh is queued so the complete value is ready for the next request.
+
+    Blocking loads and background refreshes of a key are coalesced into one upstream fetch. A blocking load that
+    joins a refresh waits for it at most until its request deadline.
+
+    With a shared store, values are written through to the shared cache tier and keys missing locally are read from
+    it, so other workers and restarted processes start from the stored value and its age instead of a cold load.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            loader,
+            background_loader=None,
+            soft_ttl: int = refresh_constants['soft_ttl'],
+            hard_ttl: int = refresh_constants['hard_ttl'],
+            max_workers: int = refresh_constants['max_workers'],
+            max_pending: int = refresh_constants['max_pending'],
+            max_entries: int = refresh_constants['max_entries'],
+            shared: SharedStore = None
+            ):
+        """
+        Args:
+            name (str): The name of the cache, used as the `cache` metrics label.
+            loader (callable): Loads the value of a key from upstream.
+            background_loader (callable): Loads the value of a key for a background refresh, defaults to loader.
+            soft_ttl (int): Seconds after which a value is refreshed in the background.
+            hard_ttl (int): Seconds after which a value is reloaded before it is served.
+            max_workers (int): The number of background refresh threads.
+            max_pending (int): The maximum number of queued or running refreshes.
+            max_entries (int): The maximum number of keys kept, least recently used keys are evicted first.
+            shared (SharedStore): Optional shared cache tier namespace the values are written through to.
+        """
+        self.name = name
+        self.loader = loader
+        self.background_loader = background_loader or loader
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.max_pending = max_pending
+        self.max_entries = max_entries
+        self.shared = shared
+        self.snapshots = OrderedDict()
+        self.refreshing = set()
+        self.lock = threading.Lock()
+        self.flight = SingleFlight()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='refresh-worker')
+        self.stale_served = 0
+        self.refresh_errors = 0
+        registry.register_collector(self.collect_metrics)
+
+    def get(self, key: str):
+        """
+        Returns the value of a key, loading, serving stale or refreshing it according to its age.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            The cached or freshly loaded value.
+
+        Raises:
+            Exception: The load error, when there is no previous value to fall back to.
+            DeadlineExceeded: When the load is cut short by the request deadline and there is no previous value.
+        """
+        with self.lock:
+            snapshot = self.snapshots.get(key)
+            if snapshot is not None:
+                self.snapshots.move_to_end(key)
+
+        if snapshot is None:
+            snapshot = self.read_shared(key)
+
+        if snapshot is not None:
+            age = time.time() - snapshot.fetched_at
+
+            if age < self.soft_ttl:
+                cache_requests.inc(cache=self.name, result='hit')
+                return snapshot.value
+
+            if age < self.hard_ttl:
+                cache_requests.inc(cache=self.name, result='stale')
+                self.schedule_refresh(key)
+                return snapshot.value
+
+        cache_requests.inc(cache=self.name, result='miss')
+
+        try:
+            return self.load(key)
+        except Exception as e:
+            if isinstance(e, DeadlineExceeded):
+                self.schedule_refresh(key)
+            if snapshot is None:
+                raise
+            with self.lock:
+                self.stale_served += 1
+            return snapshot.value
+
+    def peek(self, key: str) -> Snapshot:
+        """
+        Returns the snapshot of a key without loading or refreshing it, or None.
+        """
+        with self.lock:
+            snapshot = self.snapshots.get(key)
+
+        return snapshot if snapshot is not None else self.read_shared(key)
+
+    async def async_peek(self, key: str) -> Snapshot:
+        """
+        Counterpart of peek for the event loop. Keys held locally are answered inline, a read of the shared store,
+        a SQLite or network round trip, runs in a worker thread.
+        """
+        with self.lock:
+            snapshot = self.snapshots.get(key)
+
+        if snapshot is not None or self.shared is None:
+            return snapshot
+
+        return await asyncio.to_thread(self.read_shared, key)
+
+    def read_shared(self, key: str) -> Snapshot:
+        """
+        Reads a key missing locally from the shared store and keeps it locally, or returns None.
+        """
+        if self.shared is None:
+            return None
+
+        stored = self.shared.get(key)
+        if stored is None:
+            return None
+
+        with self.lock:
+            snapshot = self.snapshots.get(key)
+            if snapshot is None:
+                snapshot = Snapshot(*stored)
+                self._store_local(key, snapshot)
+
+        return snapshot
+
+    def load(self, key: str):
+        """
+        Loads a key from upstream and stores it. Concurrent loads of the same key are coalesced.
+        """
+        return self.flight.do(key, lambda: self._fetch(key, self.loader))
+
+    def _fetch(self, key: str, loader):
+        value = loader(key)
+        self.store(key, value)
+        return value
+
+    def store(self, key: str, value, fetched_at: float = None) -> None:
+        """
+        Stores the value of a key, written through to the shared store.
+
+        Args:
+            key (str): The key.
+            value: The value.
+            fetched_at (float): When the value was fetched from upstream, defaults to now. Values patched in place
+                                without a fetch pass the time of the value they were patched from, so they do not
+                                postpone its refresh.
+        """
+        snapshot = Snapshot(value, time.time() if fetched_at is None else fetched_at)
+
+        with self.lock:
+            self._store_local(key, snapshot)
+
+        if self.shared is not None:
+            self.shared.set(key, value, snapshot.fetched_at)
+
+    async def async_store(self, key: str, value) -> None:
+        """
+        Counterpart of store for the event loop, the write-through to the shared store runs in a worker thread.
+        """
+        if self.shared is None:
+            self.store(key, value)
+        else:
+            await asyncio.to_thread(self.store, key, value)
+
+    def _store_local(self, key: str, snapshot: Snapshot) -> None:
+        self.snapshots[key] = snapshot
+        self.snapshots.move_to_end(key)
+        while len(self.snapshots) > self.max_entries:
+            self.snapshots.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self.lock:
+            self.snapshots.pop(key, None)
+
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.snapshots.clear()
+
+    def keys(self) -> list:
+        """
+        Returns the keys held locally, the shared store is not listed.
+        """
+        with self.lock:
+            return list(self.snapshots)
+
+    def schedule_refresh(self, key: str) -> bool:
+        """
+        Queues a background refresh of a key unless one is already pending or the queue is full.
+
+        Returns:
+            bool: Whether a refresh was queued.
+        """
+        with self.lock:
+            if key in self.refreshing or len(self.refreshing) >= self.max_pending:
+                return False
+            self.refreshing.add(key)
+
+        self.executor.submit(self._refresh, key)
+        return True
+
+    def _refresh(self, key: str) -> None:
+        try:
+            # Refreshes share the flight of blocking loads, so a miss and a refresh of the same key fetch it once.
+            self.flight.do(key, lambda: self._fetch(key, self.background_loader))
+        except Exception:
+            with self.lock:
+                self.refresh_errors += 1
+        finally:
+            with self.lock:
+                self.refreshing.discard(key)
+
+    def metrics(self) -> dict:
+        """
+        Returns:
+            dict: Entry, refresh and stale-serving counters, plus the coalescing counters of the loads.
+        """
+        with self.lock:
+            metrics = {
+                'entries': len(self.snapshots),
+                'refreshing': len(self.refreshing),
+                'stale_served': self.stale_served,
+                'refresh_errors': self.refresh_errors,
+            }
+        metrics.update(self.flight.metrics())
+        return metrics
+
+    def collect_metrics(self) -> None:
+        for name, value in self.metrics().items():
+            swr_cache_state.set(value, cache=self.name, state=name)
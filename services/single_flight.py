@@ -0,0 +1,81 @@
+import threading
+from utils.deadline import DeadlineExceeded, current_deadline
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one in-flight call.
+
+    The first caller for a key runs the function, callers arriving while it is running wait for it and
+    receive the same result or the same error. A waiting caller gives up at its own request deadline.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn):
+        """
+        Runs fn once for all concurrent callers of the same key.
+
+        Args:
+            key (str): The key identifying the work, e.g. a username.
+            fn (callable): The function to run when no call for the key is in flight.
+
+        Returns:
+            The result of fn.
+
+        Raises:
+            Exception: The error raised by fn, re-raised in every waiting caller.
+            DeadlineExceeded: If the request deadline of a waiting caller passes first.
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = _Call()
+                self.calls[key] = call
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            deadline = current_deadline()
+            if not call.done.wait(deadline.remaining() if deadline is not None else None):
+                raise DeadlineExceeded()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+
+    def metrics(self) -> dict:
+        """
+        Returns:
+            dict: The number of executed calls, coalesced callers and calls currently in flight.
+        """
+        with self.lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self.calls),
+            }
@@ -0,0 +1,179 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from cache.shared_cache import create_shared_store
+from cache.svg_cache import SvgEntry
+from github_api.github_api import get_org_members, get_org_repos
+from github_api.token_pool import PRIORITY_HIGH, PRIORITY_LOW
+from metrics.metrics import timed
+from services.lang_service import lang_service_constants, load_language_aggregate, render_lang_card, user_langs_cache
+from services.refresh_worker import StaleWhileRevalidateCache, refresh_constants
+from stats_calculator.langs_aggregate import LanguageAggregate
+from utils.deadline import DeadlineExceeded, submit, wait_result
+
+team_constants = {
+    'max_members': int(os.getenv('TEAM_MAX_MEMBERS', 200)),
+    'fetch_workers': int(os.getenv('TEAM_FETCH_WORKERS', 8)),
+}
+
+team_fetch_executor = ThreadPoolExecutor(max_workers=team_constants['fetch_workers'], thread_name_prefix='team-fetch')
+
+
+def org_team_key(org: str) -> str:
+    """
+    Returns the cache key of an organization card.
+    """
+    return f"org:{org.lower()}"
+
+
+def users_team_key(usernames: str) -> str:
+    """
+    Returns the cache key of a card for a comma-separated list of users, independent of order, case and duplicates.
+
+    Raises:
+        ValueError: If the list is empty or longer than the member limit.
+    """
+    members = sorted({username.strip().lower() for username in usernames.split(',') if username.strip()})
+
+    if len(members) == 0:
+        raise ValueError("No usernames provided.")
+
+    if len(members) > team_constants['max_members']:
+        raise ValueError(f"Too many usernames provided, the limit is {team_constants['max_members']}.")
+
+    return f"users:{','.join(members)}"
+
+
+def get_member_aggregate(member: str, priority: str = PRIORITY_HIGH) -> LanguageAggregate:
+    """
+    Returns the language aggregate of a team member, reusing the per-user stats cache.
+
+    User-facing loads go through the cache like a single-user card. Background loads reuse any snapshot younger than
+    the soft TTL and otherwise load at low priority, storing the result for the single-user cards too.
+
+    Args:
+        member (str): The lowercased username.
+        priority (str): The scheduling priority of the GitHub requests.
+
+    Returns:
+        LanguageAggregate: The language aggregate of the member.
+    """
+    if priority == PRIORITY_HIGH:
+        return user_langs_cache.get(member)
+
+    snapshot = user_langs_cache.peek(member)
+    if snapshot is not None and time.time() - snapshot.fetched_at < user_langs_cache.soft_ttl:
+        return snapshot.value
+
+    aggregate = load_language_aggregate(member, priority)
+    user_langs_cache.store(member, aggregate)
+    return aggregate
+
+
+@timed('load_team_aggregate')
+def load_team_aggregate(key: str, priority: str = PRIORITY_HIGH) -> LanguageAggregate:
+    """
+    Loads the combined language aggregate of an organization or a list of users.
+
+    Every member is loaded concurrently on a bounded thread pool and merged into the team aggregate as soon as it
+    arrives, so the repository lists of all members are never held at once. Forks are left out and a repository
+    shared by several members, or owned by the organization, is counted once. Members whose repositories cannot be
+    fetched, e.g. members without public repositories, are skipped. When the request deadline passes, the loads not
+    started yet are cancelled and the aggregate of the members merged so far is attached to the DeadlineExceeded error.
+
+    Args:
+        key (str): The team key, see org_team_key and users_team_key.
+        priority (str): The scheduling priority of the GitHub requests.
+
+    Returns:
+        LanguageAggregate: The aggregate of the team.
+
+    Raises:
+        ValueError: If no repositories of the team could be fetched.
+        DeadlineExceeded: If the request deadline passes before every member is loaded.
+    """
+    kind, name = key.split(':', 1)
+    team = LanguageAggregate()
+    futures = []
+    merged = 0
+    errors = []
+
+    try:
+        if kind == 'org':
+            futures.append(submit(team_fetch_executor, get_org_repos, name, priority))
+            members = [member.lower() for member in get_org_members(name, priority)[:team_constants['max_members']]]
+        else:
+            members = name.split(',')
+
+        futures.extend(submit(team_fetch_executor, get_member_aggregate, member, priority) for member in members)
+
+        # Results are merged in submission order, so ties between languages rank the same way on every load.
+        for future in futures:
+            try:
+                result = wait_result(future)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                errors.append(e)
+                continue
+
+            if isinstance(result, LanguageAggregate):
+                team.merge(result)
+            else:
+                team.apply(repo for repo in result if not repo.fork)
+            merged += 1
+    except DeadlineExceeded:
+        raise DeadlineExceeded(partial=team if merged > 0 else None)
+    finally:
+        for future in futures:
+            future.cancel()
+
+    if merged == 0:
+        raise ValueError(f"No repositories could be fetched for {name} - {errors[0] if errors else 'no members'}")
+
+    team.full_synced_at = time.time()
+    return team
+
+
+team_langs_cache = StaleWhileRevalidateCache(
+    'team_langs',
+    load_team_aggregate, background_loader=partial(load_team_aggregate, priority=PRIORITY_LOW),
+    shared=create_shared_store(
+        'team_langs', LanguageAggregate.serialize, LanguageAggregate.deserialize, refresh_constants['hard_ttl']
+    )
+)
+
+
+@timed('team_lang_service')
+def team_lang_service(team_key: str, title: str, chart_type: str, query_params: dict) -> SvgEntry:
+    """
+    Generates the language chart of an organization or a list of users.
+
+    The team statistics are served stale-while-revalidate like the single-user ones, and rendered through the same
+    render_lang_card and rendered-SVG cache.
+
+    Args:
+        team_key (str): The team key, see org_team_key and users_team_key.
+        title (str): The name shown in the chart title.
+        chart_type (str): The type of chart to generate (e.g., 'bar', 'pie', 'donut').
+        query_params (dict): Additional query parameters for customizing the chart.
+
+    Returns:
+        SvgEntry: The generated chart and its ETag.
+
+    Raises:
+        ValueError: If an error occurs during the execution of the team_lang_service function.
+        DeadlineExceeded: If the statistics are not available before the request deadline, see degraded_card.
+    """
+    try:
+        mode = query_params.get('mode', default=lang_service_constants['default_mode'], type=str)
+
+        if mode != 'repos':
+            raise ValueError("Team cards only support the 'repos' stats mode.")
+
+        return render_lang_card(title, chart_type, query_params, team_langs_cache.get(team_key))
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with team_lang_service - {e}")
@@ -0,0 +1,221 @@
+import hashlib
+import hmac
+import json
+import os
+from cache.svg_cache import svg_cache
+from github_api.repo_record import RepoRecord, project_repo
+from metrics.metrics import registry, timed
+from services.bytes_lang_service import user_bytes_cache
+from services.lang_service import user_langs_cache
+from services.profile_service import user_profile_cache
+from services.refresh_worker import StaleWhileRevalidateCache
+from services.team_lang_service import org_team_key, team_langs_cache
+
+webhook_constants = {
+    'secret': os.getenv('GITHUB_WEBHOOK_SECRET', ''),
+    'max_body_bytes': int(os.getenv('WEBHOOK_MAX_BODY_BYTES', 25 * 1024 * 1024)),
+    'signature_prefix': 'sha256=',
+    # Repository actions after which the repository no longer belongs on its owner's public cards.
+    'removed_actions': ('deleted', 'privatized'),
+}
+
+webhook_deliveries = registry.counter('github_stats_webhook_deliveries_total', 'GitHub webhook deliveries by event and result.')
+
+
+class WebhookError(ValueError):
+    """
+    A webhook delivery that is rejected, with the HTTP status to answer it with.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def verify_signature(body: bytes, signature: str, secret: str = webhook_constants['secret']) -> bool:
+    """
+    Checks the X-Hub-Signature-256 header of a delivery: the HMAC-SHA256 of the raw body keyed with the webhook secret.
+
+    Args:
+        body (bytes): The raw request body.
+        signature (str): The header value, 'sha256=<hex digest>'.
+        secret (str): The webhook secret.
+
+    Returns:
+        bool: Whether the signature matches, compared in constant time.
+    """
+    if not signature or not signature.startswith(webhook_constants['signature_prefix']):
+        return False
+
+    expected = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature[len(webhook_constants['signature_prefix']):], expected)
+
+
+@timed('webhook_service')
+def webhook_service(event: str, body: bytes, signature: str) -> dict:
+    """
+    Applies a GitHub `push` or `repository` webhook delivery to the cached stats of the affected owner.
+
+    - Language stats: the repository is updated in, or removed from, the cached aggregate of its owner, and of the
+      cached team aggregates that already hold it or belong to its owner, through the same incremental path as the
+      polling refreshes. A transferred repository moves from its previous owner to the new one.
+    - Byte-weighted and profile stats depend on more than the repository record, they are refreshed in the background
+      and served as they are meanwhile.
+    - Rendered cards of the owner are dropped from the local SVG cache.
+
+    Owners without cached stats are left alone, their next card request loads them. Only the caches of this process
+    and the shared tier are updated; other workers read the change once their local copy is refreshed.
+
+    Args:
+        event (str): The X-GitHub-Event header.
+        body (bytes): The raw request body.
+        signature (str): The X-Hub-Signature-256 header.
+
+    Returns:
+        dict: A summary of the delivery, e.g. {'status': 'updated', 'owner': ..., 'caches': [...]}.
+
+    Raises:
+        WebhookError: If webhooks are disabled, the body is too large, the signature does not match or the payload
+                      is malformed.
+    """
+    if not webhook_constants['secret']:
+        raise WebhookError(404, "Webhooks are not configured.")
+
+    if len(body) > webhook_constants['max_body_bytes']:
+        raise WebhookError(413, "Payload too large.")
+
+    if not verify_signature(body, signature):
+        webhook_deliveries.inc(event=event or 'unknown', result='rejected')
+        raise WebhookError(401, "Invalid signature.")
+
+    if event == 'ping':
+        webhook_deliveries.inc(event=event, result='ignored')
+        return {'status': 'pong'}
+
+    if event not in ('push', 'repository'):
+        webhook_deliveries.inc(event=event or 'unknown', result='ignored')
+        return {'status': 'ignored', 'event': event}
+
+    try:
+        payload = json.loads(body)
+        repository = payload['repository']
+        repo = project_repo(repository)
+        owner = repository['owner'].get('login') or repository['owner']['name']
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        webhook_deliveries.inc(event=event, result='invalid')
+        raise WebhookError(400, f"Malformed {event} payload - {e}")
+
+    action = payload.get('action') if event == 'repository' else None
+    caches = []
+
+    if action == 'transferred':
+        previous_owner = get_previous_owner(payload)
+        if previous_owner is not None:
+            caches.extend(remove_repo(previous_owner, repo))
+
+    # A repository made private may still be pushed to or edited; its deliveries must not bring it back.
+    if action in webhook_constants['removed_actions'] or repo.private:
+        caches.extend(remove_repo(owner, repo))
+    else:
+        caches.extend(update_repo(owner, repo))
+
+    webhook_deliveries.inc(event=event, result='updated' if caches else 'uncached')
+    return {'status': 'updated' if caches else 'uncached', 'owner': owner.lower(), 'caches': caches}
+
+
+def get_previous_owner(payload: dict) -> str:
+    """
+    Returns the previous owner of a transferred repository, a user or an organization, or None.
+    """
+    previous = payload.get('changes', {}).get('owner', {}).get('from', {})
+    account = previous.get('user') or previous.get('organization') or {}
+    return account.get('login')
+
+
+def update_repo(owner: str, repo: RepoRecord) -> list:
+    """
+    Adds or updates a repository in the cached stats of its owner and of the teams holding it. Private repositories
+    are removed instead, the cards only count public ones.
+
+    Returns:
+        list: The names of the caches that were updated.
+    """
+    if repo.private:
+        return remove_repo(owner, repo)
+
+    def change(aggregate, skip_forks: bool) -> None:
+        if not (skip_forks and repo.fork):
+            aggregate.apply([repo], advance_sync=False)
+
+    return apply_change(owner, repo, change)
+
+
+def remove_repo(owner: str, repo: RepoRecord) -> list:
+    """
+    Removes a repository from the cached stats of its owner and of the teams holding it.
+
+    Returns:
+        list: The names of the caches that were updated.
+    """
+    return apply_change(owner, repo, lambda aggregate, skip_forks: aggregate.remove([repo.id]))
+
+
+def apply_change(owner: str, repo: RepoRecord, change) -> list:
+    """
+    Applies a change to every cached aggregate affected by a repository of an owner.
+
+    Args:
+        owner (str): The login of the repository owner.
+        repo (RepoRecord): The repository.
+        change (callable): Updates an aggregate in place, called with the aggregate and whether forks are left out.
+
+    Returns:
+        list: The names of the caches that were updated.
+    """
+    key = owner.lower()
+    caches = []
+
+    if update_cached_aggregate(user_langs_cache, key, lambda aggregate: change(aggregate, False)):
+        caches.append(user_langs_cache.name)
+
+    # Team aggregates leave forks out. They are updated when they belong to the owner, list it as a member, or
+    # already hold the repository, e.g. an organization card holding the repositories of its members.
+    for team_key in sorted(set(team_langs_cache.keys()) | {org_team_key(key)}):
+        kind, name = team_key.split(':', 1)
+        if team_key == org_team_key(key) or (kind == 'users' and key in name.split(',')) or holds_repo(team_key, repo):
+            if update_cached_aggregate(team_langs_cache, team_key, lambda aggregate: change(aggregate, True)):
+                caches.append(f"{team_langs_cache.name}:{team_key}")
+
+    for cache in (user_bytes_cache, user_profile_cache):
+        if cache.peek(key) is not None and cache.schedule_refresh(key):
+            caches.append(cache.name)
+
+    if svg_cache.invalidate_title(owner):
+        caches.append('svg')
+
+    return caches
+
+
+def holds_repo(team_key: str, repo: RepoRecord) -> bool:
+    snapshot = team_langs_cache.peek(team_key)
+    return snapshot is not None and snapshot.value.contains(repo.id)
+
+
+def update_cached_aggregate(cache: StaleWhileRevalidateCache, key: str, change) -> bool:
+    """
+    Updates the cached aggregate of a key in place and stores it again, writing it through to the shared tier.
+
+    The aggregate keeps the age of its last fetch: a delivery only covers one repository, so the polling refresh that
+    catches everything else, e.g. missed deliveries, still runs when it is due.
+
+    Returns:
+        bool: Whether an aggregate was cached for the key.
+    """
+    snapshot = cache.peek(key)
+
+    if snapshot is None:
+        return False
+
+    change(snapshot.value)
+    cache.store(key, snapshot.value, fetched_at=snapshot.fetched_at)
+    return True
@@ -0,0 +1,71 @@
+import hashlib
+import json
+from metrics.metrics import timed
+
+
+@timed('calculate_language_bytes_stats')
+def calculate_language_bytes_stats(repos_languages: list) -> dict:
+    """
+    Calculate the statistics of programming languages weighted by the bytes of code written in each of them.
+
+    Args:
+        repos_languages (list): The languages of each repository, as returned by the GitHub languages endpoint
+                                (a dictionary mapping each language to its number of bytes).
+
+    Returns:
+        dict: A dictionary with the same shape as calculate_language_stats, sorted by percentage:
+              - 'count': The number of bytes written in the programming language.
+              - 'percentage': The percentage of bytes written in the programming language, rounded to 2 decimal places.
+    """
+    try:
+        langs_bytes = {}
+
+        for repo_languages in repos_languages:
+            for language, size in repo_languages.items():
+                langs_bytes[language] = langs_bytes.get(language, 0) + size
+
+        total_bytes = sum(langs_bytes.values())
+
+        langs_stats = {
+            language: {
+                'count': size,
+                'percentage': round((size / total_bytes) * 100, 2) if total_bytes > 0 else 0,
+            }
+            for language, size in langs_bytes.items()
+        }
+
+        # Tied languages are ordered by name, so the order does not depend on the order of the repositories.
+        return dict(sorted(langs_stats.items(), key=lambda item: (-item[1]['count'], item[0])))
+    except Exception as e:
+        raise ValueError(f"Error: Something went wrong with calculate_language_bytes_stats - {e}")
+
+
+class LanguageBytesStats:
+    """
+    Byte-weighted language statistics of a user, readable the same way as a LanguageAggregate.
+    """
+
+    def __init__(self, lang_stats: dict):
+        """
+        Args:
+            lang_stats (dict): The statistics returned by calculate_language_bytes_stats.
+        """
+        self.lang_stats = lang_stats
+
+        digest = hashlib.sha1(b'bytes;')
+        for language, stats in lang_stats.items():
+            digest.update(f"{language}:{stats['count']};".encode('utf-8'))
+        self._fingerprint = digest.hexdigest()
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'LanguageBytesStats':
+        return cls(json.loads(data))
+
+    def serialize(self) -> bytes:
+        return json.dumps(self.lang_stats, separators=(',', ':')).encode('utf-8')
+
+    def to_lang_stats(self) -> dict:
+        return self.lang_stats
+
+    def fingerprint(self) -> str:
+        return self._fingerprint
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import threading
+import time
+from bisect import bisect_left, insort
+from metrics.metrics import timed
+
+
+class LanguageAggregate:
+    """
+    Persistent per-user language statistics that can be updated from a delta of changed repositories.
+
+    It keeps the language of every repository seen, the count per language, the number of repositories without a
+    language and a ranking of the languages that stays ordered by count, so reading the stats or the top N languages
+    never re-sorts and updating one repository costs O(log languages) instead of a pass over all repositories.
+
+    Tied languages are ranked by name, like calculate_language_stats does, so the ranking only depends on the counts
+    and not on the order the repositories were applied in.
+    """
+
+    def __init__(self):
+        self.repo_languages = {}
+        self.fork_ids = set()
+        self.counts = {}
+        self.unknown_count = 0
+        self.ranking = []
+        self.last_pushed_at = ''
+        self.full_synced_at = 0.0
+        self.lock = threading.Lock()
+        self._fingerprint = None
+
+    @classmethod
+    def from_repos(cls, repos: list) -> 'LanguageAggregate':
+        """
+        Builds an aggregate from the full list of repositories of a user.
+
+        Args:
+            repos (list): All the repositories of the user, as RepoRecords.
+
+        Returns:
+            LanguageAggregate: The aggregate, marked as fully synced now.
+        """
+        aggregate = cls()
+        aggregate.apply(repos)
+        aggregate.full_synced_at = time.time()
+        return aggregate
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'LanguageAggregate':
+        """
+        Rebuilds an aggregate from the bytes produced by serialize.
+        """
+        state = json.loads(data)
+        aggregate = cls()
+
+        for repo_id, language, fork in state['repos']:
+            aggregate._set_language(repo_id, language)
+            if fork:
+                aggregate.fork_ids.add(repo_id)
+
+        aggregate.last_pushed_at = state['last_pushed_at']
+        aggregate.full_synced_at = state['full_synced_at']
+        return aggregate
+
+    def serialize(self) -> bytes:
+        """
+        Serializes the aggregate compactly, one [id, language, fork] triple per repository.
+        """
+        with self.lock:
+            return json.dumps({
+                'repos': [
+                    [repo_id, language, 1 if repo_id in self.fork_ids else 0]
+                    for repo_id, language in self.repo_languages.items()
+                ],
+                'last_pushed_at': self.last_pushed_at,
+                'full_synced_at': self.full_synced_at,
+            }, separators=(',', ':')).encode('utf-8')
+
+    def apply(self, repos: list, advance_sync: bool = True) -> None:
+        """
+        Adds new repositories and updates the language of known ones.
+
+        Args:
+            repos (list): The new or changed repositories, as RepoRecords.
+            advance_sync (bool): Whether the repositories move last_pushed_at forward. Out-of-band updates, e.g. from
+                                 webhooks, pass False: they do not prove that the repositories pushed before them were
+                                 synced, so the next incremental sync must still look for them.
+        """
+        with self.lock:
+            for repo in repos:
+                self._set_language(repo.id, repo.language or 'Unknown')
+
+                if repo.fork:
+                    self.fork_ids.add(repo.id)
+                else:
+                    self.fork_ids.discard(repo.id)
+
+                pushed_at = repo.pushed_at or ''
+                if advance_sync and pushed_at > self.last_pushed_at:
+                    self.last_pushed_at = pushed_at
+
+            self._fingerprint = None
+
+    def remove(self, repo_ids: list) -> None:
+        """
+        Removes deleted repositories.
+
+        Args:
+            repo_ids (list): The ids of the deleted repositories.
+        """
+        with self.lock:
+            for repo_id in repo_ids:
+                self._set_language(repo_id, None)
+                self.fork_ids.discard(repo_id)
+
+            self._fingerprint = None
+
+    def contains(self, repo_id: int) -> bool:
+        with self.lock:
+            return repo_id in self.repo_languages
+
+    def merge(self, other: 'LanguageAggregate', skip_forks: bool = True) -> None:
+        """
+        Adds the repositories of another aggregate, e.g. a team member's, counting every repository once.
+
+        Repositories already present are kept as they are, so a repository shared by several members is not counted
+        twice.
+
+        Args:
+            other (LanguageAggregate): The aggregate to merge in, left unchanged.
+            skip_forks (bool): Whether forked repositories are left out.
+        """
+        with other.lock:
+            repo_languages = list(other.repo_languages.items())
+            fork_ids = set(other.fork_ids) if skip_forks else set()
+            last_pushed_at = other.last_pushed_at
+
+        with self.lock:
+            for repo_id, language in repo_languages:
+                if repo_id not in fork_ids and repo_id not in self.repo_languages:
+                    self._set_language(repo_id, language)
+
+            if last_pushed_at > self.last_pushed_at:
+                self.last_pushed_at = last_pushed_at
+
+            self._fingerprint = None
+
+    def _set_language(self, repo_id: int, language: str) -> None:
+        previous = self.repo_languages.pop(repo_id, None)
+
+        if previous == language:
+            if language is not None:
+                self.repo_languages[repo_id] = language
+            return
+
+        if previous is not None:
+            self._add_count(previous, -1)
+
+        if language is not None:
+            self.repo_languages[repo_id] = language
+            self._add_count(language, 1)
+
+    def _add_count(self, language: str, delta: int) -> None:
+        if language == 'Unknown':
+            self.unknown_count += delta
+            return
+
+        count = self.counts.get(language, 0)
+
+        if count > 0:
+            del self.ranking[bisect_left(self.ranking, (-count, language))]
+
+        count += delta
+
+        if count > 0:
+            self.counts[language] = count
+            insort(self.ranking, (-count, language))
+        else:
+            self.counts.pop(language, None)
+
+    @timed('calculate_language_stats')
+    def to_lang_stats(self) -> dict:
+        """
+        Returns the statistics in the shape produced by calculate_language_stats, already ordered by percentage.
+
+        Returns:
+            dict: The 'count' and 'percentage' of each language.
+        """
+        with self.lock:
+            total_valid_repos = len(self.repo_languages) - self.unknown_count
+
+            return {
+                language: {
+                    'count': -negative_count,
+                    'percentage': round((-negative_count / total_valid_repos) * 100, 2) if total_valid_repos > 0 else 0,
+                }
+                for negative_count, language in self.ranking
+            }
+
+    def fingerprint(self) -> str:
+        """
+        Returns a digest of the ranked counts, which changes whenever the rendered statistics would change.
+        """
+        with self.lock:
+            if self._fingerprint is None:
+                digest = hashlib.sha1(f"unknown:{self.unknown_count};".encode('utf-8'))
+                for negative_count, language in self.ranking:
+                    digest.update(f"{language}:{-negative_count};".encode('utf-8'))
+                self._fingerprint = digest.hexdigest()
+
+            return self._fingerprint
@@ -1,9 +1,14 @@
+from itertools import islice
+from metrics.metrics import timed
+
+
+@timed('calculate_language_stats')
 def calculate_language_stats(repos: list) -> dict:
     """
     Calculate the statistics of programming languages used in a list of repositories.
 
     Args:
-        repos (list): A list of repositories, where each repository is represented as a dictionary.
+        repos (list): A list of repositories, where each repository is represented as a RepoRecord.
 
     Returns:
         dict: A dictionary containing the statistics of programming languages used in the repositories.
@@ -16,7 +21,7 @@ def calculate_language_stats(repos: list) -> dict:
         unknown_count = 0
 
         for repo in repos:
-            language = repo['language'] or 'Unknown'
+            language = repo.language or 'Unknown'
 
             if language == 'Unknown':
                 unknown_count += 1
@@ -32,7 +37,8 @@ def calculate_language_stats(repos: list) -> dict:
         for lang in langs_stats:
             langs_stats[lang]['percentage'] = round((langs_stats[lang]['count'] / total_valid_repos) * 100, 2) if total_valid_repos > 0 else 0
 
-        return dict(sorted(langs_stats.items(), key=lambda item: item[1]['percentage'], reverse=True))
+        # Tied languages are ordered by name, so the order does not depend on the order of the repositories.
+        return dict(sorted(langs_stats.items(), key=lambda item: (-item[1]['count'], item[0])))
     except Exception as e:
         raise ValueError(f"Error: Something went wrong with calculate_language_stats - {e}")
 
@@ -49,9 +55,10 @@ def get_top_n_langs(lang_stats: dict, n: int) -> dict:
         dict: A dictionary containing the top N programming languages and their statistics.
     """
     try:
-        top_langs = list(lang_stats.items())[:n]
+        items = iter(lang_stats.items())
+        top_langs = list(islice(items, n))
 
-        other_percentage = round(sum(item[1]['percentage'] for item in list(lang_stats.items())[n:]), 2)
+        other_percentage = round(sum(stats['percentage'] for _, stats in items), 2)
 
         if other_percentage > 0:
             top_langs.append(("Others", {"percentage": other_percentage}))
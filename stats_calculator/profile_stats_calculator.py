@@ -1,30 +1,121 @@
+import hashlib
+import json
+from metrics.metrics import timed
+
+profile_stats_constants = {
+    'fields': (
+        'total_stars', 'total_forks', 'total_followers', 'total_following',
+        'total_commits', 'total_pull_requests', 'total_issues', 'total_repos',
+    ),
+}
+
+
+@timed('calculate_profile_stats')
 def calculate_profile_stats(events: list, repos: list) -> dict:
+    """
+    Calculate the activity statistics of a user in a single pass over their recent events.
+
+    Args:
+        events (list): The recent public events of the user, as EventRecords.
+        repos (list): The repositories of the user, as RepoRecords.
+
+    Returns:
+        dict: A dictionary with the following keys:
+              - 'total_repos': The number of repositories of the user.
+              - 'total_pull_requests': The number of pull requests opened in the events.
+              - 'total_commits': The number of commits pushed in the events.
+              - 'total_issues': The number of issues opened in the events.
+    """
     try:
-        profile_stats = {
-            "total_repos": len(repos),
-            "total_pull_requests": 0,
-            "total_commits": 0,
-            "total_issues": 0
-        }
+        total_pull_requests = 0
+        total_commits = 0
+        total_issues = 0
 
-        # TODO: Calculate the total pull requests, commits, and issues
+        for event in events:
+            if event.type == 'PushEvent':
+                total_commits += event.commits
+            elif event.type == 'PullRequestEvent' and event.action == 'opened':
+                total_pull_requests += 1
+            elif event.type == 'IssuesEvent' and event.action == 'opened':
+                total_issues += 1
 
-        return profile_stats 
+        return {
+            'total_repos': len(repos),
+            'total_pull_requests': total_pull_requests,
+            'total_commits': total_commits,
+            'total_issues': total_issues,
+        }
     except Exception as e:
         raise ValueError(f"Error: Something went wrong with calculate_profile_stats - {e}")
-    
 
-def calculate_social_stats(events: list) -> dict:
+
+@timed('calculate_social_stats')
+def calculate_social_stats(user_info: dict, repos: list) -> dict:
+    """
+    Calculate the social statistics of a user in a single pass over their repositories.
+
+    Stars and forks are only counted on the repositories the user owns, not on their forks.
+
+    Args:
+        user_info (dict): The user object returned by the GitHub users endpoint.
+        repos (list): The repositories of the user, as RepoRecords.
+
+    Returns:
+        dict: A dictionary with the following keys:
+              - 'total_followers': The number of followers of the user.
+              - 'total_following': The number of users the user follows.
+              - 'total_stars': The number of stars of the user's repositories.
+              - 'total_forks': The number of forks of the user's repositories.
+    """
     try:
-        social_stats = {
-            "total_followers": 0,
-            "total_following": 0,
-            "total_watchers": 0,
-            "total_forks": 0,
-            "total_stars": 0,
-        }
+        total_stars = 0
+        total_forks = 0
 
-        # TODO: Calculate the total pull following, followers, stars, watchers, and forks
-    
+        for repo in repos:
+            if not repo.fork:
+                total_stars += repo.stargazers_count or 0
+                total_forks += repo.forks_count or 0
+
+        return {
+            'total_followers': user_info.get('followers', 0),
+            'total_following': user_info.get('following', 0),
+            'total_stars': total_stars,
+            'total_forks': total_forks,
+        }
     except Exception as e:
-        raise ValueError(f"Error: Something went wrong with calculate_social_stats - {e}")
\ No newline at end of file
+        raise ValueError(f"Error: Something went wrong with calculate_social_stats - {e}")
+
+
+class ProfileStats:
+    """
+    Profile statistics of a user: the activity and social statistics combined, with a fingerprint for the caches.
+    """
+
+    def __init__(self, stats: dict):
+        """
+        Args:
+            stats (dict): The statistics of every field in profile_stats_constants['fields'].
+        """
+        self.stats = {field: stats.get(field, 0) for field in profile_stats_constants['fields']}
+
+        digest = hashlib.sha1(b'profile;')
+        for field, value in self.stats.items():
+            digest.update(f"{field}:{value};".encode('utf-8'))
+        self._fingerprint = digest.hexdigest()
+
+    @classmethod
+    def from_sources(cls, user_info: dict, repos: list, events: list) -> 'ProfileStats':
+        return cls({**calculate_social_stats(user_info, repos), **calculate_profile_stats(events, repos)})
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'ProfileStats':
+        return cls(json.loads(data))
+
+    def serialize(self) -> bytes:
+        return json.dumps(self.stats, separators=(',', ':')).encode('utf-8')
+
+    def to_profile_stats(self) -> dict:
+        return self.stats
+
+    def fingerprint(self) -> str:
+        return self._fingerprint
@@ -0,0 +1,142 @@
+import contextvars
+import os
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+
+deadline_constants = {
+    'budget': float(os.getenv('REQUEST_DEADLINE', 3.0)),
+    'render_reserve': float(os.getenv('REQUEST_DEADLINE_RENDER_RESERVE', 0.3)),
+    'min_timeout': 0.05,
+}
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when the deadline of a request runs out before its data is complete.
+
+    Attributes:
+        partial: The best data fetched before the deadline, e.g. the repositories of the pages fetched so far or an
+                 aggregate built from them, or None when nothing usable was fetched.
+    """
+
+    def __init__(self, message: str = "Request deadline exceeded", partial=None):
+        super().__init__(message)
+        self.partial = partial
+
+
+class Deadline:
+    """
+    The point in time by which a request must have its data.
+    """
+
+    def __init__(self, budget: float):
+        """
+        Args:
+            budget (float): Seconds from now until the deadline.
+        """
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """
+        Raises:
+            DeadlineExceeded: If the deadline has passed.
+        """
+        if self.expired():
+            raise DeadlineExceeded()
+
+    def timeout(self, timeout: tuple) -> tuple:
+        """
+        Caps a (connect, read) timeout to the time left.
+        """
+        remaining = max(self.remaining(), deadline_constants['min_timeout'])
+        return tuple(min(part, remaining) for part in timeout)
+
+
+_current_deadline = contextvars.ContextVar('deadline', default=None)
+
+
+def current_deadline() -> Deadline:
+    """
+    Returns the deadline of the running request, or None outside of a request and in background work.
+    """
+    return _current_deadline.get()
+
+
+@contextmanager
+def request_deadline(budget: float = deadline_constants['budget']):
+    """
+    Sets the deadline of a request for the code run inside the block.
+
+    The render reserve is taken off the budget, so the card can still be rendered once the fetches give up.
+    The deadline follows the request into the worker threads started with submit, and into asyncio.to_thread.
+
+    Args:
+        budget (float): Seconds the whole request may take, 0 disables the deadline.
+
+    Yields:
+        Deadline: The deadline, or None when disabled.
+    """
+    if budget <= 0:
+        yield None
+        return
+
+    deadline = Deadline(max(budget - deadline_constants['render_reserve'], 0.0))
+    token = _current_deadline.set(deadline)
+
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """
+    Submits a call to an executor, carrying the deadline of the running request into the worker thread.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+async def await_result(awaitable):
+    """
+    Awaits a coroutine or task until the deadline of the running request.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes first, the awaitable is cancelled (shield it to keep it running).
+    """
+    import asyncio
+
+    deadline = current_deadline()
+
+    if deadline is None:
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(awaitable, deadline.remaining())
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded()
+
+
+def wait_result(future):
+    """
+    Waits for a future until the deadline of the running request.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes first, the future is cancelled if it has not started.
+    """
+    deadline = current_deadline()
+
+    if deadline is None:
+        return future.result()
+
+    try:
+        return future.result(timeout=deadline.remaining())
+    except FutureTimeoutError:
+        future.cancel()
+        raise DeadlineExceeded()
@@ -0,0 +1,52 @@
+from urllib.parse import parse_qsl
+
+
+class QueryParams(dict):
+    """
+    Query string parameters with the `get(key, default, type)` lookup of werkzeug's MultiDict.
+
+    Used by the framework-free apps so that reading a card's options does not import werkzeug.
+    """
+
+    def get(self, key: str, default=None, type=None):
+        """
+        Returns the first value of a parameter, converted with `type`.
+
+        Args:
+            key (str): The parameter name.
+            default: The value returned when the parameter is missing or cannot be converted.
+            type (callable): Optional conversion, e.g. int.
+
+        Returns:
+            The converted value, or the default.
+        """
+        if key not in self:
+            return default
+
+        value = self[key]
+
+        if type is not None:
+            try:
+                value = type(value)
+            except (ValueError, TypeError):
+                value = default
+
+        return value
+
+
+def parse_query_string(query_string: str) -> QueryParams:
+    """
+    Parses a query string, keeping the first value of repeated parameters and blank values like werkzeug does.
+
+    Args:
+        query_string (str): The raw query string, without the leading '?'.
+
+    Returns:
+        QueryParams: The parsed parameters.
+    """
+    params = QueryParams()
+
+    for key, value in parse_qsl(query_string, keep_blank_values=True):
+        params.setdefault(key, value)
+
+    return params
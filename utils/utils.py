@@ -1,7 +1,9 @@
 from chart_generator.palettes import wy_palettes
+from metrics.metrics import timed
 
 # TODO: REFAC: Refactor the following functions use a validation function for the chart_kwargs
 
+@timed('extract_chart_kwargs')
 def extract_chart_kwargs(query_params: dict, chart_type: str) -> dict:
     """
     Extracts chart keyword arguments from the given query parameters and chart type.